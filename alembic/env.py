@@ -9,7 +9,7 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 from alembic import context
 import asyncio
 from app.infrastructure.settings.config import Base, settings
-from app.infrastructure.models import ProductModel, CategoryModel, CouponModel
+from app.infrastructure.models import ProductModel, CategoryModel, CategoryProductCountModel, CouponModel
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
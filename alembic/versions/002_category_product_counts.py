@@ -0,0 +1,91 @@
+"""category product counts summary table
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 트리거는 상품을 변경한 문장과 같은 트랜잭션에서 실행되므로
+# 롤백되면 개수 변경도 함께 롤백됩니다 (애플리케이션 밖의 SQL 변경도 반영).
+# 전체 개수는 카테고리 행의 합으로 계산합니다 (전체 개수 행을 두면 모든 상품 INSERT/DELETE가
+# 같은 행을 잠가 카테고리와 무관한 쓰기끼리도 직렬화됨).
+INSERT_TRIGGER = """
+CREATE TRIGGER trg_products_count_insert
+AFTER INSERT ON products
+FOR EACH ROW
+INSERT INTO category_product_counts (category_id, product_count)
+VALUES (NEW.category_id, 1)
+ON DUPLICATE KEY UPDATE product_count = product_count + 1
+"""
+
+DELETE_TRIGGER = """
+CREATE TRIGGER trg_products_count_delete
+AFTER DELETE ON products
+FOR EACH ROW
+UPDATE category_product_counts
+SET product_count = product_count - 1
+WHERE category_id = OLD.category_id
+"""
+
+# 카테고리 이동 시 두 카테고리 행만 바뀜
+UPDATE_TRIGGER = """
+CREATE TRIGGER trg_products_count_update
+AFTER UPDATE ON products
+FOR EACH ROW
+BEGIN
+    IF NEW.category_id <> OLD.category_id THEN
+        UPDATE category_product_counts
+        SET product_count = product_count - 1
+        WHERE category_id = OLD.category_id;
+        INSERT INTO category_product_counts (category_id, product_count)
+        VALUES (NEW.category_id, 1)
+        ON DUPLICATE KEY UPDATE product_count = product_count + 1;
+    END IF;
+END
+"""
+
+
+def upgrade() -> None:
+    # 카테고리별 상품 개수 요약 테이블 (COUNT(*) 대신 1행 조회)
+    op.create_table(
+        'category_product_counts',
+        sa.Column('category_id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('product_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('category_id')
+    )
+    
+    # 트리거를 먼저 만들어 초기 적재 중에 커밋된 변경도 누락되지 않도록 함
+    # (초기 적재는 값을 덮어쓰므로 적재 전에 커밋된 변경이 두 번 반영되지 않음)
+    op.execute(INSERT_TRIGGER)
+    op.execute(DELETE_TRIGGER)
+    op.execute(UPDATE_TRIGGER)
+    
+    # 초기 적재
+    op.execute(
+        """
+        INSERT INTO category_product_counts (category_id, product_count)
+        SELECT category_id, COUNT(*) FROM products GROUP BY category_id
+        ON DUPLICATE KEY UPDATE product_count = VALUES(product_count)
+        """
+    )
+
+
+def downgrade() -> None:
+    # 트리거 삭제
+    op.execute('DROP TRIGGER IF EXISTS trg_products_count_update')
+    op.execute('DROP TRIGGER IF EXISTS trg_products_count_delete')
+    op.execute('DROP TRIGGER IF EXISTS trg_products_count_insert')
+    
+    # 테이블 삭제
+    op.drop_table('category_product_counts')
@@ -0,0 +1 @@
+"""CLI Commands - 운영용 명령 (python -m app.application.commands.<명령>)"""
@@ -0,0 +1,73 @@
+"""
+캐시 무효화 명령 - 상품 데이터를 직접 변경한 뒤 실행
+
+세대 카운터를 올려 목록/개수 캐시를 O(1)로 무효화하고, 다른 워커의 L1 캐시에도 무효화 메시지를 발행합니다.
+CDN_PURGE_URL이 설정되어 있으면 같은 범위의 CDN 응답 캐시도 Surrogate-Key로 삭제합니다.
+읽기 복제본을 사용하면 무효화 직후 지연된 복제본에서 읽은 이전 값이 다시 캐시될 수 있으므로
+최대 복제 지연(DATABASE_REPLICA_MAX_LAG)만큼 기다린 뒤 한 번 더 무효화합니다.
+
+실행:
+    uv run python -m app.application.commands.invalidate_cache                  # 모든 목록/개수
+    uv run python -m app.application.commands.invalidate_cache --category 3     # 카테고리 3 + 전체 목록/개수
+    uv run python -m app.application.commands.invalidate_cache --product 42     # 상품 42 단건 캐시
+"""
+
+import argparse
+import asyncio
+import logging
+
+from app.application.dependencies import get_cache_adapter, product_repository_scope
+from app.application.services.product_service import ProductService
+from app.infrastructure.adapters.cache.invalidation_bus import get_invalidation_bus
+from app.infrastructure.adapters.cache.redis_client import close_redis_client, get_redis_client
+from app.infrastructure.adapters.cdn.purger import get_cdn_purger
+from app.infrastructure.settings.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def invalidate(
+    category_ids: list[int] | None = None,
+    product_ids: list[int] | None = None,
+) -> None:
+    """
+    상품 캐시 무효화
+    
+    Raises:
+        RuntimeError: Redis에 연결할 수 없을 때
+    """
+    redis_client = await get_redis_client()
+    if redis_client is None:
+        raise RuntimeError("Redis에 연결할 수 없습니다")
+    
+    try:
+        # 구독 없이 발행만 사용 (다른 워커의 L1 무효화)
+        get_invalidation_bus().attach(redis_client)
+        async with product_repository_scope() as product_repository:
+            service = ProductService(
+                product_repository=product_repository,
+                coupon_repository=None,
+                cache_adapter=get_cache_adapter(redis_client),
+                cdn_purger=get_cdn_purger(),
+            )
+            await service.invalidate_cache(category_ids=category_ids, product_ids=product_ids)
+            if settings.database_replica_urls:
+                await asyncio.sleep(settings.database_replica_max_lag)
+                await service.invalidate_cache(category_ids=category_ids, product_ids=product_ids)
+    finally:
+        await close_redis_client()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="상품 캐시 무효화")
+    parser.add_argument("--category", type=int, action="append", dest="category_ids", help="카테고리 ID (반복 가능)")
+    parser.add_argument("--product", type=int, action="append", dest="product_ids", help="상품 ID (반복 가능)")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(invalidate(category_ids=args.category_ids, product_ids=args.product_ids))
+    logger.info("캐시 무효화 완료 (category_ids=%s, product_ids=%s)", args.category_ids, args.product_ids)
+
+
+if __name__ == "__main__":
+    main()
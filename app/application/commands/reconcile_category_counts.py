@@ -0,0 +1,47 @@
+"""
+카테고리별 상품 개수 재구성 명령 - category_product_counts를 products 기준으로 다시 계산
+
+트리거가 상품 INSERT/DELETE와 같은 트랜잭션에서 개수를 유지하므로 평소에는 필요 없습니다.
+트리거를 끈 채 적재했거나 요약 테이블을 직접 수정한 뒤 실행합니다.
+값이 바뀌었다면 목록/개수 캐시도 무효화해야 합니다 (make cache-invalidate).
+
+실행:
+    uv run python -m app.application.commands.reconcile_category_counts
+    uv run python -m app.application.commands.reconcile_category_counts --chunk-size 100
+"""
+
+import argparse
+import asyncio
+import logging
+
+from app.infrastructure.adapters.db.category_count_reconciler import CategoryCountReconciler
+from app.infrastructure.settings.config import async_session_maker, engine
+
+logger = logging.getLogger(__name__)
+
+
+async def reconcile(chunk_size: int = 500) -> int:
+    """
+    요약 테이블 재구성
+    
+    Returns:
+        값을 바로잡거나 삭제한 행 수
+    """
+    try:
+        return await CategoryCountReconciler(async_session_maker).reconcile(chunk_size=chunk_size)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="카테고리별 상품 개수 재구성")
+    parser.add_argument("--chunk-size", type=int, default=500, help="트랜잭션 1개에서 다시 셀 카테고리 수")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO)
+    fixed = asyncio.run(reconcile(chunk_size=args.chunk_size))
+    logger.info("카테고리별 상품 개수 재구성 완료 (보정한 행: %s)", fixed)
+
+
+if __name__ == "__main__":
+    main()
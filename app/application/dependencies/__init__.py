@@ -1,13 +1,24 @@
 """FastAPI Dependencies"""
 
-from fastapi import Depends
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from functools import partial
+from typing import AsyncIterator, Callable
+
+from fastapi import Depends, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import redis.asyncio as redis
 
+from app.application.services.product_service import CouponRepositoryScope, RepositoryScope
+from app.application.utils.cache_helper import CachePolicy
 from app.domain.ports.cache_adapter import CacheAdapter
+from app.domain.ports.coupon_repository import CouponRepository
+from app.domain.ports.product_repository import ProductRepository
 from app.infrastructure.adapters.cache.redis_client import get_redis_client
-from app.infrastructure.settings.config import async_session_maker
+from app.infrastructure.settings.config import async_session_maker, settings
+
+# 읽기 세션 팩토리 (primary 세션 팩토리 또는 ReplicaRouter.read_session)
+ReadSessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
 
 
 async def get_db_session() -> AsyncSession:
@@ -23,28 +34,171 @@ async def get_db_session() -> AsyncSession:
             await session.close()
 
 
-async def get_redis_client_dependency() -> redis.Redis:
+def is_strong_read(
+    x_read_consistency: str | None = Header(None, description="strong이면 복제 지연 없이 primary에서 조회 (쓰기 직후 읽기)"),
+) -> bool:
+    """`X-Read-Consistency: strong` 요청 여부 - 읽기 복제본과 일괄 조회 로더를 거치지 않고 primary에서 조회"""
+    return x_read_consistency == "strong"
+
+
+def read_session_factory(strong: bool = False) -> ReadSessionFactory:
+    """읽기 세션 팩토리 (strong이면 primary, 아니면 읽기 복제본 라우터)"""
+    from app.infrastructure.adapters.db.replica_router import get_replica_router
+    if strong:
+        return async_session_maker
+    return get_replica_router().read_session
+
+
+async def get_read_db_session(strong: bool = Depends(is_strong_read)) -> AsyncIterator[AsyncSession]:
+    """
+    읽기 전용 세션 의존성 - 목록/개수/상세 조회를 읽기 복제본으로 라우팅
+    
+    복제본이 없거나 모두 사용할 수 없으면(연결 실패, 복제 지연 초과) primary 세션을 사용합니다.
+    쓰기와 쓰기 직후 읽기(read-your-writes)는 get_db_session(primary)을 사용하고,
+    클라이언트는 `X-Read-Consistency: strong` 헤더로 primary 조회를 요청할 수 있습니다.
+    커밋할 변경이 없으므로 세션은 커밋하지 않고 닫습니다.
+    """
+    async with read_session_factory(strong)() as session:
+        yield session
+
+
+def get_read_product_repository(
+    session: AsyncSession = Depends(get_read_db_session),
+    strong: bool = Depends(is_strong_read),
+) -> ProductRepository:
+    """
+    읽기 전용 ProductRepository 의존성
+    
+    동시 요청의 상품 단건 조회는 로더가 IN 쿼리 1회로 묶습니다. 로더는 요청 세션이 아닌
+    읽기 복제본 세션에서 조회하므로 strong 요청에는 사용하지 않습니다.
+    """
+    from app.infrastructure.adapters.db.batch_loader import get_product_loader
+    from app.infrastructure.adapters.db.product_repository_impl import ProductRepositoryImpl
+    return ProductRepositoryImpl(session, loader=None if strong else get_product_loader())
+
+
+def get_read_coupon_repository(
+    session: AsyncSession = Depends(get_read_db_session),
+    strong: bool = Depends(is_strong_read),
+) -> CouponRepository:
+    """읽기 전용 CouponRepository 의존성 (get_read_product_repository와 같은 로더 규칙)"""
+    from app.infrastructure.adapters.db.batch_loader import get_coupon_loader
+    from app.infrastructure.adapters.db.coupon_repository_impl import CouponRepositoryImpl
+    return CouponRepositoryImpl(session, loader=None if strong else get_coupon_loader())
+
+
+async def get_redis_client_dependency() -> redis.Redis | None:
     """
     Redis 클라이언트 의존성 - 각 요청마다 Redis 클라이언트 반환
     
-    Raises:
-        RuntimeError: Redis 클라이언트를 가져올 수 없을 때
+    Redis가 비활성화되었거나 재연결 중이면 None (프로세스 내 캐시로 대체)
     """
-    redis_client = await get_redis_client()
-    if redis_client is None:
-        raise RuntimeError("Redis 클라이언트를 초기화할 수 없습니다. Redis가 실행 중인지 확인하세요.")
-    return redis_client
+    if settings.cache_backend == "memory":
+        return None
+    return await get_redis_client()
 
 
 def get_cache_adapter(
-    redis_client: redis.Redis = Depends(get_redis_client_dependency)
+    redis_client: redis.Redis | None = Depends(get_redis_client_dependency)
 ) -> CacheAdapter:
     """
     CacheAdapter Factory - Infrastructure 구현체를 반환하지만 Port 타입으로 노출
     
-    Raises:
-        RuntimeError: Redis 클라이언트가 없을 때
+    CACHE_BACKEND=memory이거나 Redis를 사용할 수 없으면 프로세스 내 캐시 어댑터를 반환합니다.
+    """
+    from app.infrastructure.adapters.cache.auto_pipeline import get_auto_pipeline
+    from app.infrastructure.adapters.cache.circuit_breaker import get_circuit_breaker
+    from app.infrastructure.adapters.cache.codec import get_codec
+    from app.infrastructure.adapters.cache.compression import get_compressor
+    from app.infrastructure.adapters.cache.memory_adapter import InMemoryCacheAdapter, get_memory_cache_store
+    from app.infrastructure.adapters.cache.invalidation_bus import get_invalidation_bus
+    from app.infrastructure.adapters.cache.redis_adapter import RedisCacheAdapter, RedisCommands
+    from app.infrastructure.adapters.cache.two_tier_adapter import TwoTierCacheAdapter, get_l1_cache
+    if redis_client is None:
+        # 프로세스 내 캐시의 무효화는 다른 워커에 전파되지 않음
+        # Redis 장애 대체로 사용할 때는 다른 워커의 이전 값이 남는 시간을 Soft TTL로 제한
+        ttl = settings.cache_ttl if settings.cache_backend == "memory" else settings.cache_soft_ttl
+        return InMemoryCacheAdapter(
+            store=get_memory_cache_store(),
+            ttl=ttl,
+            soft_ttl=settings.cache_soft_ttl,
+            stale_ttl=settings.cache_stale_if_error_ttl if settings.cache_stale_if_error else 0,
+            ttl_jitter=settings.cache_ttl_jitter,
+            negative_ttl=settings.cache_negative_ttl,
+            response_ttl=settings.cache_response_ttl,
+        )
+    
+    cache_client: RedisCommands = redis_client
+    if settings.redis_auto_pipeline_enabled:
+        # 동시 요청의 캐시 명령을 파이프라인 1회로 묶음
+        cache_client = get_auto_pipeline(redis_client)
+    redis_adapter = RedisCacheAdapter(
+        redis_client=cache_client,
+        ttl=settings.cache_ttl,
+        soft_ttl=settings.cache_soft_ttl,
+        stale_ttl=settings.cache_stale_if_error_ttl if settings.cache_stale_if_error else 0,
+        ttl_jitter=settings.cache_ttl_jitter,
+        negative_ttl=settings.cache_negative_ttl,
+        codec=get_codec(settings.cache_codec),
+        compressor=get_compressor(),
+        breaker=get_circuit_breaker(),
+        response_ttl=settings.cache_response_ttl,
+    )
+    if not settings.cache_l1_enabled:
+        return redis_adapter
+    
+    # L1(프로세스 내) + L2(Redis) 2단계 캐시
+    return TwoTierCacheAdapter(
+        l1=get_l1_cache(),
+        l2=redis_adapter,
+        invalidation_bus=get_invalidation_bus(),
+    )
+
+
+def get_cache_policy(strong: bool = Depends(is_strong_read)) -> CachePolicy:
+    """캐시 정책 의존성 - 설정값과 요청의 읽기 일관성으로 cache_aside 동작 결정"""
+    return CachePolicy(
+        single_flight=settings.cache_single_flight_enabled,
+        single_flight_timeout=settings.cache_single_flight_timeout,
+        stale_while_revalidate=settings.cache_stale_while_revalidate,
+        stale_if_error=settings.cache_stale_if_error,
+        xfetch_beta=settings.cache_xfetch_beta,
+        list_block_size=settings.cache_list_block_size or None,
+        strong_read=strong,
+    )
+
+
+@asynccontextmanager
+async def product_repository_scope(strong: bool = False) -> AsyncIterator[ProductRepository]:
+    """
+    요청 세션과 분리된 ProductRepository 스코프 (병합된 캐시 미스 조회/백그라운드 캐시 갱신용)
+    
+    응답 후에도 실행될 수 있는 작업이나 여러 요청이 함께 기다리는 조회가 요청 세션을 공유하지 않도록
+    별도 세션을 엽니다. 캐시 갱신/워밍은 읽기 전용이므로 읽기 복제본 세션을 사용합니다.
+    
+    Args:
+        strong: True이면 primary 세션, 로더 없이 조회 (strong 요청의 캐시 미스)
     """
-    from app.infrastructure.adapters.cache.redis_adapter import RedisCacheAdapter
-    from app.infrastructure.settings.config import settings
-    return RedisCacheAdapter(redis_client=redis_client, ttl=settings.cache_ttl)
+    from app.infrastructure.adapters.db.batch_loader import get_product_loader
+    from app.infrastructure.adapters.db.product_repository_impl import ProductRepositoryImpl
+    async with read_session_factory(strong)() as session:
+        yield ProductRepositoryImpl(session, loader=None if strong else get_product_loader())
+
+
+@asynccontextmanager
+async def coupon_repository_scope(strong: bool = False) -> AsyncIterator[CouponRepository]:
+    """요청 세션과 분리된 CouponRepository 스코프 (product_repository_scope와 같은 용도)"""
+    from app.infrastructure.adapters.db.batch_loader import get_coupon_loader
+    from app.infrastructure.adapters.db.coupon_repository_impl import CouponRepositoryImpl
+    async with read_session_factory(strong)() as session:
+        yield CouponRepositoryImpl(session, loader=None if strong else get_coupon_loader())
+
+
+def get_product_repository_scope(strong: bool = Depends(is_strong_read)) -> RepositoryScope:
+    """요청의 읽기 일관성을 따르는 product_repository_scope 의존성"""
+    return partial(product_repository_scope, strong) if strong else product_repository_scope
+
+
+def get_coupon_repository_scope(strong: bool = Depends(is_strong_read)) -> CouponRepositoryScope:
+    """요청의 읽기 일관성을 따르는 coupon_repository_scope 의존성"""
+    return partial(coupon_repository_scope, strong) if strong else coupon_repository_scope
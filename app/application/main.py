@@ -1,5 +1,6 @@
 """FastAPI Application Main"""
 
+import asyncio
 import logging
 from fastapi import FastAPI, Request, status, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -7,9 +8,15 @@ from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy import text
 from app.application.routers import product_router
+from app.application.warmup import warm_up
 from app.domain.exceptions import DomainException
 from app.infrastructure.settings.config import settings, engine, async_session_maker
-from app.infrastructure.adapters.cache.redis_client import get_redis_client
+from app.infrastructure.adapters.cache.redis_client import get_redis_client, get_redis_manager
+from app.infrastructure.adapters.cache.invalidation_bus import get_invalidation_bus
+from app.infrastructure.adapters.cache.two_tier_adapter import get_l1_cache
+from app.infrastructure.adapters.db.replica_router import close_replica_router, get_replica_router
+from app.infrastructure.monitoring.hot_keys import get_hot_key_tracker
+from app.infrastructure.monitoring.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +26,9 @@ app = FastAPI(
     version="0.1.0",
 )
 
+# 워밍이 끝나기 전에는 /ready가 503을 반환 (로드밸런서가 트래픽을 보내지 않도록)
+app.state.ready = False
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -121,6 +131,7 @@ app.include_router(product_router.router, prefix="/api")
 async def startup_event():
     """서버 시작 시 데이터베이스 및 Redis 연결 확인"""
     logger.info("서버 시작 중...")
+    redis_client = None
     
     # 데이터베이스 연결 확인
     try:
@@ -132,26 +143,66 @@ async def startup_event():
         logger.error("데이터베이스가 실행 중인지 확인하세요: make docker-up")
         raise
     
-    # Redis 연결 확인
-    try:
-        redis_client = await get_redis_client()
-        if redis_client:
-            await redis_client.ping()
-            logger.info("✓ Redis 연결 성공")
-        else:
-            logger.warning("⚠ Redis가 비활성화되어 있습니다")
-    except Exception as e:
-        logger.warning("⚠ Redis 연결 실패: %s. 캐시 없이 동작합니다.", e)
+    # 읽기 복제본 헬스 체크 시작 (사용할 수 없는 복제본은 제외하고 primary로 대체)
+    replica_router = get_replica_router()
+    if replica_router.replicas:
+        healthy = await replica_router.start()
+        logger.info("✓ 읽기 복제본 %d/%d개 사용 가능", healthy, len(replica_router.replicas))
+    
+    # Redis 연결 관리자 시작 (커넥션 풀 + 백그라운드 헬스 체크)
+    # 구독/집계 태스크는 연결되는 시점에 시작 (시작 시 Redis가 없으면 재연결 후 시작)
+    redis_manager = get_redis_manager()
+    if redis_manager is not None:
+        redis_manager.add_listener(_start_redis_tasks)
+    redis_client = await get_redis_client()
+    if redis_client:
+        logger.info("✓ Redis 연결 성공")
+    elif redis_manager is None:
+        logger.warning("⚠ Redis가 비활성화되어 있습니다")
+    else:
+        logger.warning("⚠ Redis 연결 실패. 캐시 없이 동작하며 백그라운드에서 재연결합니다.")
+    
+    # 커넥션 풀/인기 키 워밍 (백그라운드 실행, 완료 후 ready)
+    if settings.warmup_enabled:
+        app.state.warmup_task = asyncio.create_task(_warm_up_and_mark_ready(redis_client))
+    else:
+        app.state.ready = True
     
     logger.info("서버 시작 완료")
 
 
+def _start_redis_tasks(redis_client) -> None:
+    """Redis 연결 시 구독/집계 태스크 시작 (재연결 시 이미 실행 중이면 무시)"""
+    # L1 캐시 무효화 채널 구독 (워커 간 L1 일관성)
+    if settings.cache_l1_enabled:
+        get_l1_cache()
+        get_invalidation_bus().start(redis_client)
+    
+    # 인기 키 집계 저장 (다음 배포의 워밍 대상)
+    if settings.warmup_enabled:
+        get_hot_key_tracker().start(redis_client, settings.warmup_hot_keys_persist_interval)
+
+
+async def _warm_up_and_mark_ready(redis_client) -> None:
+    try:
+        await warm_up(redis_client)
+    finally:
+        app.state.ready = True
+        logger.info("✓ 워밍 완료, 트래픽 수신 준비")
+
+
 @app.on_event("shutdown")
 async def shutdown_event():
     """서버 종료 시 리소스 정리"""
     logger.info("서버 종료 중...")
     from app.infrastructure.adapters.cache.redis_client import close_redis_client
+    warmup_task = getattr(app.state, "warmup_task", None)
+    if warmup_task is not None:
+        warmup_task.cancel()
+    await get_invalidation_bus().stop()
+    await get_hot_key_tracker().stop(await get_redis_client())
     await close_redis_client()
+    await close_replica_router()
     await engine.dispose()
     logger.info("서버 종료 완료")
 
@@ -166,6 +217,23 @@ async def root():
     }
 
 
+@app.get("/metrics")
+async def get_metrics():
+    """워커 단위 메트릭 - 캐시 계층별 히트율 등"""
+    return metrics.snapshot()
+
+
+@app.get("/ready")
+async def ready():
+    """준비 상태 확인 - 시작 워밍이 끝나기 전에는 503"""
+    if not app.state.ready:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "warming_up"},
+        )
+    return {"status": "ready"}
+
+
 @app.get("/health")
 async def health():
     """헬스 체크 - 데이터베이스 및 Redis 연결 상태 확인"""
@@ -184,16 +252,16 @@ async def health():
         health_status["status"] = "unhealthy"
         health_status["database"] = f"disconnected: {str(e)}"
     
-    # Redis 연결 확인
-    try:
-        redis_client = await get_redis_client()
-        if redis_client:
-            await redis_client.ping()
+    # Redis 연결 확인 (연결 관리자의 클라이언트로 직접 PING)
+    manager = get_redis_manager()
+    if manager is None:
+        health_status["redis"] = "disabled"
+    else:
+        try:
+            await manager.client.ping()
             health_status["redis"] = "connected"
-        else:
-            health_status["redis"] = "disabled"
-    except Exception as e:
-        health_status["redis"] = f"disconnected: {str(e)}"
+        except Exception as e:
+            health_status["redis"] = f"disconnected: {str(e)}"
     
     status_code = status.HTTP_200_OK if health_status["status"] == "healthy" else status.HTTP_503_SERVICE_UNAVAILABLE
     
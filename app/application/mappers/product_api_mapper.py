@@ -1,7 +1,7 @@
 """Product API Mapper - Domain Entity ↔ API Schema 변환"""
 
 from typing import TYPE_CHECKING
-from app.application.schemas.product import ProductResponse, ProductDetailResponse
+from app.application.schemas.product import ProductResponse, ProductDetailResponse, ProductBatchResponse
 
 if TYPE_CHECKING:
     from app.domain.entities.product import Product
@@ -42,4 +42,29 @@ class ProductApiMapper:
             coupon_discount=coupon_discount,
             final_price=final_price,
         )
-
+    
+    @classmethod
+    def to_priced_response(cls, product: "Product", coupon: "Coupon | None") -> ProductDetailResponse:
+        """Domain Entity → ProductDetailResponse 변환 (할인율/쿠폰 적용 가격 계산 포함)"""
+        discounted_price = product.get_discounted_price()
+        final_price = product.calculate_final_price(coupon)
+        return cls.to_detail_response(
+            product=product,
+            coupon=coupon,
+            discounted_price=discounted_price,
+            final_price=final_price,
+            coupon_discount=discounted_price - final_price if coupon else 0,
+        )
+    
+    @classmethod
+    def to_batch_response(
+        cls,
+        products: list["Product"],
+        missing_ids: list[int],
+        coupon: "Coupon | None",
+    ) -> ProductBatchResponse:
+        """Domain Entity 목록 → ProductBatchResponse 변환 (모든 상품에 같은 쿠폰 적용)"""
+        return ProductBatchResponse(
+            products=[cls.to_priced_response(product, coupon) for product in products],
+            missing_ids=missing_ids,
+        )
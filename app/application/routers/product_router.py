@@ -3,84 +3,236 @@
 from math import ceil
 
 import redis.asyncio as redis
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Response, status
 
 from app.application.dependencies import (
     get_cache_adapter,
-    get_db_session,
+    get_cache_policy,
+    get_coupon_repository_scope,
+    get_product_repository_scope,
+    get_read_coupon_repository,
+    get_read_product_repository,
 )
-from app.infrastructure.adapters.db.coupon_repository_impl import CouponRepositoryImpl
-from app.infrastructure.adapters.db.product_repository_impl import ProductRepositoryImpl
+from app.application.utils.cache_helper import CachePolicy
+from app.application.utils.cursor import decode_cursor, encode_cursor
+from app.application.utils.http_cache import (
+    batch_surrogate_keys,
+    cache_control,
+    detail_surrogate_keys,
+    list_surrogate_keys,
+    pack_response,
+    unpack_response,
+)
+from app.application.utils.etag import compute_etag, coupon_fingerprint, etag_matches, product_fingerprint
+from app.infrastructure.monitoring.hot_keys import get_hot_key_tracker
+from app.infrastructure.settings.config import settings
 from app.application.mappers import ProductApiMapper
 from app.application.schemas.product import (
+    MAX_BATCH_SIZE,
+    ProductBatchRequest,
+    ProductBatchResponse,
     ProductDetailRequest,
     ProductDetailResponse,
     ProductListRequest,
     ProductListResponse,
 )
-from app.application.services.product_service import ProductService
+from app.application.services.product_service import CouponRepositoryScope, ProductService, RepositoryScope
+from app.application.warmup import count_key, detail_key, list_key
 from app.domain.exceptions import (
     CouponNotFoundException,
     DomainException,
     InvalidCouponException,
     ProductNotFoundException,
 )
+from app.domain.ports.coupon_repository import CouponRepository
+from app.domain.ports.product_repository import ProductRepository
 
 router = APIRouter(prefix="/products", tags=["products"])
 
 
+def _cache_headers(etag: str, surrogate_keys: str) -> dict[str, str]:
+    """ETag + CDN 캐싱 헤더 (304 응답에도 같은 헤더를 보내 CDN이 캐시 수명을 갱신하도록 함)"""
+    return {
+        "ETag": etag,
+        "Cache-Control": cache_control(settings.http_cache_max_age, settings.http_cache_stale_while_revalidate),
+        "Surrogate-Key": surrogate_keys,
+    }
+
+
 @router.get("", response_model=ProductListResponse)
 async def get_product_list(
     request: ProductListRequest = Depends(),
-    session: AsyncSession = Depends(get_db_session),
+    if_none_match: str | None = Header(None, description="이전 응답의 ETag (일치하면 304)"),
+    product_repository: ProductRepository = Depends(get_read_product_repository),
+    repository_scope: RepositoryScope = Depends(get_product_repository_scope),
     cache_adapter=Depends(get_cache_adapter),
+    cache_policy: CachePolicy = Depends(get_cache_policy),
 ):
     """
     상품 목록 조회
     
     - 카테고리별 필터링 지원
-    - OFFSET 기반 페이지네이션
+    - OFFSET 기반 페이지네이션 (page/limit)
+    - 키셋 페이지네이션 (cursor/next_cursor - 페이지 깊이와 무관한 조회 비용)
     - Redis 캐싱 지원
+    - ETag / If-None-Match 조건부 요청 (변경이 없으면 본문 없이 304)
+    - CDN 캐싱 헤더 (Cache-Control, 범위/상품 ID Surrogate-Key)
+    - 직렬화된 응답 캐시 (히트 시 저장된 JSON 바이트를 그대로 응답)
     """
-    product_repository = ProductRepositoryImpl(session)
     service = ProductService(
         product_repository=product_repository,
         coupon_repository=None,  # 목록 조회에는 쿠폰 불필요
         cache_adapter=cache_adapter,
+        cache_policy=cache_policy,
+        repository_scope=repository_scope,
     )
     
+    # 커서가 있으면 키셋 페이지네이션 (page 무시)
+    after_id = None
+    if request.cursor is not None:
+        try:
+            after_id = decode_cursor(request.cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다")
+    
     # OFFSET 계산
-    offset = (request.page - 1) * request.limit
+    offset = (request.page - 1) * request.limit if after_id is None else 0
+    
+    # 인기 키 집계 (배포 후 워밍 대상)
+    hot_keys = get_hot_key_tracker()
+    if after_id is None:
+        hot_keys.record(list_key(request.category_id, offset, request.limit))
+    hot_keys.record(count_key(request.category_id))
     
-    # 상품 목록 및 개수 조회
-    products = await service.get_product_list(
+    # 응답 캐시 히트 - Domain Entity/응답 모델 생성 및 직렬화 없이 응답
+    cached = await service.get_cached_list_response(
         category_id=request.category_id,
         offset=offset,
         limit=request.limit,
+        after_id=after_id,
     )
+    if cached is not None:
+        etag, surrogate_keys, body = unpack_response(cached)
+        headers = _cache_headers(etag, surrogate_keys)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
     
-    total_count = await service.get_product_count(category_id=request.category_id)
+    # 상품 목록 및 개수 조회 (개수/목록 캐시가 모두 미스이면 DB 왕복 1회로 함께 조회)
+    products, total_count = await service.get_product_list_with_count(
+        category_id=request.category_id,
+        offset=offset,
+        limit=request.limit,
+        after_id=after_id,
+    )
     total_pages = ceil(total_count / request.limit)
     
+    # 응답 모델을 만들기 전에 도메인 데이터로 재검증
+    etag = compute_etag(
+        tuple(product_fingerprint(p) for p in products),
+        total_count,
+        request.page if after_id is None else ("after", after_id),
+        request.limit,
+    )
+    surrogate_keys = list_surrogate_keys(products, request.category_id)
+    headers = _cache_headers(etag, surrogate_keys)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
     # Domain Entity → API Schema 변환 (Mapper 사용)
     mapper = ProductApiMapper()
     
-    return ProductListResponse(
+    list_response = ProductListResponse(
         products=[mapper.to_response(p) for p in products],
         total_count=total_count,
         total_pages=total_pages,
-        current_page=request.page,
+        current_page=request.page if after_id is None else None,
         limit=request.limit,
+        next_cursor=encode_cursor(products[-1].id) if len(products) == request.limit else None,
     )
+    
+    # 한 번만 직렬화해서 응답과 응답 캐시에 함께 사용 (response_model 재검증/재직렬화 생략)
+    body = list_response.model_dump_json().encode("utf-8")
+    await service.cache_list_response(
+        pack_response(etag, surrogate_keys, body),
+        products,
+        category_id=request.category_id,
+        offset=offset,
+        limit=request.limit,
+        after_id=after_id,
+    )
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# /{product_id}보다 먼저 등록해야 "batch"가 상품 ID로 해석되지 않음
+@router.get("/batch", response_model=ProductBatchResponse)
+async def get_product_batch(
+    response: Response,
+    request: ProductBatchRequest = Depends(),
+    if_none_match: str | None = Header(None, description="이전 응답의 ETag (일치하면 304)"),
+    product_repository: ProductRepository = Depends(get_read_product_repository),
+    coupon_repository: CouponRepository = Depends(get_read_coupon_repository),
+    coupon_repository_scope: CouponRepositoryScope = Depends(get_coupon_repository_scope),
+    cache_adapter=Depends(get_cache_adapter),
+    cache_policy: CachePolicy = Depends(get_cache_policy),
+):
+    """
+    상품 일괄 조회 및 가격 계산
+    
+    - 요청한 ID 순서대로 응답 (중복 ID는 한 번만)
+    - 존재하지 않는 ID는 missing_ids로 응답 (404 아님)
+    - 상품 캐시 일괄 조회 후 캐시에 없는 ID만 DB에서 한 번에 조회
+    - 쿠폰 적용 (선택적, 모든 상품에 같은 쿠폰)
+    - ETag / If-None-Match 조건부 요청, CDN 캐싱 헤더
+    """
+    product_ids = request.product_ids()
+    if len(product_ids) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"상품 ID는 한 번에 최대 {MAX_BATCH_SIZE}개까지 조회할 수 있습니다")
+    
+    service = ProductService(
+        product_repository=product_repository,
+        coupon_repository=coupon_repository,
+        cache_adapter=cache_adapter,
+        cache_policy=cache_policy,
+        coupon_repository_scope=coupon_repository_scope,
+    )
+    
+    try:
+        products, missing_ids, coupon = await service.get_products_by_ids(
+            product_ids=product_ids,
+            coupon_code=request.coupon_code,
+        )
+    except CouponNotFoundException as e:
+        raise HTTPException(status_code=404, detail="유효하지 않은 쿠폰 코드입니다")
+    except InvalidCouponException as e:
+        raise HTTPException(status_code=400, detail="사용할 수 없는 쿠폰입니다")
+    
+    etag = compute_etag(
+        tuple(product_fingerprint(p) for p in products),
+        tuple(missing_ids),
+        coupon_fingerprint(coupon),
+    )
+    headers = _cache_headers(etag, batch_surrogate_keys(products, missing_ids))
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    
+    # Domain Entity → API Schema 변환 (Mapper 사용)
+    return ProductApiMapper().to_batch_response(products, missing_ids, coupon)
 
 
 @router.get("/{product_id}", response_model=ProductDetailResponse)
 async def get_product_detail(
+    response: Response,
     product_id: int = Path(..., ge=1, description="상품 ID"),
     coupon_code: str | None = Query(None, description="쿠폰 코드 (12자리, 대문자 알파벳과 숫자만 허용)", min_length=12, max_length=12, pattern="^[A-Z0-9]{12}$"),
-    session: AsyncSession = Depends(get_db_session),
+    if_none_match: str | None = Header(None, description="이전 응답의 ETag (일치하면 304)"),
+    product_repository: ProductRepository = Depends(get_read_product_repository),
+    coupon_repository: CouponRepository = Depends(get_read_coupon_repository),
+    repository_scope: RepositoryScope = Depends(get_product_repository_scope),
+    coupon_repository_scope: CouponRepositoryScope = Depends(get_coupon_repository_scope),
     cache_adapter=Depends(get_cache_adapter),
+    cache_policy: CachePolicy = Depends(get_cache_policy),
 ):
     """
     상품 상세 조회 및 가격 계산
@@ -88,15 +240,21 @@ async def get_product_detail(
     - 할인율 적용
     - 쿠폰 적용 (선택적)
     - 최종 판매가 계산
+    - ETag / If-None-Match 조건부 요청 (변경이 없으면 본문 없이 304)
+    - CDN 캐싱 헤더 (Cache-Control, 상품 ID Surrogate-Key)
     """
-    product_repository = ProductRepositoryImpl(session)
-    coupon_repository = CouponRepositoryImpl(session)
+    # 동시 요청의 상품/쿠폰 단건 조회는 로더가 IN 쿼리 1회로 묶음 (strong 요청은 primary에서 직접 조회)
     service = ProductService(
         product_repository=product_repository,
         coupon_repository=coupon_repository,
         cache_adapter=cache_adapter,
+        cache_policy=cache_policy,
+        repository_scope=repository_scope,
+        coupon_repository_scope=coupon_repository_scope,
     )
     
+    get_hot_key_tracker().record(detail_key(product_id))
+    
     try:
         product, coupon = await service.get_product_detail(
             product_id=product_id,
@@ -109,18 +267,11 @@ async def get_product_detail(
     except InvalidCouponException as e:
         raise HTTPException(status_code=400, detail="사용할 수 없는 쿠폰입니다")
     
-    # 가격 계산
-    discounted_price = product.get_discounted_price()
-    final_price = product.calculate_final_price(coupon)
-    coupon_discount = discounted_price - final_price if coupon else 0
+    etag = compute_etag(product_fingerprint(product), coupon_fingerprint(coupon))
+    headers = _cache_headers(etag, detail_surrogate_keys(product))
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
     
-    # Domain Entity → API Schema 변환 (Mapper 사용)
-    mapper = ProductApiMapper()
-    return mapper.to_detail_response(
-        product=product,
-        coupon=coupon,
-        discounted_price=discounted_price,
-        final_price=final_price,
-        coupon_discount=coupon_discount,
-    )
-
+    # Domain Entity → API Schema 변환 (Mapper 사용, 할인율/쿠폰 적용 가격 계산 포함)
+    return ProductApiMapper().to_priced_response(product, coupon)
@@ -3,6 +3,9 @@
 from typing import Annotated
 from pydantic import BaseModel, Field, ConfigDict
 
+# 상품 일괄 조회 1회 최대 ID 수
+MAX_BATCH_SIZE = 200
+
 
 class ProductListRequest(BaseModel):
     """상품 목록 조회 요청"""
@@ -11,6 +14,7 @@ class ProductListRequest(BaseModel):
     category_id: Annotated[int | None, Field(description="카테고리 ID", ge=1)] = None
     page: Annotated[int, Field(description="페이지 번호 (1부터 시작)", ge=1)] = 1
     limit: Annotated[int, Field(description="조회 개수", ge=1, le=100)] = 20
+    cursor: Annotated[str | None, Field(description="이전 응답의 next_cursor (지정하면 page 대신 키셋 페이지네이션)", max_length=64)] = None
 
 
 class ProductResponse(BaseModel):
@@ -30,8 +34,9 @@ class ProductListResponse(BaseModel):
     products: Annotated[list[ProductResponse], Field(description="상품 목록")]
     total_count: Annotated[int, Field(description="전체 상품 개수", ge=0)]
     total_pages: Annotated[int, Field(description="전체 페이지 수", ge=0)]
-    current_page: Annotated[int, Field(description="현재 페이지 번호", ge=1)]
+    current_page: Annotated[int | None, Field(description="현재 페이지 번호 (커서 요청이면 None)", ge=1)]
     limit: Annotated[int, Field(description="페이지당 조회 개수", ge=1, le=100)]
+    next_cursor: Annotated[str | None, Field(description="다음 페이지 커서 (마지막 페이지이면 None)")] = None
 
 
 class ProductDetailRequest(BaseModel):
@@ -41,6 +46,18 @@ class ProductDetailRequest(BaseModel):
     coupon_code: Annotated[str | None, Field(description="쿠폰 코드 (12자리, 대문자 알파벳과 숫자만 허용)", min_length=12, max_length=12, pattern="^[A-Z0-9]{12}$")] = None
 
 
+class ProductBatchRequest(BaseModel):
+    """상품 일괄 조회 요청"""
+    model_config = ConfigDict(json_schema_extra={"examples": [{"ids": "3,1,2", "coupon_code": "SAVE102024AB"}]})
+    
+    ids: Annotated[str, Field(description=f"쉼표로 구분한 상품 ID (최대 {MAX_BATCH_SIZE}개, 응답은 이 순서를 따름)", max_length=MAX_BATCH_SIZE * 11, pattern="^[1-9][0-9]{0,9}(,[1-9][0-9]{0,9})*$")]
+    coupon_code: Annotated[str | None, Field(description="모든 상품에 적용할 쿠폰 코드 (12자리, 대문자 알파벳과 숫자만 허용)", min_length=12, max_length=12, pattern="^[A-Z0-9]{12}$")] = None
+    
+    def product_ids(self) -> list[int]:
+        """요청한 상품 ID 목록 (요청 순서)"""
+        return [int(product_id) for product_id in self.ids.split(",")]
+
+
 class ProductDetailResponse(BaseModel):
     """상품 상세 응답"""
     model_config = ConfigDict(json_schema_extra={"examples": [{"id": 1, "name": "노트북", "original_price": 1000000, "discount_rate": 0.2, "discounted_price": 800000, "coupon_code": "SAVE102024AB", "coupon_discount": 80000, "final_price": 720000}]})
@@ -54,3 +71,8 @@ class ProductDetailResponse(BaseModel):
     coupon_discount: Annotated[int, Field(description="쿠폰 할인 금액", ge=0)] = 0
     final_price: Annotated[int, Field(description="최종 판매가", ge=0)]
 
+
+class ProductBatchResponse(BaseModel):
+    """상품 일괄 조회 응답"""
+    products: Annotated[list[ProductDetailResponse], Field(description="찾은 상품 (요청 순서, 중복 ID는 한 번만)")]
+    missing_ids: Annotated[list[int], Field(description="존재하지 않는 상품 ID (요청 순서)")]
@@ -1,8 +1,12 @@
 """ProductService - Application Service (Use Case)"""
 
+import time
+from contextlib import AbstractAsyncContextManager
 from datetime import datetime
+from typing import Awaitable, Callable, TypeVar
 
-from app.application.utils.cache_helper import cache_aside
+from app.application.utils.cache_helper import CachePolicy, cache_aside
+from app.application.utils.http_cache import purge_keys
 from app.domain.entities.coupon import Coupon
 from app.domain.entities.product import Product
 from app.domain.exceptions import (
@@ -10,10 +14,18 @@ from app.domain.exceptions import (
     InvalidCouponException,
     ProductNotFoundException,
 )
-from app.domain.ports.cache_adapter import CacheAdapter
+from app.domain.ports.cache_adapter import CacheAdapter, CacheEntry
+from app.domain.ports.cdn_purger import CdnPurger
 from app.domain.ports.coupon_repository import CouponRepository
 from app.domain.ports.product_repository import ProductRepository
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# 요청 세션과 분리된 Repository를 여는 팩토리 (병합 조회/백그라운드 갱신용)
+RepositoryScope = Callable[[], AbstractAsyncContextManager[ProductRepository]]
+CouponRepositoryScope = Callable[[], AbstractAsyncContextManager[CouponRepository]]
+
 
 class ProductService:
     """상품 관리 Application Service - Use Case 구현"""
@@ -23,104 +35,268 @@ class ProductService:
         product_repository: ProductRepository,
         coupon_repository: CouponRepository | None,
         cache_adapter: CacheAdapter,
+        cache_policy: CachePolicy | None = None,
+        repository_scope: RepositoryScope | None = None,
+        cdn_purger: CdnPurger | None = None,
+        coupon_repository_scope: CouponRepositoryScope | None = None,
     ):
         """
         Args:
             product_repository: 상품 Repository (Port)
             coupon_repository: 쿠폰 Repository (Port, 선택적)
             cache_adapter: 캐시 어댑터 (Port, 필수)
+            cache_policy: 캐시 정책 (선택적, None이면 기본값)
+            repository_scope: 병합된 캐시 미스 조회/백그라운드 캐시 갱신용 Repository 팩토리
+                (선택적, None이면 요청 세션으로 조회하고 Soft TTL이 지난 캐시도 요청 안에서 동기 갱신)
+            cdn_purger: 캐시 무효화 시 CDN 응답 캐시도 삭제할 Purger (Port, 선택적)
+            coupon_repository_scope: 쿠폰 조회용 repository_scope (선택적)
         """
         self.product_repository = product_repository
         self.coupon_repository = coupon_repository
         self.cache_adapter = cache_adapter
+        self.cache_policy = cache_policy or CachePolicy()
+        self.repository_scope = repository_scope
+        self.cdn_purger = cdn_purger
+        self.coupon_repository_scope = coupon_repository_scope
     
     async def get_product_list(
         self,
         category_id: int | None = None,
         offset: int = 0,
         limit: int = 20,
+        after_id: int | None = None,
     ) -> list[Product]:
         """
         상품 목록 조회 (Cache-Aside 패턴 적용)
         
+        캐시 정책에 list_block_size가 있으면 offset/limit와 관계없이 블록 경계에 맞춘
+        고정 크기 구간(예: 0~99, 100~199)을 캐싱하고, 요청 범위는 1~2개 블록을 잘라서 응답합니다.
+        
+        after_id가 있으면 키셋 페이지네이션으로 ID가 after_id보다 큰 상품을 limit개 조회합니다
+        (offset 무시, 블록 정렬 없이 after_id/limit별로 캐싱).
+        
         Args:
             category_id: 카테고리 ID (선택적)
             offset: OFFSET 값
             limit: 조회 개수
-            
+            after_id: 직전 페이지의 마지막 상품 ID (선택적, 키셋 페이지네이션)
+        
         Returns:
             상품 목록
         """
-        async def cache_get() -> list[Product] | None:
+        if after_id is not None:
+            return await self._get_product_page(category_id, 0, limit, after_id)
+        
+        block_size = self.cache_policy.list_block_size
+        if not block_size:
+            return await self._get_product_page(category_id, offset, limit)
+        
+        first_block = offset // block_size
+        last_block = (offset + limit - 1) // block_size
+        rows: list[Product] = []
+        for block in range(first_block, last_block + 1):
+            block_rows = await self._get_product_page(category_id, block * block_size, block_size)
+            rows.extend(block_rows)
+            if len(block_rows) < block_size:
+                break  # 마지막 블록 (이후 데이터 없음)
+        
+        start = offset - first_block * block_size
+        return rows[start:start + limit]
+    
+    async def _get_product_page(
+        self,
+        category_id: int | None,
+        offset: int,
+        limit: int,
+        after_id: int | None = None,
+    ) -> list[Product]:
+        """offset/limit (또는 after_id/limit) 구간 그대로 Cache-Aside 조회"""
+        async def cache_get() -> CacheEntry[list[Product]] | None:
             return await self.cache_adapter.get_product_list(
                 category_id=category_id,
                 offset=offset,
                 limit=limit,
+                after_id=after_id,
             )
         
-        async def db_fetch() -> list[Product]:
-            # 트랜잭션 관리는 Router/Dependencies에서 처리 (get_db_session)
+        async def fetch(repository: ProductRepository) -> list[Product]:
+            if after_id is not None:
+                if category_id:
+                    return await repository.find_by_category_after(
+                        category_id=category_id,
+                        after_id=after_id,
+                        limit=limit,
+                    )
+                return await repository.find_all_after(after_id=after_id, limit=limit)
             if category_id:
-                return await self.product_repository.find_by_category(
+                return await repository.find_by_category(
                     category_id=category_id,
                     offset=offset,
                     limit=limit,
                 )
             else:
-                return await self.product_repository.find_all(
+                return await repository.find_all(
                     offset=offset,
                     limit=limit,
                 )
         
-        async def cache_set(products: list[Product]) -> None:
+        async def db_fetch() -> list[Product]:
+            # 트랜잭션 관리는 Router/Dependencies에서 처리 (get_db_session)
+            return await fetch(self.product_repository)
+        
+        async def cache_set(products: list[Product], compute_time: float) -> None:
             await self.cache_adapter.set_product_list(
                 products=products,
                 category_id=category_id,
                 offset=offset,
                 limit=limit,
+                after_id=after_id,
+                compute_time=compute_time,
             )
         
+        page = f"after:{after_id}" if after_id is not None else offset
         return await cache_aside(
             cache_get=cache_get,
             db_fetch=db_fetch,
             cache_set=cache_set,
+            key=f"products:list:{category_id or 'all'}:{page}:{limit}",
+            policy=self.cache_policy,
+            refresh=self._in_own_scope(fetch),
+        )
+    
+    async def get_cached_list_response(
+        self,
+        category_id: int | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        after_id: int | None = None,
+    ) -> bytes | None:
+        """
+        캐시된 상품 목록 응답 조회 (직렬화된 바이트 그대로, 미스면 None)
+        
+        목록 캐시와 같은 범위로 invalidate_cache에 함께 무효화됩니다.
+        DB로 대체하지 않으므로 미스면 get_product_list/get_product_count로 응답을 만들어야 합니다.
+        """
+        return await self.cache_adapter.get_list_response(
+            category_id=category_id,
+            offset=offset,
+            limit=limit,
+            after_id=after_id,
+        )
+    
+    async def cache_list_response(
+        self,
+        payload: bytes,
+        products: list[Product],
+        category_id: int | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        after_id: int | None = None,
+    ) -> None:
+        """
+        직렬화된 상품 목록 응답 저장 (응답에 포함된 상품이 무효화되면 함께 무효화)
+        
+        Args:
+            payload: 직렬화된 응답
+            products: 응답에 포함된 상품 목록
+            category_id: 카테고리 ID (선택적)
+            offset: OFFSET 값
+            limit: 조회 개수
+            after_id: 직전 페이지의 마지막 상품 ID (선택적, 키셋 페이지네이션)
+        """
+        await self.cache_adapter.set_list_response(
+            payload,
+            [p.id for p in products],
+            category_id=category_id,
+            offset=offset,
+            limit=limit,
+            after_id=after_id,
+        )
+    
+    async def get_product_list_with_count(
+        self,
+        category_id: int | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        after_id: int | None = None,
+    ) -> tuple[list[Product], int]:
+        """
+        상품 목록과 전체 개수 조회
+        
+        개수와 요청 구간의 목록 캐시가 모두 미스이면 두 값을 DB 왕복 1회로 함께 조회해 양쪽 캐시를 채우고,
+        목록은 방금 채운 캐시에서 응답합니다. 키셋 페이지(after_id)는 조회 조건이 달라 개수를 따로 조회합니다.
+        
+        Args:
+            category_id: 카테고리 ID (선택적)
+            offset: OFFSET 값
+            limit: 조회 개수
+            after_id: 직전 페이지의 마지막 상품 ID (선택적, 키셋 페이지네이션)
+        
+        Returns:
+            (상품 목록, 상품 개수) 튜플
+        """
+        prefetch_page = self._list_unit(offset, limit) if after_id is None else None
+        total_count = await self.get_product_count(category_id, prefetch_page=prefetch_page)
+        products = await self.get_product_list(
+            category_id=category_id,
+            offset=offset,
+            limit=limit,
+            after_id=after_id,
         )
+        return products, total_count
     
     async def get_product_count(
         self,
         category_id: int | None = None,
+        prefetch_page: tuple[int, int] | None = None,
     ) -> int:
         """
         상품 개수 조회 (Cache-Aside 패턴 적용)
         
+        동시 캐시 미스는 범위별로 한 번만 조회합니다. prefetch_page가 있으면 목록 구간마다 함께 조회할 행이
+        다르므로 병합 키에 구간을 포함합니다 (다른 페이지를 요청한 후속 요청도 자신의 구간을 DB 왕복 1회로 조회).
+        
         Args:
             category_id: 카테고리 ID (선택적)
-            
+            prefetch_page: 개수를 DB에서 조회할 때 함께 조회해 캐시할 목록 구간 (offset, limit) (선택적)
+        
         Returns:
             상품 개수
         """
-        async def cache_get() -> int | None:
+        async def cache_get() -> CacheEntry[int] | None:
             return await self.cache_adapter.get_product_count(
                 category_id=category_id,
             )
         
-        async def db_fetch() -> int:
-            # 트랜잭션 관리는 Router/Dependencies에서 처리 (get_db_session)
+        async def fetch(repository: ProductRepository) -> int:
+            if prefetch_page is not None:
+                return await self._fetch_count_with_page(repository, category_id, *prefetch_page)
             if category_id:
-                return await self.product_repository.count_by_category(category_id)
+                return await repository.count_by_category(category_id)
             else:
-                return await self.product_repository.count_all()
+                return await repository.count_all()
+        
+        async def db_fetch() -> int:
+            # 트랜잭션 관리는 Router/Dependencies에서 처리 (get_db_session)
+            return await fetch(self.product_repository)
         
-        async def cache_set(count: int) -> None:
+        async def cache_set(count: int, compute_time: float) -> None:
             await self.cache_adapter.set_product_count(
                 count=count,
                 category_id=category_id,
+                compute_time=compute_time,
             )
         
+        key = f"products:count:{category_id or 'all'}"
+        if prefetch_page is not None:
+            key += ":page:{}:{}".format(*prefetch_page)
         return await cache_aside(
             cache_get=cache_get,
             db_fetch=db_fetch,
             cache_set=cache_set,
+            key=key,
+            policy=self.cache_policy,
+            refresh=self._in_own_scope(fetch),
         )
     
     async def get_product_detail(
@@ -129,39 +305,240 @@ class ProductService:
         coupon_code: str | None = None,
     ) -> tuple[Product, Coupon | None]:
         """
-        상품 상세 조회 및 쿠폰 조회
+        상품 상세 조회 및 쿠폰 조회 (Cache-Aside 패턴 적용)
+        
+        존재하지 않는 상품 ID/쿠폰 코드도 부정 항목으로 짧게 캐시합니다.
+        쿠폰 유효성은 캐시 여부와 관계없이 매 요청 현재 시각으로 검사합니다.
         
         Args:
             product_id: 상품 ID
             coupon_code: 쿠폰 코드 (선택적)
-            
+        
         Returns:
             (상품, 쿠폰) 튜플
-            
+        
         Raises:
             ProductNotFoundException: 상품을 찾을 수 없을 때
             CouponNotFoundException: 쿠폰을 찾을 수 없을 때
             InvalidCouponException: 쿠폰이 유효하지 않을 때
         """
         # 트랜잭션 관리는 Router/Dependencies에서 처리 (get_db_session)
-        # 상품 조회
-        product = await self.product_repository.find_by_id(product_id)
+        # 상품 조회 (Cache-Aside, 존재하지 않는 상품도 짧게 캐시)
+        async def product_cache_get() -> CacheEntry[Product | None] | None:
+            entries = await self.cache_adapter.get_products([product_id])
+            return entries.get(product_id)
+        
+        async def product_cache_set(found: Product | None, compute_time: float) -> None:
+            if found:
+                await self.cache_adapter.set_products([found], compute_time=compute_time)
+            else:
+                await self.cache_adapter.set_products([], missing_ids=[product_id], compute_time=compute_time)
+        
+        async def fetch(repository: ProductRepository) -> Product | None:
+            return await repository.find_by_id(product_id)
+        
+        product = await cache_aside(
+            cache_get=product_cache_get,
+            db_fetch=lambda: fetch(self.product_repository),
+            cache_set=product_cache_set,
+            key=f"products:detail:{product_id}",
+            policy=self.cache_policy,
+            refresh=self._in_own_scope(fetch),
+            cache_empty=True,
+        )
         if not product:
             raise ProductNotFoundException(product_id)
         
         # 쿠폰 조회 (선택적)
-        coupon = None
-        if coupon_code:
-            if not self.coupon_repository:
-                raise CouponNotFoundException(coupon_code)
-            
-            coupon = await self.coupon_repository.find_by_code(coupon_code)
-            if not coupon:
-                raise CouponNotFoundException(coupon_code)
-            
-            # 쿠폰 유효성 검사
-            now = datetime.now()
-            if coupon.valid_from > now or coupon.valid_to < now:
-                raise InvalidCouponException(coupon_code, "쿠폰 유효 기간이 만료되었습니다")
+        coupon = await self._get_coupon(coupon_code) if coupon_code else None
         
         return product, coupon
+    
+    async def get_products_by_ids(
+        self,
+        product_ids: list[int],
+        coupon_code: str | None = None,
+    ) -> tuple[list[Product], list[int], Coupon | None]:
+        """
+        상품 일괄 조회 (장바구니/추천 등 여러 상품을 한 번에)
+        
+        상품 단건 캐시를 한 번에 조회(MGET)하고, 캐시에 없거나 Soft TTL이 지난 ID만 DB에서
+        한 번에 조회(IN)해 캐시를 채웁니다. 존재하지 않는 ID는 부정 항목으로 짧게 캐시합니다.
+        쿠폰을 지정하면 상품 조회 전에 먼저 검사합니다 (잘못된 쿠폰이면 상품을 조회하지 않음).
+        
+        Args:
+            product_ids: 상품 ID 목록 (중복은 처음 위치만 사용)
+            coupon_code: 모든 상품에 적용할 쿠폰 코드 (선택적)
+        
+        Returns:
+            (요청 순서대로 찾은 상품, 요청 순서대로 존재하지 않는 상품 ID, 쿠폰) 튜플
+        
+        Raises:
+            CouponNotFoundException: 쿠폰을 찾을 수 없을 때
+            InvalidCouponException: 쿠폰이 유효하지 않을 때
+        """
+        coupon = await self._get_coupon(coupon_code) if coupon_code else None
+        
+        unique_ids = list(dict.fromkeys(product_ids))
+        found: dict[int, Product] = {}
+        missing: set[int] = set()
+        
+        entries = await self.cache_adapter.get_products(unique_ids)
+        miss_ids = []
+        for product_id in unique_ids:
+            entry = entries.get(product_id)
+            if entry is None or not entry.is_fresh():
+                miss_ids.append(product_id)
+            elif entry.value is None:
+                missing.add(product_id)
+            else:
+                found[product_id] = entry.value
+        
+        # 캐시 미스인 ID만 DB에서 조회해 채움
+        if miss_ids:
+            started = time.perf_counter()
+            fetched = await self.product_repository.find_by_ids(miss_ids)
+            compute_time = time.perf_counter() - started
+            found.update((p.id, p) for p in fetched)
+            not_found = [product_id for product_id in miss_ids if product_id not in found]
+            missing.update(not_found)
+            await self.cache_adapter.set_products(fetched, missing_ids=not_found, compute_time=compute_time)
+        
+        products = [found[product_id] for product_id in unique_ids if product_id in found]
+        missing_ids = [product_id for product_id in unique_ids if product_id in missing]
+        return products, missing_ids, coupon
+    
+    async def invalidate_cache(
+        self,
+        category_ids: list[int] | None = None,
+        product_ids: list[int] | None = None,
+    ) -> None:
+        """
+        상품 캐시 무효화 (상품 변경 후 호출)
+        
+        - product_ids: 상품 단건 캐시 삭제 (가격/재고 등 값 변경 - 목록은 ID만 캐시하므로 함께 반영,
+          해당 상품이 포함된 목록 응답 캐시도 삭제)
+        - category_ids: 해당 카테고리와 전체 목록/개수 무효화 (상품 추가/삭제, 카테고리 이동 등 구성 변경)
+        - 둘 다 None이면 모든 목록/개수 무효화
+        - cdn_purger가 있으면 같은 범위의 Surrogate-Key로 CDN 캐시도 삭제 (애플리케이션 캐시 무효화 후)
+        
+        Args:
+            category_ids: 변경된 상품의 카테고리 ID 목록 (선택적)
+            product_ids: 변경된 상품 ID 목록 (선택적)
+        """
+        if product_ids:
+            await self.cache_adapter.delete_products(product_ids)
+        if category_ids is not None or not product_ids:
+            await self.cache_adapter.invalidate_product_lists(category_ids)
+        if self.cdn_purger is not None:
+            await self.cdn_purger.purge(purge_keys(category_ids, product_ids))
+    
+    async def _get_coupon(self, coupon_code: str) -> Coupon:
+        """
+        쿠폰 조회 (Cache-Aside, 존재하지 않는 코드도 짧게 캐시) 및 유효 기간 검사
+        
+        Raises:
+            CouponNotFoundException: 쿠폰을 찾을 수 없을 때
+            InvalidCouponException: 쿠폰이 유효하지 않을 때
+        """
+        coupon_repository = self.coupon_repository
+        if not coupon_repository:
+            raise CouponNotFoundException(coupon_code)
+        
+        async def coupon_cache_get() -> CacheEntry[Coupon | None] | None:
+            return await self.cache_adapter.get_coupon(coupon_code)
+        
+        async def coupon_cache_set(found: Coupon | None, compute_time: float) -> None:
+            await self.cache_adapter.set_coupon(coupon_code, found, compute_time=compute_time)
+        
+        async def fetch(repository: CouponRepository) -> Coupon | None:
+            return await repository.find_by_code(coupon_code)
+        
+        coupon = await cache_aside(
+            cache_get=coupon_cache_get,
+            db_fetch=lambda: fetch(coupon_repository),
+            cache_set=coupon_cache_set,
+            key=f"coupons:{coupon_code}",
+            policy=self.cache_policy,
+            refresh=self._in_scope(self.coupon_repository_scope, fetch),
+            cache_empty=True,
+        )
+        if not coupon:
+            raise CouponNotFoundException(coupon_code)
+        
+        # 쿠폰 유효성 검사 (캐시 여부와 관계없이 현재 시각 기준)
+        now = datetime.now()
+        if coupon.valid_from > now or coupon.valid_to < now:
+            raise InvalidCouponException(coupon_code, "쿠폰 유효 기간이 만료되었습니다")
+        return coupon
+    
+    async def _fetch_count_with_page(
+        self,
+        repository: ProductRepository,
+        category_id: int | None,
+        offset: int,
+        limit: int,
+    ) -> int:
+        """
+        개수와 목록 구간을 한 쿼리로 조회하고 목록 캐시를 채움 (목록이 이미 캐시에 있으면 개수만 조회)
+        """
+        cached = await self.cache_adapter.get_product_list(
+            category_id=category_id,
+            offset=offset,
+            limit=limit,
+        )
+        if cached is not None:
+            if category_id:
+                return await repository.count_by_category(category_id)
+            return await repository.count_all()
+        
+        started = time.perf_counter()
+        products, count = await repository.find_page_with_count(
+            category_id=category_id,
+            offset=offset,
+            limit=limit,
+        )
+        if not products:
+            # cache_aside와 같이 빈 목록은 저장하지 않음
+            return count
+        await self.cache_adapter.set_product_list(
+            products=products,
+            category_id=category_id,
+            offset=offset,
+            limit=limit,
+            compute_time=time.perf_counter() - started,
+        )
+        return count
+    
+    def _list_unit(self, offset: int, limit: int) -> tuple[int, int]:
+        """offset이 속한 목록 캐시 단위 (offset, limit) - 블록 정렬 시 블록 전체, 아니면 요청 구간 그대로"""
+        block_size = self.cache_policy.list_block_size
+        if not block_size:
+            return offset, limit
+        return offset // block_size * block_size, block_size
+    
+    def _in_own_scope(
+        self,
+        fetch: Callable[[ProductRepository], Awaitable[T]],
+    ) -> Callable[[], Awaitable[T]] | None:
+        """
+        요청 세션과 분리된 상품 Repository로 조회하는 함수 생성 (병합 조회/백그라운드 갱신용)
+        
+        요청이 끝난 뒤에도 실행될 수 있으므로 요청 세션(self.product_repository)을 사용하지 않습니다.
+        """
+        return self._in_scope(self.repository_scope, fetch)
+    
+    @staticmethod
+    def _in_scope(
+        scope: Callable[[], AbstractAsyncContextManager[R]] | None,
+        fetch: Callable[[R], Awaitable[T]],
+    ) -> Callable[[], Awaitable[T]] | None:
+        """scope가 여는 Repository로 조회하는 함수 생성 (scope가 없으면 None)"""
+        if scope is None:
+            return None
+        
+        async def run() -> T:
+            async with scope() as repository:
+                return await fetch(repository)
+        
+        return run
@@ -1,6 +1,6 @@
 """Application Layer Utilities"""
 
-from app.application.utils.cache_helper import cache_aside
-
-__all__ = ["cache_aside"]
+from app.application.utils.cache_helper import CachePolicy, cache_aside, coalesce
+from app.application.utils.single_flight import SingleFlight
 
+__all__ = ["CachePolicy", "SingleFlight", "cache_aside", "coalesce"]
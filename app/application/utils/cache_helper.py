@@ -1,60 +1,283 @@
 """Cache Helper Utilities - Cache-Aside 패턴 템플릿"""
 
+import asyncio
+import logging
+import math
+import random
+import time
 from typing import Awaitable, Callable, TypeVar
 
+from app.application.utils.single_flight import SingleFlight
+from app.domain.ports.cache_adapter import CacheEntry
+
 T = TypeVar('T')
 
+logger = logging.getLogger(__name__)
+
+# 워커 단위 요청 병합기 (모든 ProductService 인스턴스가 공유)
+_single_flight = SingleFlight()
+
+# 실행 중인 백그라운드 갱신 태스크 (GC로 태스크가 사라지지 않도록 참조 유지)
+_background_tasks: set[asyncio.Task] = set()
+
+
+class CachePolicy:
+    """cache_aside 동작 정책"""
+    
+    def __init__(
+        self,
+        single_flight: bool = True,
+        single_flight_timeout: float | None = 5.0,
+        stale_while_revalidate: bool = True,
+        stale_if_error: bool = True,
+        xfetch_beta: float = 1.0,
+        list_block_size: int | None = None,
+        strong_read: bool = False,
+    ):
+        """
+        Args:
+            single_flight: 캐시 미스 시 같은 키의 DB 조회를 워커 내에서 하나로 병합할지 여부
+            single_flight_timeout: 병합된 요청의 최대 대기 시간 (초 단위, 초과 시 직접 DB 조회)
+            stale_while_revalidate: Soft TTL이 지난 값을 즉시 반환하고 백그라운드에서 갱신할지 여부
+            stale_if_error: DB 조회 실패 시 마지막 정상 값(Hard TTL 경과 포함)을 반환할지 여부
+            xfetch_beta: 확률적 조기 갱신(XFetch) 강도 (0이면 비활성화, 클수록 일찍 갱신)
+            list_block_size: 상품 목록을 이 크기로 정렬된 블록 단위로 캐싱 (None이면 요청한 offset/limit 그대로)
+            strong_read: primary에서 조회하는 요청(`X-Read-Consistency: strong`)의 정책인지 여부
+                (병합/백그라운드 갱신 키를 분리해 읽기 복제본에서 조회한 결과를 공유하지 않음)
+        """
+        self.single_flight = single_flight
+        self.single_flight_timeout = single_flight_timeout
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+        self.xfetch_beta = xfetch_beta
+        self.list_block_size = list_block_size
+        self.strong_read = strong_read
+    
+    def flight_key(self, key: str | None) -> str | None:
+        """읽기 일관성별 Single-Flight 병합 키 (strong 요청은 복제본 조회를 기다리지 않도록 분리)"""
+        if key is None or not self.strong_read:
+            return key
+        return f"{key}:strong"
+
+
+async def coalesce(
+    key: str | None,
+    fn: Callable[[], Awaitable[T]],
+    policy: CachePolicy | None = None,
+    fallback: Callable[[], Awaitable[T]] | None = None,
+) -> T:
+    """
+    같은 키의 동시 호출을 하나로 병합하여 실행 (Single-Flight)
+    
+    병합된 fn은 별도 태스크에서 실행되어 처음 호출한 요청이 취소/종료된 뒤에도 계속되고
+    여러 요청이 결과를 함께 기다리므로, 특정 요청의 세션을 사용하지 않아야 합니다.
+    key가 None이거나 정책에서 비활성화된 경우, follower가 timeout 안에 결과를 받지 못한 경우에는
+    fallback(없으면 fn)을 이 요청 안에서 직접 실행합니다.
+    
+    Args:
+        key: 병합 키
+        fn: 병합해서 실행할 비동기 함수 (요청 세션과 분리된 세션 사용)
+        policy: 캐시 정책 (None이면 기본값)
+        fallback: 병합하지 않고 직접 실행할 함수 (선택적, 요청 세션 사용 가능)
+    
+    Returns:
+        실행 결과
+    """
+    policy = policy or CachePolicy()
+    direct = fallback or fn
+    if key is None or not policy.single_flight:
+        return await direct()
+    
+    try:
+        return await _single_flight.do(key, fn, timeout=policy.single_flight_timeout)
+    except TimeoutError:
+        logger.warning("Single-Flight 대기 시간 초과, 직접 조회합니다: %s", key)
+        return await direct()
+
+
+def refresh_in_background(
+    key: str,
+    fn: Callable[[], Awaitable[T]],
+) -> bool:
+    """
+    백그라운드 갱신 예약 (같은 키의 갱신이 이미 실행 중이면 건너뜀)
+    
+    Args:
+        key: Single-Flight 병합 키 (동기 조회와 같은 키를 사용해 중복 조회 방지)
+        fn: 갱신 함수 (요청 세션과 무관하게 실행 가능해야 함)
+    
+    Returns:
+        새로 예약했는지 여부
+    """
+    if _single_flight.in_flight(key):
+        return False
+    
+    async def run() -> None:
+        try:
+            await _single_flight.do(key, fn)
+        except Exception as e:
+            logger.warning("캐시 백그라운드 갱신 실패 (%s): %s", key, e)
+    
+    task = asyncio.create_task(run())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return True
+
+
+def should_refresh_early(
+    entry: CacheEntry,
+    beta: float,
+    now: float | None = None,
+    rand: float | None = None,
+) -> bool:
+    """
+    XFetch 확률적 조기 갱신 판단
+    
+    `now - compute_time * beta * ln(U) >= fresh_until` 이면 갱신합니다 (U ~ Uniform(0, 1]).
+    만료가 가까울수록, 계산 비용(compute_time)이 클수록 조기 갱신 확률이 높아져
+    같은 시각에 만료되는 키들의 재계산이 시간축으로 분산됩니다.
+    
+    Args:
+        entry: 캐시 항목
+        beta: 조기 갱신 강도 (0이면 항상 False)
+        now: 현재 시각 (테스트/시뮬레이션용)
+        rand: 균등 난수 (테스트/시뮬레이션용)
+    
+    Returns:
+        조기 갱신 여부
+    """
+    if beta <= 0 or entry.compute_time <= 0:
+        return False
+    now = time.time() if now is None else now
+    u = random.random() if rand is None else rand
+    u = max(u, 1e-12)  # ln(0) 방지
+    return now - entry.compute_time * beta * math.log(u) >= entry.fresh_until
+
+
+def _as_entry(cached: "T | CacheEntry[T]") -> CacheEntry[T]:
+    """신선도 정보가 없는 값은 신선한 항목으로 간주"""
+    if isinstance(cached, CacheEntry):
+        return cached
+    return CacheEntry(value=cached, stored_at=0.0, fresh_until=float("inf"), expires_at=float("inf"))
+
 
 async def cache_aside(
-    cache_get: Callable[[], Awaitable[T | None]],
+    cache_get: Callable[[], Awaitable["T | CacheEntry[T] | None"]],
     db_fetch: Callable[[], Awaitable[T]],
-    cache_set: Callable[[T], Awaitable[None]] | None = None,
+    cache_set: Callable[[T, float], Awaitable[None]] | None = None,
+    key: str | None = None,
+    policy: CachePolicy | None = None,
+    refresh: Callable[[], Awaitable[T]] | None = None,
+    cache_empty: bool = False,
 ) -> T:
     """
     Cache-Aside 패턴 템플릿 함수
     
     캐시를 먼저 조회하고, 캐시 미스 시 DB에서 조회한 후 캐시에 저장하는 패턴을 구현합니다.
+    key를 지정하면 캐시 미스 시 같은 키의 DB 조회 + 캐시 저장을 워커 내에서 한 번만 수행하고,
+    동시에 미스가 난 나머지 요청은 그 결과를 공유합니다 (Cache Stampede 방지).
+    병합된 조회는 refresh(별도 세션)로 실행하며, refresh가 없으면 db_fetch로 실행합니다.
+    
+    cache_get이 CacheEntry를 반환하면 신선도에 따라 동작합니다.
+    - Soft TTL 이내: 캐시 값 반환 (만료가 가까우면 XFetch로 확률적 조기 갱신)
+    - Soft TTL ~ Hard TTL: 캐시 값을 즉시 반환하고 refresh로 백그라운드 갱신 (stale-while-revalidate)
+    - Hard TTL 이후: DB 조회, 실패 시 마지막 정상 값 반환 (stale-if-error)
     
     Args:
         cache_get: 캐시 조회 함수 (None 반환 시 캐시 미스)
         db_fetch: DB 조회 함수
-        cache_set: 캐시 저장 함수 (선택적, None이면 저장하지 않음)
-        
+        cache_set: 캐시 저장 함수 (값, DB 조회 소요 시간(초)) (선택적, None이면 저장하지 않음)
+        key: Single-Flight 병합 키 (선택적, None이면 병합하지 않음)
+        policy: 캐시 정책 (선택적, None이면 기본값)
+        refresh: 병합 조회/백그라운드 갱신용 DB 조회 함수 (선택적, 요청 세션과 분리된 세션 사용.
+            None이면 병합 조회도 db_fetch로 실행하고 Soft TTL이 지난 값도 동기적으로 갱신)
+        cache_empty: 빈 결과(None 등)도 저장할지 여부 (부정 캐시, 기본 False)
+    
     Returns:
         조회된 데이터
-        
+    
     Example:
         ```python
-        async def cache_get() -> list[Product] | None:
+        async def cache_get() -> CacheEntry[list[Product]] | None:
             return await cache_adapter.get_product_list(...)
         
         async def db_fetch() -> list[Product]:
             return await repository.find_all(...)
         
-        async def cache_set(products: list[Product]) -> None:
-            await cache_adapter.set_product_list(products, ...)
+        async def cache_set(products: list[Product], compute_time: float) -> None:
+            await cache_adapter.set_product_list(products, ..., compute_time=compute_time)
         
-        products = await cache_aside(cache_get, db_fetch, cache_set)
+        products = await cache_aside(cache_get, db_fetch, cache_set, key="products:list:...")
         ```
     """
+    policy = policy or CachePolicy()
+    key = policy.flight_key(key)
+    
     # 1. 캐시 조회 시도
+    entry: CacheEntry[T] | None = None
     try:
         cached_value = await cache_get()
         if cached_value is not None:
-            return cached_value
+            entry = _as_entry(cached_value)
     except Exception:
         # Redis 실패 시 조용히 DB로 fallback
         pass
     
-    # 2. 캐시 미스 - DB 조회
-    result = await db_fetch()
+    def store_with(fetch: Callable[[], Awaitable[T]]) -> Callable[[], Awaitable[T]]:
+        async def fetch_and_store() -> T:
+            started = time.perf_counter()
+            result = await fetch()
+            compute_time = time.perf_counter() - started
+            
+            # 캐시 저장 (에러가 발생해도 조용히 실패)
+            if cache_set and (result or cache_empty):
+                try:
+                    await cache_set(result, compute_time)
+                except Exception:
+                    pass  # 로깅은 adapter 내부에서 처리
+            
+            return result
+        return fetch_and_store
     
-    # 3. 캐시 저장 (비동기, 에러가 발생해도 조용히 실패)
-    if cache_set and result:
-        try:
-            await cache_set(result)
-        except Exception:
-            pass  # 로깅은 adapter 내부에서 처리
+    # 병합된 조회는 요청이 끝난 뒤에도 실행될 수 있으므로 요청 세션(db_fetch) 대신 refresh 사용
+    shared_fetch = store_with(refresh) if refresh is not None else store_with(db_fetch)
+    direct_fetch = store_with(db_fetch)
     
-    return result
-
+    if entry is not None:
+        now = time.time()
+        if entry.is_fresh(now):
+            if not should_refresh_early(entry, policy.xfetch_beta, now):
+                return entry.value
+            # XFetch 조기 갱신 - 가능하면 백그라운드, 아니면 이 요청이 대표로 재계산
+            if refresh is not None and key is not None:
+                refresh_in_background(key, store_with(refresh))
+                return entry.value
+            try:
+                return await coalesce(key, shared_fetch, policy, fallback=direct_fetch)
+            except Exception:
+                return entry.value
+        
+        # 2. Soft TTL 경과 - 오래된 값을 즉시 반환하고 백그라운드 갱신
+        if (
+            not entry.is_expired(now)
+            and policy.stale_while_revalidate
+            and refresh is not None
+            and key is not None
+        ):
+            refresh_in_background(key, store_with(refresh))
+            return entry.value
+    
+    # 3. 캐시 미스(또는 Hard TTL 경과) - DB 조회 후 캐시 저장 (같은 키는 병합)
+    try:
+        return await coalesce(key, shared_fetch, policy, fallback=direct_fetch)
+    except Exception as e:
+        # 4. DB 장애 - 마지막 정상 값으로 응답 (stale-if-error)
+        if entry is not None and policy.stale_if_error:
+            logger.warning(
+                "DB 조회 실패, 캐시된 이전 값으로 응답합니다 (key=%s, age=%.1fs): %s",
+                key,
+                time.time() - entry.stored_at,
+                e,
+            )
+            return entry.value
+        raise
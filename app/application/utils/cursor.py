@@ -0,0 +1,29 @@
+"""Cursor Utilities - 키셋 페이지네이션용 불투명(opaque) 커서"""
+
+import base64
+import binascii
+
+# 커서 형식 버전 (정렬 기준이 바뀌면 이전 커서를 거부할 수 있도록 포함)
+_PREFIX = "id:"
+
+
+def encode_cursor(last_id: int) -> str:
+    """직전 페이지의 마지막 상품 ID를 URL에 안전한 커서 문자열로 변환"""
+    raw = f"{_PREFIX}{last_id}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    커서 문자열에서 마지막 상품 ID 추출
+    
+    Raises:
+        ValueError: 형식이 올바르지 않은 커서
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii")
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(f"유효하지 않은 커서: {cursor}") from e
+    if not raw.startswith(_PREFIX) or not raw[len(_PREFIX):].isdigit():
+        raise ValueError(f"유효하지 않은 커서: {cursor}")
+    return int(raw[len(_PREFIX):])
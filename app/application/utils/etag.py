@@ -0,0 +1,51 @@
+"""ETag Utilities - 조건부 요청(If-None-Match) 처리"""
+
+import hashlib
+from typing import Any
+
+from app.domain.entities.coupon import Coupon
+from app.domain.entities.product import Product
+
+
+def product_fingerprint(product: Product) -> tuple:
+    """응답에 영향을 주는 상품 필드"""
+    return (
+        product.id,
+        product.name,
+        product.price,
+        product.stock,
+        product.category_id,
+        product.discount_rate,
+    )
+
+
+def coupon_fingerprint(coupon: Coupon | None) -> tuple | None:
+    """응답(최종가)에 영향을 주는 쿠폰 필드"""
+    if coupon is None:
+        return None
+    return (coupon.code, coupon.discount_type, coupon.discount_value)
+
+
+def compute_etag(*parts: Any) -> str:
+    """
+    강한(strong) ETag 생성 - 응답 내용을 결정하는 값들의 해시
+    
+    값들은 int/str/float/None/tuple로 구성되어야 합니다 (repr이 워커 간에 같아야 함).
+    응답 모델을 만들지 않고 도메인 데이터만으로 계산하므로 재검증 비용이 캐시 조회 수준입니다.
+    """
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    If-None-Match 헤더가 ETag와 일치하는지 여부
+    
+    RFC 9110에 따라 약한 비교(W/ 접두사 무시)를 사용하고, `*`와 쉼표로 구분된 목록을 지원합니다.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in candidates
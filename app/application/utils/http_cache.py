@@ -0,0 +1,97 @@
+"""HTTP Cache Utilities - CDN/리버스 프록시용 Cache-Control, Surrogate-Key, 직렬화된 응답 캐시 형식"""
+
+from app.domain.entities.product import Product
+
+# 모든 상품 응답에 붙는 키 (전체 삭제용)
+ALL_PRODUCTS_KEY = "products"
+
+# 카테고리 미지정 목록 응답에 붙는 키
+ALL_CATEGORIES_KEY = "category-all"
+
+
+def product_key(product_id: int) -> str:
+    return f"product-{product_id}"
+
+
+def category_key(category_id: int | None) -> str:
+    return f"category-{category_id}" if category_id else ALL_CATEGORIES_KEY
+
+
+def cache_control(max_age: int, stale_while_revalidate: int = 0) -> str:
+    """
+    Cache-Control 헤더 값 (max_age가 0 이하이면 CDN 캐시 금지)
+    
+    Args:
+        max_age: 공유 캐시 유지 시간 (초 단위)
+        stale_while_revalidate: 만료 후 갱신하는 동안 이전 응답을 제공할 시간 (초 단위)
+    """
+    if max_age <= 0:
+        return "no-store"
+    value = f"public, max-age={max_age}"
+    if stale_while_revalidate > 0:
+        value += f", stale-while-revalidate={stale_while_revalidate}"
+    return value
+
+
+def list_surrogate_keys(products: list[Product], category_id: int | None) -> str:
+    """
+    상품 목록 응답 Surrogate-Key
+    
+    목록 범위(카테고리) 키와 포함된 상품 키를 모두 붙여, 상품 하나가 바뀌어도 해당 페이지가 삭제되도록 합니다.
+    """
+    keys = [ALL_PRODUCTS_KEY, category_key(category_id)]
+    keys += [product_key(p.id) for p in products]
+    return " ".join(keys)
+
+
+def detail_surrogate_keys(product: Product) -> str:
+    """상품 상세 응답 Surrogate-Key (카테고리 구성 변경으로는 삭제되지 않도록 카테고리 키는 붙이지 않음)"""
+    return " ".join([ALL_PRODUCTS_KEY, product_key(product.id)])
+
+
+def batch_surrogate_keys(products: list[Product], missing_ids: list[int]) -> str:
+    """
+    상품 일괄 조회 응답 Surrogate-Key
+    
+    존재하지 않는 ID가 있으면 상품 추가(카테고리 구성 변경) 시 삭제되도록 카테고리 미지정 키도 붙입니다.
+    """
+    keys = [ALL_PRODUCTS_KEY]
+    if missing_ids:
+        keys.append(ALL_CATEGORIES_KEY)
+    keys += [product_key(p.id) for p in products]
+    return " ".join(keys)
+
+
+def purge_keys(
+    category_ids: list[int] | None = None,
+    product_ids: list[int] | None = None,
+) -> list[str]:
+    """
+    캐시 무효화 범위에 대응하는 Surrogate-Key (ProductService.invalidate_cache와 같은 규칙)
+    
+    - product_ids: 해당 상품 상세 + 그 상품이 포함된 목록
+    - category_ids: 해당 카테고리 목록 + 카테고리 미지정 목록 (개수가 바뀌므로 전체 페이지)
+    - 둘 다 None이면 모든 상품 응답
+    """
+    keys = [product_key(product_id) for product_id in product_ids or []]
+    if category_ids is not None:
+        keys.append(ALL_CATEGORIES_KEY)
+        keys += [category_key(category_id) for category_id in category_ids]
+    elif not product_ids:
+        keys.append(ALL_PRODUCTS_KEY)
+    return keys
+
+
+def pack_response(etag: str, surrogate_keys: str, body: bytes) -> bytes:
+    """
+    응답 캐시 저장 형식 - ETag, Surrogate-Key, 본문을 줄바꿈으로 연결
+    
+    히트 시 본문을 다시 만들지 않고 304 판단과 헤더 구성까지 할 수 있도록 헤더 값을 함께 저장합니다.
+    """
+    return b"\n".join((etag.encode("ascii"), surrogate_keys.encode("ascii"), body))
+
+
+def unpack_response(payload: bytes) -> tuple[str, str, bytes]:
+    """pack_response 역변환 - (ETag, Surrogate-Key, 본문)"""
+    etag, surrogate_keys, body = payload.split(b"\n", 2)
+    return etag.decode("ascii"), surrogate_keys.decode("ascii"), body
@@ -0,0 +1,66 @@
+"""Single-Flight - 동일 키 동시 요청 병합 (Cache Stampede 방지)"""
+
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """
+    키 단위 요청 병합기 (워커 단위)
+    
+    같은 키로 동시에 들어온 호출 중 첫 번째(leader)만 실제 함수를 실행하고,
+    나머지(follower)는 leader의 결과를 기다려 함께 반환받습니다.
+    
+    - leader의 예외는 모든 follower에게 그대로 전파됩니다.
+    - leader 요청이 취소되어도 실행 중인 작업은 계속되어 follower가 결과를 받습니다.
+    - follower는 timeout까지만 기다리고, 초과 시 TimeoutError가 발생합니다.
+    """
+    
+    def __init__(self):
+        self._calls: dict[str, asyncio.Future] = {}
+        self.leaders = 0
+        self.followers = 0
+    
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        timeout: float | None = None,
+    ) -> T:
+        """
+        키 단위로 병합하여 함수 실행
+        
+        Args:
+            key: 병합 키
+            fn: 실행할 비동기 함수
+            timeout: follower 최대 대기 시간 (초 단위, None이면 무제한)
+        
+        Returns:
+            함수 실행 결과
+        
+        Raises:
+            TimeoutError: follower 대기 시간 초과
+        """
+        call = self._calls.get(key)
+        if call is not None:
+            self.followers += 1
+            return await asyncio.wait_for(asyncio.shield(call), timeout)
+        
+        self.leaders += 1
+        call = asyncio.ensure_future(fn())
+        self._calls[key] = call
+        call.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(call)
+    
+    def in_flight(self, key: str) -> bool:
+        """해당 키의 작업이 실행 중인지 여부"""
+        return key in self._calls
+    
+    def _forget(self, key: str, done: asyncio.Future) -> None:
+        if self._calls.get(key) is done:
+            del self._calls[key]
+        # 모든 대기자가 취소된 경우에도 "exception was never retrieved" 경고 방지
+        if not done.cancelled():
+            done.exception()
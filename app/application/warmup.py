@@ -0,0 +1,199 @@
+"""
+Startup Warm-up - 배포 직후 콜드 스타트 완화
+
+1. 커넥션 풀 예열: DB(primary, 읽기 복제본) 풀과 Redis 연결을 미리 열어 첫 요청들이 연결 수립 비용을 내지 않도록 합니다.
+2. 인기 키 워밍: 직전 배포에서 집계된 인기 키(HotKeyTracker)를 동시 실행 수를 제한해 미리 조회합니다.
+
+인기 키는 캐시 키가 아니라 조회 요청 서술자로 저장하여, 캐시 키 형식(세대/블록 정렬 등)이 바뀌어도
+같은 Service 경로로 다시 채울 수 있습니다.
+- `list:{category_id|all}:{offset}:{limit}`
+- `count:{category_id|all}`
+- `detail:{product_id}`
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+import redis.asyncio as redis
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.application.services.product_service import ProductService
+
+logger = logging.getLogger(__name__)
+
+# 워밍 1건마다 별도 세션의 ProductService를 열어 실행하는 함수
+ServiceRunner = Callable[[Callable[[ProductService], Awaitable[object]]], Awaitable[object]]
+
+
+def _scope(category_id: int | None) -> str:
+    return str(category_id) if category_id else "all"
+
+
+def list_key(category_id: int | None, offset: int, limit: int) -> str:
+    """상품 목록 조회 서술자"""
+    return f"list:{_scope(category_id)}:{offset}:{limit}"
+
+
+def count_key(category_id: int | None) -> str:
+    """상품 개수 조회 서술자"""
+    return f"count:{_scope(category_id)}"
+
+
+def detail_key(product_id: int) -> str:
+    """상품 상세 조회 서술자"""
+    return f"detail:{product_id}"
+
+
+def _parse_category(value: str) -> int | None:
+    return None if value == "all" else int(value)
+
+
+def build_warm_call(key: str) -> Callable[[ProductService], Awaitable[object]] | None:
+    """
+    서술자를 Service 호출로 변환
+    
+    Returns:
+        ProductService를 받아 조회하는 함수 (알 수 없는 서술자면 None)
+    """
+    kind, _, rest = key.partition(":")
+    parts = rest.split(":")
+    try:
+        if kind == "list" and len(parts) == 3:
+            category_id, offset, limit = _parse_category(parts[0]), int(parts[1]), int(parts[2])
+            return lambda service: service.get_product_list(category_id=category_id, offset=offset, limit=limit)
+        if kind == "count" and len(parts) == 1:
+            category_id = _parse_category(parts[0])
+            return lambda service: service.get_product_count(category_id=category_id)
+        if kind == "detail" and len(parts) == 1:
+            product_id = int(parts[0])
+            return lambda service: service.get_product_detail(product_id=product_id)
+    except ValueError:
+        pass
+    return None
+
+
+async def _warm_up_engine(name: str, engine: AsyncEngine, db_connections: int) -> None:
+    """DB 엔진 1개의 커넥션 풀 예열 (모든 연결을 동시에 연 뒤 닫아야 풀에 db_connections개가 쌓임)"""
+    opened = await asyncio.gather(*(engine.connect().start() for _ in range(db_connections)), return_exceptions=True)
+    connections = [r for r in opened if not isinstance(r, BaseException)]
+    await asyncio.gather(*(conn.close() for conn in connections), return_exceptions=True)
+    db_errors = [r for r in opened if isinstance(r, BaseException)]
+    if db_errors:
+        logger.warning("DB(%s) 커넥션 풀 예열 일부 실패 (%d/%d): %s", name, len(db_errors), db_connections, db_errors[0])
+    else:
+        logger.info("✓ DB(%s) 커넥션 %d개 예열", name, db_connections)
+
+
+async def warm_up_pools(
+    engine: AsyncEngine,
+    db_connections: int,
+    redis_client: redis.Redis | None,
+    redis_connections: int,
+    replica_engines: dict[str, AsyncEngine] | None = None,
+) -> None:
+    """
+    DB/Redis 커넥션 풀 예열
+    
+    연결을 동시에 열어 두었다가 닫으면 풀에 반환되어 이후 요청이 재사용합니다.
+    읽기 조회는 복제본으로 가므로 replica_engines의 풀도 같은 수만큼 함께 예열합니다.
+    일부 연결 실패는 경고만 남깁니다 (첫 요청에서 다시 연결 시도).
+    """
+    if db_connections > 0:
+        engines = {"primary": engine, **(replica_engines or {})}
+        await asyncio.gather(*(_warm_up_engine(name, e, db_connections) for name, e in engines.items()))
+    
+    if redis_client is not None and redis_connections > 0:
+        # 동시에 PING을 보내면 풀이 redis_connections개의 연결을 생성
+        pings = await asyncio.gather(*(redis_client.ping() for _ in range(redis_connections)), return_exceptions=True)
+        redis_errors = [r for r in pings if isinstance(r, BaseException)]
+        if redis_errors:
+            logger.warning("Redis 연결 예열 일부 실패 (%d/%d): %s", len(redis_errors), redis_connections, redis_errors[0])
+        else:
+            logger.info("✓ Redis 연결 %d개 예열", redis_connections)
+
+
+async def warm_hot_keys(
+    keys: list[str],
+    run: ServiceRunner,
+    concurrency: int,
+) -> int:
+    """
+    인기 키 워밍 (동시 실행 수 제한, 키별 실패는 무시)
+    
+    Args:
+        keys: 조회 서술자 목록 (인기 순)
+        run: 별도 세션의 ProductService로 조회를 실행하는 함수
+        concurrency: 동시 실행 수 (DB 부하 상한)
+    
+    Returns:
+        워밍에 성공한 키 수
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+    
+    async def warm(key: str) -> bool:
+        call = build_warm_call(key)
+        if call is None:
+            logger.debug("알 수 없는 인기 키 무시: %s", key)
+            return False
+        async with semaphore:
+            try:
+                await run(call)
+                return True
+            except Exception as e:
+                # 삭제된 상품 등 - 워밍 실패는 서비스 시작을 막지 않음
+                logger.debug("인기 키 워밍 실패 (%s): %s", key, e)
+                return False
+    
+    results = await asyncio.gather(*(warm(key) for key in keys))
+    return sum(results)
+
+
+async def warm_up(redis_client: redis.Redis | None) -> None:
+    """
+    시작 시 워밍 전체 실행 (커넥션 풀 → 인기 키, settings.warmup_timeout 초과 시 중단)
+    
+    Redis가 없으면 캐시를 채울 수 없으므로 DB 풀 예열만 수행합니다.
+    """
+    from app.application.dependencies import get_cache_adapter, get_cache_policy, product_repository_scope
+    from app.infrastructure.adapters.db.replica_router import get_replica_router
+    from app.infrastructure.monitoring.hot_keys import get_hot_key_tracker
+    from app.infrastructure.settings.config import engine, settings
+    
+    async def run(call: Callable[[ProductService], Awaitable[object]]) -> object:
+        async with product_repository_scope() as product_repository:
+            service = ProductService(
+                product_repository=product_repository,
+                coupon_repository=None,  # 쿠폰은 요청별로 달라 워밍하지 않음
+                cache_adapter=get_cache_adapter(redis_client),
+                cache_policy=get_cache_policy(strong=False),
+            )
+            return await call(service)
+    
+    async def run_all() -> None:
+        await warm_up_pools(
+            engine,
+            settings.database_pool_size,
+            redis_client,
+            settings.warmup_redis_connections,
+            # 시작 헬스 체크를 통과한 복제본만 (제외된 복제본은 조회를 받지 않음)
+            {
+                replica.name: replica.engine
+                for replica in get_replica_router().replicas
+                if replica.healthy and replica.engine is not None
+            },
+        )
+        if redis_client is None:
+            return
+        
+        keys = await get_hot_key_tracker().load(redis_client, settings.warmup_hot_keys_limit)
+        if keys:
+            warmed = await warm_hot_keys(keys, run, settings.warmup_concurrency)
+            logger.info("✓ 인기 키 %d/%d개 워밍", warmed, len(keys))
+    
+    try:
+        await asyncio.wait_for(run_all(), timeout=settings.warmup_timeout)
+    except TimeoutError:
+        logger.warning("⚠ 워밍 시간 초과 (%.1fs), 남은 키는 요청 시 채워집니다", settings.warmup_timeout)
+    except Exception as e:
+        logger.warning("⚠ 워밍 실패: %s", e)
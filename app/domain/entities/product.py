@@ -1,6 +1,6 @@
 """Product Domain Entity - Rich Domain Model"""
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Sequence
 
 if TYPE_CHECKING:
     from app.domain.entities.coupon import Coupon
@@ -41,6 +41,29 @@ class Product:
         self.category_id = category_id
         self.discount_rate = discount_rate
     
+    @classmethod
+    def restore(cls, values: Sequence[Any]) -> "Product":
+        """
+        저장소에서 읽은 값으로 엔티티 복원 (신뢰된 값 - 검증 생략)
+        
+        저장 시점에 이미 검증된 값이므로 목록 조회처럼 행을 대량으로 복원할 때 __init__의 검증과
+        키워드 인자 바인딩을 건너뛰고 속성에 바로 넣습니다.
+        외부 입력으로 엔티티를 만들 때는 반드시 생성자를 사용해야 합니다.
+        
+        Args:
+            values: (id, name, price, stock, category_id, discount_rate) 순서의 값 6개
+        """
+        product = object.__new__(cls)
+        (
+            product.id,
+            product.name,
+            product.price,
+            product.stock,
+            product.category_id,
+            product.discount_rate,
+        ) = values
+        return product
+    
     def calculate_final_price(self, coupon: "Coupon | None" = None) -> int:
         """
         할인율과 쿠폰을 적용한 최종 판매가 계산
@@ -3,12 +3,15 @@
 from app.domain.ports.product_repository import ProductRepository
 from app.domain.ports.category_repository import CategoryRepository
 from app.domain.ports.coupon_repository import CouponRepository
-from app.domain.ports.cache_adapter import CacheAdapter
+from app.domain.ports.cache_adapter import CacheAdapter, CacheEntry
+from app.domain.ports.cdn_purger import CdnPurger
 
 __all__ = [
     "ProductRepository",
     "CategoryRepository",
     "CouponRepository",
     "CacheAdapter",
+    "CacheEntry",
+    "CdnPurger",
 ]
 
@@ -1,19 +1,76 @@
 """CacheAdapter Port (Interface) - Protocol"""
 
-from typing import Protocol
+import time
+from typing import Generic, Protocol, TypeVar
+from app.domain.entities.coupon import Coupon
 from app.domain.entities.product import Product
 
+T = TypeVar("T")
+
+
+class CacheEntry(Generic[T]):
+    """
+    캐시 항목 - 값과 신선도 메타데이터 (epoch 초 단위)
+    
+    - fresh_until 이전: 신선한 값 (그대로 반환)
+    - fresh_until ~ expires_at: 오래된 값 (즉시 반환 + 백그라운드 갱신)
+    - expires_at 이후: 만료된 값 (DB 장애 시에만 마지막 정상 값으로 사용)
+    
+    compute_time은 값을 계산(DB 조회)하는 데 걸린 시간으로, 확률적 조기 갱신(XFetch)에 사용됩니다.
+    """
+    
+    __slots__ = ("value", "stored_at", "fresh_until", "expires_at", "compute_time")
+    
+    def __init__(
+        self,
+        value: T,
+        stored_at: float,
+        fresh_until: float,
+        expires_at: float,
+        compute_time: float = 0.0,
+    ):
+        """
+        Args:
+            value: 캐시된 값
+            stored_at: 저장 시각
+            fresh_until: Soft TTL 만료 시각
+            expires_at: Hard TTL 만료 시각
+            compute_time: 값 계산 소요 시간 (초 단위)
+        """
+        self.value = value
+        self.stored_at = stored_at
+        self.fresh_until = fresh_until
+        self.expires_at = expires_at
+        self.compute_time = compute_time
+    
+    def is_fresh(self, now: float | None = None) -> bool:
+        """Soft TTL 이내인지 여부"""
+        return (time.time() if now is None else now) < self.fresh_until
+    
+    def is_expired(self, now: float | None = None) -> bool:
+        """Hard TTL을 지났는지 여부"""
+        return (time.time() if now is None else now) >= self.expires_at
+    
+    def __repr__(self) -> str:
+        return f"CacheEntry(value={self.value!r}, stored_at={self.stored_at}, fresh_until={self.fresh_until}, expires_at={self.expires_at})"
+
 
 class CacheAdapter(Protocol):
-    """캐시 어댑터 인터페이스 (Port)"""
+    """
+    캐시 어댑터 인터페이스 (Port)
+    
+    조회 메서드는 신선도 정보를 포함한 CacheEntry를 반환합니다.
+    단건 엔티티 캐시는 "존재하지 않음"도 값이 None인 CacheEntry(부정 캐시)로 저장합니다.
+    """
     
     async def get_product_list(
         self,
         category_id: int | None = None,
         offset: int = 0,
         limit: int = 20,
-    ) -> list[Product] | None:
-        """캐시에서 상품 목록 조회"""
+        after_id: int | None = None,
+    ) -> CacheEntry[list[Product]] | None:
+        """캐시에서 상품 목록 조회 (after_id가 있으면 키셋 페이지 - offset 대신 직전 페이지 마지막 ID로 구분)"""
         ...
     
     async def set_product_list(
@@ -22,14 +79,16 @@ class CacheAdapter(Protocol):
         category_id: int | None = None,
         offset: int = 0,
         limit: int = 20,
+        after_id: int | None = None,
+        compute_time: float = 0.0,
     ) -> None:
-        """상품 목록을 캐시에 저장"""
+        """상품 목록을 캐시에 저장 (compute_time: DB 조회 소요 시간, 초 단위, after_id: 키셋 페이지)"""
         ...
     
     async def get_product_count(
         self,
         category_id: int | None = None,
-    ) -> int | None:
+    ) -> CacheEntry[int] | None:
         """캐시에서 상품 개수 조회"""
         ...
     
@@ -37,7 +96,93 @@ class CacheAdapter(Protocol):
         self,
         count: int,
         category_id: int | None = None,
+        compute_time: float = 0.0,
     ) -> None:
-        """상품 개수를 캐시에 저장"""
+        """상품 개수를 캐시에 저장 (compute_time: DB 조회 소요 시간, 초 단위)"""
+        ...
+    
+    async def get_list_response(
+        self,
+        category_id: int | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        after_id: int | None = None,
+    ) -> bytes | None:
+        """
+        캐시에서 직렬화된 상품 목록 응답 조회 (저장한 바이트를 그대로 반환)
+        
+        응답 캐시는 신선도 구간 없이 TTL 동안만 보관하므로 히트는 항상 신선한 값입니다.
+        """
+        ...
+    
+    async def set_list_response(
+        self,
+        payload: bytes,
+        product_ids: list[int],
+        category_id: int | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        after_id: int | None = None,
+    ) -> None:
+        """
+        직렬화된 상품 목록 응답을 캐시에 저장
+        
+        목록 캐시와 같은 범위로 invalidate_product_lists에 무효화되고,
+        product_ids 중 하나라도 delete_products로 삭제되면 함께 무효화됩니다.
+        """
+        ...
+    
+    async def get_products(
+        self,
+        product_ids: list[int],
+    ) -> dict[int, CacheEntry[Product | None]]:
+        """
+        상품 단건 캐시 일괄 조회 (캐시에 없는 ID는 결과에서 제외)
+        
+        값이 None인 항목은 "존재하지 않는 상품"으로 캐시된 부정 항목입니다.
+        """
+        ...
+    
+    async def set_products(
+        self,
+        products: list[Product],
+        missing_ids: list[int] | None = None,
+        compute_time: float = 0.0,
+    ) -> None:
+        """상품 단건 캐시 일괄 저장 (missing_ids는 짧은 TTL의 부정 항목으로 저장)"""
+        ...
+    
+    async def get_coupon(
+        self,
+        coupon_code: str,
+    ) -> CacheEntry[Coupon | None] | None:
+        """쿠폰 캐시 조회 (값이 None이면 존재하지 않는 쿠폰 코드로 캐시된 부정 항목)"""
+        ...
+    
+    async def set_coupon(
+        self,
+        coupon_code: str,
+        coupon: Coupon | None,
+        compute_time: float = 0.0,
+    ) -> None:
+        """쿠폰 캐시 저장 (None이면 부정 항목, 만료는 쿠폰 유효 종료일을 넘지 않음)"""
+        ...
+    
+    async def invalidate_product_lists(
+        self,
+        category_ids: list[int] | None = None,
+    ) -> None:
+        """
+        상품 목록/개수 캐시 무효화
+        
+        category_ids를 지정하면 해당 카테고리와 전체(카테고리 미지정) 목록/개수를,
+        None이면 모든 목록/개수를 무효화합니다.
+        """
+        ...
+    
+    async def delete_products(
+        self,
+        product_ids: list[int],
+    ) -> None:
+        """상품 단건 캐시 삭제 (정규화된 목록에도 다음 조회부터 반영, 해당 상품이 포함된 목록 응답도 삭제)"""
         ...
-
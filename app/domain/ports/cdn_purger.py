@@ -0,0 +1,11 @@
+"""CdnPurger Port (Interface) - Protocol"""
+
+from typing import Protocol
+
+
+class CdnPurger(Protocol):
+    """CDN/리버스 프록시 캐시 삭제 인터페이스 (Port)"""
+    
+    async def purge(self, surrogate_keys: list[str]) -> None:
+        """Surrogate-Key로 태그된 응답 캐시 삭제"""
+        ...
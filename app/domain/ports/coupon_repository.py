@@ -10,4 +10,7 @@ class CouponRepository(Protocol):
     async def find_by_code(self, coupon_code: str) -> Coupon | None:
         """쿠폰 코드로 조회"""
         ...
-
+    
+    async def find_by_codes(self, coupon_codes: list[str]) -> list[Coupon]:
+        """쿠폰 코드 목록으로 일괄 조회 (결과 순서는 보장하지 않고, 없는 코드는 결과에서 제외)"""
+        ...
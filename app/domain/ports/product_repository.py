@@ -11,6 +11,10 @@ class ProductRepository(Protocol):
         """상품 ID로 조회"""
         ...
     
+    async def find_by_ids(self, product_ids: list[int]) -> list[Product]:
+        """상품 ID 목록으로 일괄 조회 (결과 순서는 보장하지 않고, 없는 ID는 결과에서 제외)"""
+        ...
+    
     async def find_by_category(
         self,
         category_id: int,
@@ -28,6 +32,32 @@ class ProductRepository(Protocol):
         """전체 상품 조회 (OFFSET 기반 페이지네이션)"""
         ...
     
+    async def find_by_category_after(
+        self,
+        category_id: int,
+        after_id: int,
+        limit: int = 20,
+    ) -> list[Product]:
+        """카테고리별 상품 조회 (키셋 페이지네이션 - ID가 after_id보다 큰 상품을 ID 순으로)"""
+        ...
+    
+    async def find_all_after(
+        self,
+        after_id: int,
+        limit: int = 20,
+    ) -> list[Product]:
+        """전체 상품 조회 (키셋 페이지네이션 - ID가 after_id보다 큰 상품을 ID 순으로)"""
+        ...
+    
+    async def find_page_with_count(
+        self,
+        category_id: int | None = None,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> tuple[list[Product], int]:
+        """상품 목록(OFFSET 기반)과 전체 개수를 함께 조회 (category_id가 None이면 전체 상품)"""
+        ...
+    
     async def count_by_category(self, category_id: int) -> int:
         """카테고리별 상품 개수 조회"""
         ...
@@ -0,0 +1,137 @@
+"""Auto-Pipeline - 동시 요청의 Redis 명령을 하나의 파이프라인으로 자동 묶음"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable
+
+import redis.asyncio as redis
+
+from app.infrastructure.monitoring.metrics import MetricsRegistry, metrics as default_metrics
+from app.infrastructure.settings.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AutoPipeline:
+    """
+    GET/MGET/SETEX 자동 파이프라이닝 래퍼
+    
+    같은 이벤트 루프 틱(window > 0이면 그 시간) 안에 여러 코루틴이 보낸 명령을 모아
+    파이프라인 1회(왕복 1회)로 실행하고, 각 응답을 명령을 보낸 코루틴의 Future로 돌려줍니다.
+    동시 요청이 많을수록 요청당 왕복 횟수가 줄어듭니다.
+    
+    그 외 명령(INCR, DELETE, pipeline 등)은 원래 클라이언트로 그대로 전달합니다.
+    """
+    
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        window: float = 0.0,
+        max_batch: int = 128,
+        metrics: MetricsRegistry | None = None,
+    ):
+        """
+        Args:
+            redis_client: 실제 Redis 클라이언트
+            window: 명령을 모으는 시간 (초 단위, 0이면 현재 틱에 쌓인 명령만)
+            max_batch: 파이프라인 1회 최대 명령 수 (도달하면 즉시 전송)
+            metrics: 메트릭 레지스트리 (None이면 전역 레지스트리)
+        """
+        self.redis_client = redis_client
+        self.window = window
+        self.max_batch = max_batch
+        self.metrics = metrics or default_metrics
+        self._pending: list[tuple[str, tuple, asyncio.Future]] = []
+        self._flush_handle: asyncio.Handle | asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+    
+    def __getattr__(self, name: str) -> Any:
+        # 자동 파이프라이닝 대상이 아닌 명령은 원래 클라이언트로 전달
+        return getattr(self.redis_client, name)
+    
+    async def get(self, key: str) -> bytes | str | None:
+        value: bytes | str | None = await self._enqueue("get", (key,))
+        return value
+    
+    async def mget(self, keys: list[str]) -> list[bytes | str | None]:
+        values: list[bytes | str | None] = await self._enqueue("mget", (keys,))
+        return values
+    
+    async def setex(self, key: str, ttl: int, value: str | bytes) -> bool:
+        stored: bool = await self._enqueue("setex", (key, ttl, value))
+        return stored
+    
+    def delete(self, *keys: str) -> Awaitable[int]:
+        return self.redis_client.delete(*keys)
+    
+    def pipeline(self, transaction: bool = True) -> Any:
+        return self.redis_client.pipeline(transaction=transaction)
+    
+    def _enqueue(self, command: str, args: tuple) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((command, args, future))
+        
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            if self.window > 0:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+            else:
+                self._flush_handle = loop.call_soon(self._flush)
+        return future
+    
+    def _flush(self) -> None:
+        """쌓인 명령을 파이프라인 1회로 전송 (응답은 별도 태스크에서 분배)"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        
+        task = asyncio.get_running_loop().create_task(self._execute(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _execute(self, batch: list[tuple[str, tuple, asyncio.Future]]) -> None:
+        self.metrics.observe("redis.pipeline.batch_size", len(batch))
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for command, args, _ in batch:
+                getattr(pipe, command)(*args)
+            results = await pipe.execute(raise_on_error=False)
+        except Exception as e:
+            # 연결 오류 등 - 묶인 모든 명령을 실패 처리
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue  # 호출한 쪽이 취소함
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+_auto_pipeline: AutoPipeline | None = None
+
+
+def get_auto_pipeline(redis_client: redis.Redis) -> AutoPipeline:
+    """
+    자동 파이프라인 싱글톤 (워커 단위, 클라이언트가 바뀌면 새로 생성)
+    
+    요청마다 새로 만들면 요청 간 명령이 묶이지 않으므로 모든 CacheAdapter가 공유합니다.
+    """
+    global _auto_pipeline
+    
+    if _auto_pipeline is None or _auto_pipeline.redis_client is not redis_client:
+        _auto_pipeline = AutoPipeline(
+            redis_client,
+            window=settings.redis_auto_pipeline_window,
+            max_batch=settings.redis_auto_pipeline_max_batch,
+        )
+    return _auto_pipeline
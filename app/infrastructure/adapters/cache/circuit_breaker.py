@@ -0,0 +1,185 @@
+"""Circuit Breaker - Redis 장애/지연 시 캐시 호출을 즉시 건너뜀"""
+
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, TypeVar
+
+from app.infrastructure.monitoring.metrics import MetricsRegistry, metrics as default_metrics
+from app.infrastructure.settings.config import settings
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# 게이지 값 (closed=0, half_open=1, open=2)
+_STATE_GAUGE = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 호출하지 않음 - 캐시 미스로 처리"""
+
+
+class CircuitBreaker:
+    """
+    호출 결과 기반 Circuit Breaker (closed → open → half-open → closed)
+    
+    - closed: 모든 호출 허용. 최근 window개 호출 중 실패율 또는 느린 호출 비율이 임계값을 넘으면 open
+    - open: open_duration 동안 호출하지 않고 즉시 CircuitOpenError (소켓 타임아웃을 기다리지 않음)
+    - half-open: 최대 half_open_probes개 호출만 시험 삼아 허용. 모두 성공하면 closed, 하나라도 실패하면 다시 open
+    """
+    
+    def __init__(
+        self,
+        name: str = "redis",
+        failure_rate_threshold: float = 0.5,
+        slow_call_threshold: float = 0.2,
+        slow_call_rate_threshold: float = 0.5,
+        window_size: int = 50,
+        minimum_calls: int = 20,
+        open_duration: float = 5.0,
+        half_open_probes: int = 3,
+        metrics: MetricsRegistry | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            name: 메트릭 이름 구분자 (cache.breaker.{name}.*)
+            failure_rate_threshold: open 전환 실패율 (0.0 ~ 1.0)
+            slow_call_threshold: 느린 호출로 간주하는 소요 시간 (초 단위)
+            slow_call_rate_threshold: open 전환 느린 호출 비율 (0.0 ~ 1.0)
+            window_size: 비율 계산에 사용하는 최근 호출 수
+            minimum_calls: 비율을 판단하기 위한 최소 호출 수
+            open_duration: open 유지 시간 (초 단위, 이후 half-open)
+            half_open_probes: half-open에서 허용하는 시험 호출 수
+            metrics: 메트릭 레지스트리 (None이면 전역 레지스트리)
+            clock: 시간 함수 (테스트용)
+        """
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.half_open_probes = half_open_probes
+        self.metrics = metrics or default_metrics
+        self.clock = clock
+        self.state = CLOSED
+        self._calls: deque[tuple[bool, bool]] = deque(maxlen=window_size)  # (실패 여부, 느린 호출 여부)
+        self._opened_at = 0.0
+        self._probes_started = 0
+        self._probes_succeeded = 0
+        self.metrics.set_gauge(f"cache.breaker.{name}.state", _STATE_GAUGE[CLOSED])
+    
+    def allow(self) -> bool:
+        """호출 허용 여부 (거부하면 bypass 카운트 증가)"""
+        if self.state == OPEN and self.clock() - self._opened_at >= self.open_duration:
+            self._transition(HALF_OPEN)
+        
+        if self.state == CLOSED:
+            return True
+        if self.state == HALF_OPEN and self._probes_started < self.half_open_probes:
+            self._probes_started += 1
+            return True
+        
+        self.metrics.increment(f"cache.breaker.{self.name}.bypass")
+        return False
+    
+    def record_success(self, elapsed: float) -> None:
+        """호출 성공 기록 (소요 시간이 slow_call_threshold 이상이면 느린 호출)"""
+        slow = elapsed >= self.slow_call_threshold
+        if self.state == HALF_OPEN:
+            if slow:
+                self._transition(OPEN)
+                return
+            self._probes_succeeded += 1
+            if self._probes_succeeded >= self.half_open_probes:
+                self._transition(CLOSED)
+            return
+        self._record(failed=False, slow=slow)
+    
+    def record_failure(self) -> None:
+        """호출 실패 기록"""
+        if self.state == HALF_OPEN:
+            self._transition(OPEN)
+            return
+        self._record(failed=True, slow=False)
+    
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        회로를 거쳐 호출
+        
+        Raises:
+            CircuitOpenError: 회로가 열려 있을 때 (호출하지 않음)
+        """
+        if not self.allow():
+            raise CircuitOpenError(self.name)
+        started = time.perf_counter()
+        try:
+            result = await fn()
+        except Exception:
+            self.record_failure()
+            raise
+        except BaseException:
+            # 취소된 시험 호출은 결과 없이 슬롯만 반환 (half-open에 갇히지 않도록)
+            if self.state == HALF_OPEN:
+                self._probes_started = max(self._probes_started - 1, 0)
+            raise
+        self.record_success(time.perf_counter() - started)
+        return result
+    
+    def _record(self, failed: bool, slow: bool) -> None:
+        if self.state != CLOSED:
+            return  # open 중에 끝난 이전 호출은 무시
+        self._calls.append((failed, slow))
+        if len(self._calls) < self.minimum_calls:
+            return
+        total = len(self._calls)
+        failure_rate = sum(1 for f, _ in self._calls if f) / total
+        slow_rate = sum(1 for _, s in self._calls if s) / total
+        if failure_rate >= self.failure_rate_threshold or slow_rate >= self.slow_call_rate_threshold:
+            logger.warning(
+                "Redis 회로 열림 (실패율 %.0f%%, 느린 호출 %.0f%%) - %.1f초 동안 캐시를 건너뜁니다",
+                failure_rate * 100,
+                slow_rate * 100,
+                self.open_duration,
+            )
+            self._transition(OPEN)
+    
+    def _transition(self, state: str) -> None:
+        previous, self.state = self.state, state
+        self._probes_started = 0
+        self._probes_succeeded = 0
+        if state == OPEN:
+            self._opened_at = self.clock()
+        elif state == CLOSED:
+            self._calls.clear()
+            logger.info("Redis 회로 닫힘 - 캐시 사용을 재개합니다")
+        self.metrics.set_gauge(f"cache.breaker.{self.name}.state", _STATE_GAUGE[state])
+        self.metrics.increment(f"cache.breaker.{self.name}.transitions.{previous}_to_{state}")
+
+
+_breaker: CircuitBreaker | None = None
+
+
+def get_circuit_breaker() -> CircuitBreaker | None:
+    """Redis 캐시 Circuit Breaker 싱글톤 (워커 단위, 비활성화 시 None)"""
+    global _breaker
+    
+    if not settings.cache_breaker_enabled:
+        return None
+    if _breaker is None:
+        _breaker = CircuitBreaker(
+            failure_rate_threshold=settings.cache_breaker_failure_rate,
+            slow_call_threshold=settings.cache_breaker_slow_call_seconds,
+            slow_call_rate_threshold=settings.cache_breaker_slow_call_rate,
+            window_size=settings.cache_breaker_window_size,
+            minimum_calls=settings.cache_breaker_minimum_calls,
+            open_duration=settings.cache_breaker_open_seconds,
+            half_open_probes=settings.cache_breaker_half_open_probes,
+        )
+    return _breaker
@@ -0,0 +1,333 @@
+"""Cache Codec - 캐시 항목 직렬화 (envelope + Domain Entity <-> bytes)"""
+
+import json
+import logging
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Protocol, cast
+
+from app.domain.entities.coupon import Coupon
+from app.domain.entities.product import Product
+from app.domain.ports.cache_adapter import CacheEntry
+
+logger = logging.getLogger(__name__)
+
+# 압축 등 상위 포맷과 구분하기 위한 첫 바이트 (JSON은 '{', '[', 숫자로 시작하므로 겹치지 않음)
+FRAME_MARKER = 0x01
+
+# 행(row) 배열 레이아웃 버전 - 필드 순서/구성을 바꾸면 올리고, 이전 버전 reader를 남겨둠
+SCHEMA_VERSION = 1
+
+
+class UnsupportedCacheFormat(ValueError):
+    """해석할 수 없는 캐시 항목 (알 수 없는 코덱/스키마 버전) - 캐시 미스로 처리"""
+
+
+class Serializer(Protocol):
+    """행 배열 직렬화기 (JSON, msgpack 등)"""
+    
+    codec_id: int
+    name: str
+    
+    def dumps(self, obj: Any) -> bytes:
+        ...
+    
+    def loads(self, data: bytes) -> Any:
+        ...
+
+
+class JsonSerializer:
+    """JSON 직렬화기 (공백 제거, 한글은 이스케이프 없이 UTF-8 그대로)"""
+    
+    codec_id = 1
+    name = "json"
+    
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class MsgpackSerializer:
+    """msgpack 직렬화기 (msgpack 패키지가 설치된 경우에만 사용 가능)"""
+    
+    codec_id = 2
+    name = "msgpack"
+    
+    def __init__(self):
+        import msgpack
+        self._msgpack = msgpack
+    
+    def dumps(self, obj: Any) -> bytes:
+        return cast(bytes, self._msgpack.packb(obj, use_bin_type=True))
+    
+    def loads(self, data: bytes) -> Any:
+        return self._msgpack.unpackb(data, raw=False)
+
+
+class ValueSchema:
+    """
+    캐시 값 종류별 변환 규칙
+    
+    - to_dict/from_dict: envelope JSON(dict) 형식 (JsonCodec, 이전 형식 읽기)
+    - to_row/readers: 행 배열 형식 (CompactCodec, 스키마 버전별 reader)
+    
+    None은 부정 항목으로 그대로 통과합니다.
+    """
+    
+    def __init__(
+        self,
+        to_dict: Callable[[Any], Any],
+        from_dict: Callable[[Any], Any],
+        to_row: Callable[[Any], Any],
+        readers: dict[int, Callable[[Any], Any]],
+    ):
+        self.to_dict = to_dict
+        self.from_dict = from_dict
+        self.to_row = to_row
+        self.readers = readers
+
+
+def _product_to_dict(p: Product) -> dict:
+    return {
+        "id": p.id,
+        "name": p.name,
+        "price": p.price,
+        "stock": p.stock,
+        "category_id": p.category_id,
+        "discount_rate": p.discount_rate,
+    }
+
+
+def _product_from_dict(item: dict) -> Product:
+    return Product(
+        id=item["id"],
+        name=item["name"],
+        price=item["price"],
+        stock=item["stock"],
+        category_id=item["category_id"],
+        discount_rate=item["discount_rate"],
+    )
+
+
+def _product_to_row(p: Product) -> list:
+    return [p.id, p.name, p.price, p.stock, p.category_id, p.discount_rate]
+
+
+def _product_from_row_v1(row: list) -> Product:
+    # 캐시에 저장한 값은 저장 시점에 이미 검증되었으므로 ProductMapper.from_row와 같이 검증 없이 복원
+    return Product.restore(row)
+
+
+def _datetime_to_str(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+def _datetime_from_str(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _coupon_to_dict(coupon: Coupon) -> dict:
+    return {
+        "id": coupon.id,
+        "code": coupon.code,
+        "discount_type": coupon.discount_type,
+        "discount_value": coupon.discount_value,
+        "valid_from": _datetime_to_str(coupon.valid_from),
+        "valid_to": _datetime_to_str(coupon.valid_to),
+    }
+
+
+def _coupon_from_dict(item: dict) -> Coupon:
+    return Coupon(
+        id=item["id"],
+        code=item["code"],
+        discount_type=item["discount_type"],
+        discount_value=item["discount_value"],
+        valid_from=_datetime_from_str(item["valid_from"]),
+        valid_to=_datetime_from_str(item["valid_to"]),
+    )
+
+
+def _coupon_to_row(coupon: Coupon) -> list:
+    return [
+        coupon.id,
+        coupon.code,
+        coupon.discount_type,
+        coupon.discount_value,
+        _datetime_to_str(coupon.valid_from),
+        _datetime_to_str(coupon.valid_to),
+    ]
+
+
+def _coupon_from_row_v1(row: list) -> Coupon:
+    return Coupon(
+        row[0],
+        row[1],
+        row[2],
+        row[3],
+        _datetime_from_str(row[4]),
+        _datetime_from_str(row[5]),
+    )
+
+
+def _optional(fn: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """None(부정 항목)은 변환하지 않음"""
+    return lambda value: None if value is None else fn(value)
+
+
+# 상품 목록은 ID 목록(PRODUCT_IDS)과 상품 단건(PRODUCT)으로 정규화해 저장하므로 목록 전용 스키마는 없음
+PRODUCT = ValueSchema(
+    to_dict=_optional(_product_to_dict),
+    from_dict=_optional(_product_from_dict),
+    to_row=_optional(_product_to_row),
+    readers={1: _optional(_product_from_row_v1)},
+)
+
+COUPON = ValueSchema(
+    to_dict=_optional(_coupon_to_dict),
+    from_dict=_optional(_coupon_from_dict),
+    to_row=_optional(_coupon_to_row),
+    readers={1: _optional(_coupon_from_row_v1)},
+)
+
+PRODUCT_IDS = ValueSchema(
+    to_dict=list,
+    from_dict=list,
+    to_row=list,
+    readers={1: list},
+)
+
+COUNT = ValueSchema(to_dict=int, from_dict=int, to_row=int, readers={1: int})
+
+
+class CacheCodec(Protocol):
+    """캐시 항목 인코더 (디코딩은 포맷을 자동 판별하는 decode_entry 사용)"""
+    
+    name: str
+    
+    def encode(self, schema: ValueSchema, entry: CacheEntry) -> bytes:
+        ...
+
+
+class JsonCodec:
+    """envelope JSON 형식 `{"v", "s", "f", "e", "c"}` (이전 버전 워커와 호환)"""
+    
+    name = "json"
+    
+    def encode(self, schema: ValueSchema, entry: CacheEntry) -> bytes:
+        envelope = {
+            "v": schema.to_dict(entry.value),
+            "s": entry.stored_at,
+            "f": entry.fresh_until,
+            "e": entry.expires_at,
+            "c": entry.compute_time,
+        }
+        return json.dumps(envelope).encode("utf-8")
+
+
+class CompactCodec:
+    """
+    행 배열 형식 - `[marker, codec_id, schema_version] + serializer([v, s, f, e, c])`
+    
+    엔티티를 dict 대신 필드 순서가 고정된 배열로 저장하여 키 이름 반복과 dict 생성 비용을 줄입니다.
+    """
+    
+    def __init__(self, serializer: Serializer):
+        self.serializer = serializer
+        self.name = serializer.name
+        self._header = bytes([FRAME_MARKER, serializer.codec_id, SCHEMA_VERSION])
+    
+    def encode(self, schema: ValueSchema, entry: CacheEntry) -> bytes:
+        body = [
+            schema.to_row(entry.value),
+            entry.stored_at,
+            entry.fresh_until,
+            entry.expires_at,
+            entry.compute_time,
+        ]
+        return self._header + self.serializer.dumps(body)
+
+
+_serializers: dict[int, Serializer] = {JsonSerializer.codec_id: JsonSerializer()}
+try:
+    _serializers[MsgpackSerializer.codec_id] = MsgpackSerializer()
+except ImportError:
+    pass
+
+
+@lru_cache
+def get_codec(name: str) -> CacheCodec:
+    """
+    설정 이름으로 코덱 생성 (코덱은 상태가 없으므로 이름별로 재사용)
+    
+    Args:
+        name: "json" (envelope JSON), "compact" (행 배열 JSON), "msgpack" (행 배열 msgpack)
+    
+    msgpack이 설치되지 않은 경우 compact로 대체합니다.
+    """
+    if name == "json":
+        return JsonCodec()
+    if name == "msgpack":
+        serializer = _serializers.get(MsgpackSerializer.codec_id)
+        if serializer is not None:
+            return CompactCodec(serializer)
+        logger.warning("msgpack이 설치되지 않아 compact 코덱을 사용합니다")
+    elif name != "compact":
+        raise ValueError(f"알 수 없는 캐시 코덱: {name}")
+    return CompactCodec(_serializers[JsonSerializer.codec_id])
+
+
+def is_framed(raw: bytes) -> bool:
+    """행 배열 형식 여부 (첫 바이트 판별)"""
+    return len(raw) >= 3 and raw[0] == FRAME_MARKER
+
+
+def decode_entry(
+    raw: bytes | str,
+    schema: ValueSchema,
+    legacy_soft_ttl: float,
+    legacy_ttl: float,
+    now: float,
+) -> CacheEntry:
+    """
+    저장된 값을 CacheEntry로 변환 (형식 자동 판별)
+    
+    - 행 배열 형식: 헤더의 코덱/스키마 버전으로 해석, 알 수 없으면 UnsupportedCacheFormat
+    - envelope JSON 형식: 그대로 해석
+    - envelope 도입 이전 형식(JSON 배열, 숫자 문자열): legacy TTL로 신선한 값 간주 (롤링 배포 호환)
+    """
+    if isinstance(raw, str):
+        raw = raw.encode("utf-8")
+    
+    if is_framed(raw):
+        serializer = _serializers.get(raw[1])
+        reader = schema.readers.get(raw[2])
+        if serializer is None or reader is None:
+            raise UnsupportedCacheFormat(f"codec_id={raw[1]}, schema_version={raw[2]}")
+        value, stored_at, fresh_until, expires_at, compute_time = serializer.loads(raw[3:])
+        return CacheEntry(
+            value=reader(value),
+            stored_at=stored_at,
+            fresh_until=fresh_until,
+            expires_at=expires_at,
+            compute_time=compute_time,
+        )
+    
+    decoded = json.loads(raw)
+    if isinstance(decoded, dict) and "v" in decoded:
+        return CacheEntry(
+            value=schema.from_dict(decoded["v"]),
+            stored_at=decoded["s"],
+            fresh_until=decoded["f"],
+            expires_at=decoded["e"],
+            compute_time=decoded.get("c", 0.0),
+        )
+    
+    return CacheEntry(
+        value=schema.from_dict(decoded),
+        stored_at=now,
+        fresh_until=now + legacy_soft_ttl,
+        expires_at=now + legacy_ttl,
+    )
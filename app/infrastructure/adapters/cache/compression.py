@@ -0,0 +1,121 @@
+"""Payload Compression - 임계값 이상의 캐시 값 압축 (첫 바이트 마커로 형식 자동 판별)"""
+
+import logging
+import time
+import zlib
+from typing import cast
+
+from app.infrastructure.adapters.cache.codec import UnsupportedCacheFormat
+from app.infrastructure.monitoring.metrics import MetricsRegistry, metrics as default_metrics
+from app.infrastructure.settings.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 압축 형식 마커 (codec.FRAME_MARKER=0x01, JSON 시작 문자와 겹치지 않음)
+ZLIB_MARKER = 0x02
+LZ4_MARKER = 0x03
+
+try:
+    import lz4.frame as _lz4
+except ImportError:
+    _lz4 = None
+
+
+def decompress(raw: bytes, metrics: MetricsRegistry | None = None) -> bytes:
+    """
+    마커를 보고 압축 해제 (압축되지 않은 값은 그대로 반환)
+    
+    Raises:
+        UnsupportedCacheFormat: lz4로 압축된 값인데 lz4가 설치되지 않은 경우
+    """
+    if not raw or raw[0] not in (ZLIB_MARKER, LZ4_MARKER):
+        return raw
+    
+    started = time.perf_counter()
+    if raw[0] == ZLIB_MARKER:
+        data = zlib.decompress(raw[1:])
+    elif _lz4 is not None:
+        data = cast(bytes, _lz4.decompress(raw[1:]))
+    else:
+        raise UnsupportedCacheFormat("lz4로 압축된 값이지만 lz4가 설치되지 않았습니다")
+    
+    if metrics is not None:
+        metrics.observe("cache.decompress.seconds", time.perf_counter() - started)
+    return data
+
+
+class PayloadCompressor:
+    """
+    임계값 이상의 캐시 값 압축기
+    
+    - threshold 미만이거나 압축해도 작아지지 않으면 원본을 그대로 저장합니다.
+    - 압축한 값은 `[marker] + 압축 데이터` 형식이며, 읽을 때 마커로 자동 판별합니다.
+    - 압축률(압축 후/전)과 압축/해제 CPU 시간을 메트릭으로 기록합니다.
+    """
+    
+    def __init__(
+        self,
+        threshold: int = 1024,
+        level: int = 6,
+        algorithm: str = "auto",
+        metrics: MetricsRegistry | None = None,
+    ):
+        """
+        Args:
+            threshold: 압축 최소 크기 (bytes)
+            level: zlib 압축 레벨 (1~9, lz4는 compression_level로 사용)
+            algorithm: "zlib", "lz4", "auto" (lz4가 설치되어 있으면 lz4, 아니면 zlib)
+            metrics: 메트릭 레지스트리 (None이면 전역 레지스트리)
+        """
+        if algorithm not in ("auto", "zlib", "lz4"):
+            raise ValueError(f"알 수 없는 압축 알고리즘: {algorithm}")
+        if algorithm == "lz4" and _lz4 is None:
+            logger.warning("lz4가 설치되지 않아 zlib으로 압축합니다")
+        
+        self.threshold = threshold
+        self.level = level
+        self.use_lz4 = algorithm != "zlib" and _lz4 is not None
+        self.metrics = metrics or default_metrics
+    
+    def compress(self, payload: bytes) -> bytes:
+        """임계값 이상이면 압축 (이득이 없으면 원본 반환)"""
+        if len(payload) < self.threshold:
+            return payload
+        
+        started = time.perf_counter()
+        if self.use_lz4:
+            compressed = bytes([LZ4_MARKER]) + cast(bytes, _lz4.compress(payload, compression_level=self.level))
+        else:
+            compressed = bytes([ZLIB_MARKER]) + zlib.compress(payload, self.level)
+        self.metrics.observe("cache.compress.seconds", time.perf_counter() - started)
+        
+        if len(compressed) >= len(payload):
+            self.metrics.increment("cache.compress.skipped")
+            return payload
+        
+        self.metrics.observe("cache.compress.ratio", len(compressed) / len(payload))
+        self.metrics.increment("cache.compress.bytes_in", len(payload))
+        self.metrics.increment("cache.compress.bytes_out", len(compressed))
+        return compressed
+    
+    def decompress(self, raw: bytes) -> bytes:
+        """마커를 보고 압축 해제 (해제 시간 메트릭 기록)"""
+        return decompress(raw, self.metrics)
+
+
+_compressor: PayloadCompressor | None = None
+
+
+def get_compressor() -> PayloadCompressor | None:
+    """설정 기반 압축기 싱글톤 (압축 비활성화 시 None)"""
+    global _compressor
+    
+    if not settings.cache_compression_enabled:
+        return None
+    if _compressor is None:
+        _compressor = PayloadCompressor(
+            threshold=settings.cache_compression_threshold,
+            level=settings.cache_compression_level,
+            algorithm=settings.cache_compression_algorithm,
+        )
+    return _compressor
@@ -0,0 +1,150 @@
+"""Cache Invalidation Bus - Redis Pub/Sub 기반 워커 간 L1 캐시 무효화"""
+
+import asyncio
+import json
+import logging
+import uuid
+from typing import Callable
+
+import redis.asyncio as redis
+
+from app.infrastructure.settings.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 무효화 메시지 수신 시 호출되는 리스너 (keys, prefixes)
+InvalidationListener = Callable[[list[str], list[str]], None]
+
+
+class CacheInvalidationBus:
+    """
+    Redis Pub/Sub 무효화 버스
+    
+    - L2(Redis) 키를 무효화한 워커가 키/접두사를 발행합니다 (캐시 미스 채우기는 발행하지 않음).
+    - 다른 워커는 구독 태스크에서 메시지를 받아 자신의 L1 항목을 제거합니다.
+    - 자신이 발행한 메시지는 무시합니다 (이미 L1을 최신 값으로 갱신했으므로).
+    - 구독이 끊겼다가 재연결되면 놓친 메시지가 있을 수 있으므로 L1 전체를 비웁니다.
+    """
+    
+    def __init__(self, channel: str, reconnect_delay: float = 1.0):
+        """
+        Args:
+            channel: Pub/Sub 채널명
+            reconnect_delay: 구독 실패 시 재시도 대기 시간 (초 단위)
+        """
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.instance_id = uuid.uuid4().hex
+        self._redis_client: redis.Redis | None = None
+        self._listeners: list[InvalidationListener] = []
+        self._task: asyncio.Task | None = None
+    
+    def add_listener(self, listener: InvalidationListener) -> None:
+        """무효화 리스너 등록"""
+        self._listeners.append(listener)
+    
+    def attach(self, redis_client: redis.Redis) -> None:
+        """발행에 사용할 Redis 클라이언트 연결"""
+        self._redis_client = redis_client
+    
+    async def publish(
+        self,
+        keys: list[str] | None = None,
+        prefixes: list[str] | None = None,
+    ) -> None:
+        """
+        무효화 메시지 발행 (실패해도 예외를 발생시키지 않음)
+        
+        Args:
+            keys: 무효화할 L1 키 목록
+            prefixes: 무효화할 L1 키 접두사 목록
+        """
+        if self._redis_client is None:
+            return
+        
+        message = json.dumps({
+            "origin": self.instance_id,
+            "keys": keys or [],
+            "prefixes": prefixes or [],
+        })
+        try:
+            await self._redis_client.publish(self.channel, message)
+        except Exception as e:
+            logger.warning("캐시 무효화 메시지 발행 실패: %s", e)
+    
+    def start(self, redis_client: redis.Redis) -> None:
+        """구독 태스크 시작"""
+        self.attach(redis_client)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(redis_client))
+    
+    async def stop(self) -> None:
+        """구독 태스크 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._redis_client = None
+    
+    def handle_message(self, data: bytes | str) -> None:
+        """수신 메시지 처리 - 다른 워커가 발행한 경우에만 리스너 호출"""
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning("잘못된 캐시 무효화 메시지: %r", data)
+            return
+        
+        if message.get("origin") == self.instance_id:
+            return
+        
+        self._notify(message.get("keys", []), message.get("prefixes", []))
+    
+    def _notify(self, keys: list[str], prefixes: list[str]) -> None:
+        for listener in self._listeners:
+            try:
+                listener(keys, prefixes)
+            except Exception as e:
+                logger.warning("캐시 무효화 리스너 실행 실패: %s", e)
+    
+    async def _run(self, redis_client: redis.Redis) -> None:
+        """구독 루프 - 연결이 끊기면 재구독"""
+        first_attempt = True
+        while True:
+            pubsub = redis_client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                if not first_attempt:
+                    # 구독이 끊긴 동안의 메시지를 놓쳤을 수 있으므로 L1 전체 무효화
+                    self._notify([], [""])
+                first_attempt = False
+                logger.info("캐시 무효화 채널 구독 시작: %s", self.channel)
+                
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self.handle_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                first_attempt = False
+                logger.warning("캐시 무효화 채널 구독 실패: %s. 재연결합니다.", e)
+                await asyncio.sleep(self.reconnect_delay)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+
+_invalidation_bus: CacheInvalidationBus | None = None
+
+
+def get_invalidation_bus() -> CacheInvalidationBus:
+    """무효화 버스 싱글톤 (워커 단위)"""
+    global _invalidation_bus
+    
+    if _invalidation_bus is None:
+        _invalidation_bus = CacheInvalidationBus(channel=settings.cache_invalidation_channel)
+    return _invalidation_bus
@@ -0,0 +1,191 @@
+"""Local Cache - 프로세스 내 LRU/TTL 캐시 (메모리 상한)"""
+
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Iterable
+
+
+def estimate_size(obj: Any, _depth: int = 0) -> int:
+    """
+    객체의 대략적인 메모리 크기(bytes) 추정
+    
+    list/tuple/dict와 `__dict__`를 가진 객체(도메인 엔티티)를 얕게 순회합니다.
+    정확한 값이 아니라 메모리 상한 관리용 근사치입니다.
+    """
+    size = sys.getsizeof(obj)
+    if _depth > 3:
+        return size
+    
+    if isinstance(obj, (bytes, bytearray, str, int, float, bool)) or obj is None:
+        return size
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + sum(estimate_size(item, _depth + 1) for item in obj)
+    if isinstance(obj, dict):
+        return size + sum(
+            estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1)
+            for k, v in obj.items()
+        )
+    if hasattr(obj, "__dict__"):
+        return size + estimate_size(vars(obj), _depth + 1)
+    return size
+
+
+class LocalCache:
+    """
+    프로세스 내 LRU + TTL 캐시
+    
+    - 항목 수(max_entries)와 추정 메모리(max_bytes) 두 가지 상한을 모두 지킵니다.
+    - 상한 초과 시 가장 오래 사용되지 않은 항목부터 제거합니다.
+    - 항목에 태그를 붙이면 태그와 같은 키를 무효화할 때 함께 제거됩니다
+      (예: 목록 항목에 포함된 상품 키를 태그로 붙여 상품 무효화 시 그 목록만 제거).
+    - 단일 이벤트 루프에서만 사용하므로 락을 사용하지 않습니다.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: float = 30.0,
+    ):
+        """
+        Args:
+            max_entries: 최대 항목 수
+            max_bytes: 최대 추정 메모리 (bytes)
+            default_ttl: 기본 TTL (초 단위)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        # key → (value, expires_at, size, tags)
+        self._data: OrderedDict[str, tuple[Any, float, int, tuple[str, ...]]] = OrderedDict()
+        # tag → 태그가 붙은 키
+        self._tagged: dict[str, set[str]] = {}
+        self._bytes = 0
+        self.evictions = 0
+        # invalidate 호출 횟수 (채우기 전에 그 사이 무효화가 있었는지 확인용)
+        self.invalidations = 0
+    
+    def get(self, key: str) -> Any | None:
+        """항목 조회 (만료 시 제거 후 None)"""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        
+        value, expires_at, _, _ = item
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        
+        self._data.move_to_end(key)
+        return value
+    
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float | None = None,
+        size: int | None = None,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """
+        항목 저장
+        
+        Args:
+            key: 키
+            value: 값
+            ttl: TTL (초 단위, None이면 default_ttl)
+            size: 값 크기 (bytes, None이면 추정)
+            tags: 이 키들이 무효화되면 함께 제거할 태그
+        """
+        if size is None:
+            size = estimate_size(value)
+        if size > self.max_bytes:
+            # 단일 항목이 전체 상한보다 크면 저장하지 않음
+            self._remove(key)
+            return
+        
+        self._remove(key)
+        expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+        tags = tuple(tags)
+        self._data[key] = (value, expires_at, size, tags)
+        self._bytes += size
+        for tag in tags:
+            self._tagged.setdefault(tag, set()).add(key)
+        self._evict()
+    
+    def delete(self, key: str) -> bool:
+        """항목 삭제"""
+        return self._remove(key)
+    
+    def delete_prefix(self, prefix: str) -> int:
+        """접두사로 시작하는 모든 항목 삭제 (삭제 개수 반환)"""
+        keys = [key for key in self._data if key.startswith(prefix)]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+    
+    def invalidate(self, keys: list[str], prefixes: list[str]) -> int:
+        """
+        키/접두사 단위 무효화 (키와 그 키를 태그로 가진 항목 삭제, 빈 접두사는 전체 삭제)
+        
+        Returns:
+            삭제된 항목 수
+        """
+        self.invalidations += 1
+        removed = 0
+        for key in keys:
+            removed += self._remove(key)
+            for tagged_key in list(self._tagged.get(key, ())):
+                removed += self._remove(tagged_key)
+        for prefix in prefixes:
+            if prefix == "":
+                removed += len(self._data)
+                self.clear()
+            else:
+                removed += self.delete_prefix(prefix)
+        return removed
+    
+    def clear(self) -> None:
+        """전체 삭제"""
+        self._data.clear()
+        self._tagged.clear()
+        self._bytes = 0
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+    
+    @property
+    def bytes_used(self) -> int:
+        """현재 추정 메모리 사용량 (bytes)"""
+        return self._bytes
+    
+    def _remove(self, key: str) -> bool:
+        item = self._data.pop(key, None)
+        if item is None:
+            return False
+        _, _, size, tags = item
+        self._bytes -= size
+        self._untag(key, tags)
+        return True
+    
+    def _untag(self, key: str, tags: tuple[str, ...]) -> None:
+        for tag in tags:
+            keys = self._tagged.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tagged[tag]
+    
+    def _evict(self) -> None:
+        """상한을 넘는 동안 LRU 순서로 제거"""
+        while self._data and (
+            len(self._data) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            key, (_, _, size, tags) = self._data.popitem(last=False)
+            self._bytes -= size
+            self._untag(key, tags)
+            self.evictions += 1
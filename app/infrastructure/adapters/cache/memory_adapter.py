@@ -0,0 +1,389 @@
+"""In-Memory Cache Adapter - Redis 없이 프로세스 내에서 동작하는 캐시 (Outbound Adapter)"""
+
+import random
+import sys
+import time
+from datetime import datetime
+from typing import Any
+
+from app.domain.entities.coupon import Coupon
+from app.domain.entities.product import Product
+from app.domain.ports.cache_adapter import CacheEntry
+from app.infrastructure.adapters.cache.local_cache import LocalCache, estimate_size
+from app.infrastructure.monitoring.metrics import MetricsRegistry, metrics as default_metrics
+from app.infrastructure.settings.config import settings
+
+
+class MemoryCacheStore:
+    """
+    프로세스 내 캐시 저장소 (워커 단위로 공유)
+    
+    - entries: 메모리 상한이 있는 LRU/TTL 캐시 (CacheEntry를 역직렬화 없이 그대로 보관)
+    - generations: 목록/개수 세대 카운터 (LRU로 제거되면 안 되므로 entries와 분리)
+    """
+    
+    def __init__(self, entries: LocalCache):
+        self.entries = entries
+        self.generations: dict[str, int] = {}
+
+
+class InMemoryCacheAdapter:
+    """
+    프로세스 내 캐시 어댑터 - CacheAdapter Port 구현
+    
+    RedisCacheAdapter와 같은 동작을 메모리에서 제공합니다.
+    - 신선도 메타데이터(Soft/Hard TTL, stale_ttl 보관, TTL jitter)
+    - 정규화된 목록 (목록 키에는 상품 ID만, 상품은 `product:{id}` 키에 하나씩)
+    - 세대 카운터 기반 목록/개수 무효화 (조회 시점 세대로 저장)
+    - 상품/쿠폰 부정 캐시, 쿠폰 유효 종료일 이후로 남지 않는 TTL
+    - 직렬화된 목록 응답 (목록과 같은 세대, 포함된 상품 항목이 응답보다 새로 저장되었거나 없으면 미스)
+    
+    직렬화가 없어 Redis 없는 소규모/엣지 배포나 Redis 장애 시 대체 캐시로 사용합니다.
+    
+    저장소와 무효화는 워커 단위입니다. 상품 변경 시 무효화(세대 증가, 단건 삭제)는 변경을 처리한
+    워커에만 적용되고 다른 워커에는 전파되지 않으므로, 다른 워커는 자신의 항목이 만료될 때까지
+    이전 값을 반환할 수 있습니다 (최대 Hard TTL). Redis 장애 시 대체로 사용할 때는
+    get_cache_adapter가 Hard TTL을 Soft TTL로 줄여 이 구간을 짧게 유지합니다.
+    """
+    
+    # 전체 목록/개수 세대 카운터 이름
+    _GLOBAL_SCOPE = "global"
+    
+    def __init__(
+        self,
+        store: MemoryCacheStore,
+        ttl: int = 300,
+        soft_ttl: int | None = None,
+        stale_ttl: int = 0,
+        ttl_jitter: float = 0.0,
+        negative_ttl: int = 30,
+        response_ttl: int = 60,
+        metrics: MetricsRegistry | None = None,
+    ):
+        """
+        Args:
+            store: 프로세스 내 캐시 저장소
+            ttl: 캐시 TTL (Hard TTL, 초 단위, 기본 5분)
+            soft_ttl: Soft TTL (초 단위, None이면 ttl과 동일)
+            stale_ttl: Hard TTL 이후에도 장애 대비용으로 값을 보관하는 시간 (초 단위)
+            ttl_jitter: TTL 감소 비율 상한 (0.0 ~ 1.0)
+            negative_ttl: 부정 캐시(존재하지 않는 상품/쿠폰) TTL (초 단위, 기본 30초)
+            response_ttl: 직렬화된 목록 응답 TTL (초 단위, 0이면 응답 캐시 비활성화)
+            metrics: 메트릭 레지스트리 (None이면 전역 레지스트리)
+        """
+        self.store = store
+        self.cache = store.entries
+        self.ttl = ttl
+        self.soft_ttl = ttl if soft_ttl is None else min(soft_ttl, ttl)
+        self.stale_ttl = stale_ttl
+        self.ttl_jitter = min(max(ttl_jitter, 0.0), 1.0)
+        self.negative_ttl = negative_ttl
+        self.response_ttl = response_ttl
+        self.metrics = metrics or default_metrics
+        # 범위별 조회 시점 세대 (조회 후 DB 조회 중에 무효화되면 이전 세대 키에 저장되도록)
+        self._generations: dict[str, tuple[int, int]] = {}
+    
+    async def get_product_list(
+        self,
+        category_id: int | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        after_id: int | None = None,
+    ) -> CacheEntry[list[Product]] | None:
+        """상품 목록 조회 (페이지의 상품 중 하나라도 없거나 부정 항목이면 미스)"""
+        generation = self._read_generation(category_id)
+        ids_entry = self._get(self._build_list_key(category_id, offset, limit, generation, after_id))
+        if ids_entry is None:
+            return None
+        
+        product_entries = await self.get_products(ids_entry.value)
+        products = []
+        for product_id in ids_entry.value:
+            entry = product_entries.get(product_id)
+            if entry is None or entry.value is None:
+                return None
+            products.append(entry.value)
+        
+        return CacheEntry(
+            value=products,
+            stored_at=ids_entry.stored_at,
+            fresh_until=ids_entry.fresh_until,
+            expires_at=ids_entry.expires_at,
+            compute_time=ids_entry.compute_time,
+        )
+    
+    async def set_product_list(
+        self,
+        products: list[Product],
+        category_id: int | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        after_id: int | None = None,
+        compute_time: float = 0.0,
+    ) -> None:
+        """상품 목록 저장 (ID 목록 + 상품 단건)"""
+        generation = self._generation_for_write(category_id)
+        key = self._build_list_key(category_id, offset, limit, generation, after_id)
+        self._set(key, [p.id for p in products], self.ttl, None, compute_time)
+        for product in products:
+            self._set(self._build_product_key(product.id), product, self.ttl, None, compute_time)
+        self._record_gauges()
+    
+    async def get_product_count(
+        self,
+        category_id: int | None = None,
+    ) -> CacheEntry[int] | None:
+        """상품 개수 조회"""
+        generation = self._read_generation(category_id)
+        return self._get(self._build_count_key(category_id, generation))
+    
+    async def set_product_count(
+        self,
+        count: int,
+        category_id: int | None = None,
+        compute_time: float = 0.0,
+    ) -> None:
+        """상품 개수 저장"""
+        generation = self._generation_for_write(category_id)
+        self._set(self._build_count_key(category_id, generation), count, self.ttl, None, compute_time)
+        self._record_gauges()
+    
+    async def get_list_response(
+        self,
+        category_id: int | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        after_id: int | None = None,
+    ) -> bytes | None:
+        """
+        직렬화된 목록 응답 조회
+        
+        태그 집합 대신 응답에 포함된 상품 항목을 직접 확인합니다 (역직렬화 없는 dict 조회).
+        상품 항목이 삭제되었거나 응답보다 나중에 저장되었으면 미스입니다.
+        """
+        if self.response_ttl <= 0:
+            return None
+        generation = self._read_generation(category_id)
+        entry = self._get(self._build_response_key(category_id, offset, limit, generation, after_id))
+        if entry is None:
+            return None
+        payload: bytes
+        product_ids, payload = entry.value
+        for product_id in product_ids:
+            product_entry = self.cache.get(self._build_product_key(product_id))
+            if product_entry is None or product_entry.value is None or product_entry.stored_at > entry.stored_at:
+                return None
+        return payload
+    
+    async def set_list_response(
+        self,
+        payload: bytes,
+        product_ids: list[int],
+        category_id: int | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        after_id: int | None = None,
+    ) -> None:
+        """직렬화된 목록 응답 저장 (포함된 상품 ID와 함께 보관)"""
+        if self.response_ttl <= 0:
+            return
+        generation = self._generation_for_write(category_id)
+        key = self._build_response_key(category_id, offset, limit, generation, after_id)
+        # stale_ttl 보관 없이 response_ttl이 지나면 제거
+        self._set(key, (tuple(product_ids), payload), self.response_ttl, self.response_ttl, 0.0)
+        self._record_gauges()
+    
+    async def get_products(
+        self,
+        product_ids: list[int],
+    ) -> dict[int, CacheEntry[Product | None]]:
+        """상품 단건 일괄 조회 (캐시에 없는 ID는 결과에서 제외)"""
+        entries: dict[int, CacheEntry[Product | None]] = {}
+        for product_id in product_ids:
+            entry = self._get(self._build_product_key(product_id))
+            if entry is not None:
+                entries[product_id] = entry
+        return entries
+    
+    async def set_products(
+        self,
+        products: list[Product],
+        missing_ids: list[int] | None = None,
+        compute_time: float = 0.0,
+    ) -> None:
+        """상품 단건 일괄 저장 (missing_ids는 부정 항목)"""
+        for product in products:
+            self._set(self._build_product_key(product.id), product, self.ttl, None, compute_time)
+        for product_id in missing_ids or []:
+            self._set(self._build_product_key(product_id), None, self.negative_ttl, None, compute_time)
+        self._record_gauges()
+    
+    async def get_coupon(
+        self,
+        coupon_code: str,
+    ) -> CacheEntry[Coupon | None] | None:
+        """쿠폰 조회"""
+        return self._get(self._build_coupon_key(coupon_code))
+    
+    async def set_coupon(
+        self,
+        coupon_code: str,
+        coupon: Coupon | None,
+        compute_time: float = 0.0,
+    ) -> None:
+        """쿠폰 저장 (유효 종료일 이후로 남지 않도록 TTL을 줄임, 이미 종료된 쿠폰은 짧은 TTL)"""
+        key = self._build_coupon_key(coupon_code)
+        if coupon is None:
+            self._set(key, None, self.negative_ttl, None, compute_time)
+        elif coupon.valid_to is None:
+            self._set(key, coupon, self.ttl, None, compute_time)
+        else:
+            remaining = (coupon.valid_to - datetime.now()).total_seconds()
+            if remaining < 1:
+                self._set(key, coupon, self.negative_ttl, None, compute_time)
+            else:
+                self._set(key, coupon, self.ttl, remaining, compute_time)
+        self._record_gauges()
+    
+    async def invalidate_product_lists(
+        self,
+        category_ids: list[int] | None = None,
+    ) -> None:
+        """세대 카운터 증가 + 해당 범위 항목 즉시 제거 (메모리 회수)"""
+        if category_ids is None:
+            scopes = [self._GLOBAL_SCOPE]
+            prefixes = ["list:", "count:", "response:"]
+        else:
+            scopes = ["all"] + [f"category:{category_id}" for category_id in category_ids]
+            prefixes = [f"{kind}:{scope}:" for scope in scopes for kind in ("list", "count", "response")]
+        
+        for scope in scopes:
+            self.store.generations[scope] = self.store.generations.get(scope, 0) + 1
+        self.cache.invalidate([], prefixes)
+        self._generations.clear()
+        self._record_gauges()
+    
+    async def delete_products(
+        self,
+        product_ids: list[int],
+    ) -> None:
+        """상품 단건 삭제 (정규화된 목록에도 다음 조회부터 반영)"""
+        for product_id in product_ids:
+            self.cache.delete(self._build_product_key(product_id))
+        self._record_gauges()
+    
+    def _read_generation(self, category_id: int | None) -> tuple[int, int]:
+        scope = self._scope(category_id)
+        generation = (
+            self.store.generations.get(self._GLOBAL_SCOPE, 0),
+            self.store.generations.get(scope, 0),
+        )
+        self._generations[scope] = generation
+        return generation
+    
+    def _generation_for_write(self, category_id: int | None) -> tuple[int, int]:
+        """저장용 세대 (같은 어댑터로 조회한 적이 있으면 조회 시점 값)"""
+        generation = self._generations.get(self._scope(category_id))
+        if generation is not None:
+            return generation
+        return self._read_generation(category_id)
+    
+    def _get(self, key: str) -> CacheEntry | None:
+        entry = self.cache.get(key)
+        self.metrics.increment("cache.memory.hits" if entry is not None else "cache.memory.misses")
+        return entry
+    
+    def _set(
+        self,
+        key: str,
+        value: Any,
+        base_ttl: int,
+        expire_within: float | None,
+        compute_time: float,
+    ) -> None:
+        """신선도 메타데이터와 함께 저장 (항목은 Hard TTL + stale_ttl 동안 보관)"""
+        now = time.time()
+        scale = 1.0 - random.uniform(0.0, self.ttl_jitter) if self.ttl_jitter > 0 else 1.0
+        ttl = max(1, int(base_ttl * scale))
+        key_ttl = ttl + self.stale_ttl
+        if expire_within is not None:
+            key_ttl = min(key_ttl, max(1, int(expire_within)))
+            ttl = min(ttl, key_ttl)
+        entry = CacheEntry(
+            value=value,
+            stored_at=now,
+            fresh_until=now + min(self.soft_ttl * scale, ttl),
+            expires_at=now + ttl,
+            compute_time=compute_time,
+        )
+        # CacheEntry는 __slots__ 객체라 estimate_size가 값을 순회하지 않으므로 값 크기를 더함
+        size = sys.getsizeof(entry) + estimate_size(value)
+        self.cache.set(key, entry, ttl=key_ttl, size=size)
+    
+    def _record_gauges(self) -> None:
+        self.metrics.set_gauge("cache.memory.entries", len(self.cache))
+        self.metrics.set_gauge("cache.memory.bytes", self.cache.bytes_used)
+        self.metrics.set_gauge("cache.memory.evictions", self.cache.evictions)
+    
+    @staticmethod
+    def _scope(category_id: int | None) -> str:
+        return f"category:{category_id}" if category_id else "all"
+    
+    @staticmethod
+    def _page(offset: int, after_id: int | None) -> str:
+        """페이지 구분 (키셋 페이지는 offset 대신 after)"""
+        return f"after:{after_id}" if after_id is not None else f"offset:{offset}"
+    
+    def _build_list_key(
+        self,
+        category_id: int | None,
+        offset: int,
+        limit: int,
+        generation: tuple[int, int],
+        after_id: int | None = None,
+    ) -> str:
+        """상품 목록(ID 목록) 키 (범위 접두사 무효화를 위해 범위를 앞에 둠)"""
+        return f"list:{self._scope(category_id)}:gen:{generation[0]}.{generation[1]}:{self._page(offset, after_id)}:limit:{limit}"
+    
+    def _build_response_key(
+        self,
+        category_id: int | None,
+        offset: int,
+        limit: int,
+        generation: tuple[int, int],
+        after_id: int | None = None,
+    ) -> str:
+        """직렬화된 목록 응답 키"""
+        return f"response:{self._scope(category_id)}:gen:{generation[0]}.{generation[1]}:{self._page(offset, after_id)}:limit:{limit}"
+    
+    def _build_count_key(self, category_id: int | None, generation: tuple[int, int]) -> str:
+        """상품 개수 키"""
+        return f"count:{self._scope(category_id)}:gen:{generation[0]}.{generation[1]}"
+    
+    @staticmethod
+    def _build_product_key(product_id: int) -> str:
+        """상품 단건 키"""
+        return f"product:{product_id}"
+    
+    @staticmethod
+    def _build_coupon_key(coupon_code: str) -> str:
+        """쿠폰 키"""
+        return f"coupon:{coupon_code}"
+
+
+_memory_store: MemoryCacheStore | None = None
+
+
+def get_memory_cache_store() -> MemoryCacheStore:
+    """프로세스 내 캐시 저장소 싱글톤 (워커 단위)"""
+    global _memory_store
+    
+    if _memory_store is None:
+        _memory_store = MemoryCacheStore(
+            LocalCache(
+                max_entries=settings.cache_memory_max_entries,
+                max_bytes=settings.cache_memory_max_bytes,
+                default_ttl=settings.cache_ttl,
+            )
+        )
+    return _memory_store
@@ -1,56 +1,155 @@
 """Redis Cache Adapter (Outbound Adapter)"""
 
-import json
 import logging
-import redis.asyncio as redis
+import random
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Protocol, TypeVar
+
+from app.domain.entities.coupon import Coupon
 from app.domain.entities.product import Product
+from app.domain.ports.cache_adapter import CacheEntry
+from app.infrastructure.adapters.cache.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.infrastructure.adapters.cache.codec import (
+    COUNT,
+    COUPON,
+    PRODUCT,
+    PRODUCT_IDS,
+    CacheCodec,
+    JsonCodec,
+    UnsupportedCacheFormat,
+    ValueSchema,
+    decode_entry,
+)
+from app.infrastructure.adapters.cache.compression import PayloadCompressor, decompress
+
+T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
+# (캐시 키, 값 종류, 값, Hard TTL, 키 최대 유지 시간(초) 또는 None)
+WriteItem = tuple[str, ValueSchema, Any, int, float | None]
+
+
+class RedisCommands(Protocol):
+    """RedisCacheAdapter가 사용하는 Redis 명령 (redis.Redis 또는 AutoPipeline)"""
+    
+    def get(self, name: str, /) -> Awaitable[bytes | str | None]: ...
+    
+    def mget(self, keys: list[str], /) -> Awaitable[list[bytes | str | None]]: ...
+    
+    def setex(self, name: str, time: int, value: bytes | str, /) -> Awaitable[Any]: ...
+    
+    def delete(self, *names: str) -> Awaitable[int]: ...
+    
+    def pipeline(self, transaction: bool = True) -> Any: ...
+
 
 class RedisCacheAdapter:
-    """Redis 캐시 어댑터 - 상품 리스트 캐싱"""
+    """
+    Redis 캐시 어댑터 - 상품 리스트/상품 단건/쿠폰 캐싱
+    
+    값은 신선도 메타데이터(저장 시각, Soft/Hard TTL 만료 시각, 계산 소요 시간)와 함께 저장하며,
+    저장 형식은 codec이 결정합니다 (envelope JSON 또는 행 배열). 조회 시에는 형식을 자동 판별합니다.
+    compressor를 지정하면 큰 값은 압축해서 저장하며, 압축 여부도 첫 바이트 마커로 자동 판별합니다.
+    
+    Redis 키 자체는 Hard TTL + stale_ttl 동안 유지되어, DB 장애 시 마지막 정상 값으로 사용할 수 있습니다.
+    ttl_jitter를 지정하면 저장할 때마다 TTL을 무작위로 줄여, 함께 저장된 키들이 동시에 만료되지 않도록 합니다.
+    
+    상품 목록은 정규화하여 저장합니다. 목록 키에는 정렬된 상품 ID만 저장하고, 상품은 상품 단건 키
+    (`products:item:{id}`)에 하나씩 저장해 모든 페이지가 공유합니다. 상품 단건 키가 갱신되면
+    그 상품이 포함된 모든 페이지에 바로 반영됩니다.
+    
+    목록/개수 키에는 세대(generation) 번호 `gen:{전체}.{범위}`가 포함됩니다. 세대 카운터는 전체 1개와
+    범위(카테고리별, 카테고리 미지정 목록)별 1개씩이며, 카운터를 올리면 관련 키 전체가 O(1)로 무효화됩니다
+    (이전 세대 키는 조회되지 않고 TTL로 사라짐). 두 세대가 모두 0이면 세대 도입 이전 키 형식과 같습니다.
+    
+    상품 단건/쿠폰은 "존재하지 않음"을 값 None으로 negative_ttl 동안 저장하여 반복되는 404 조회가 DB에 닿지 않도록 합니다.
+    
+    직렬화된 목록 응답(`products:response:...`)은 목록 키와 같은 세대 번호를 사용하고, 응답에 포함된 상품마다
+    태그 집합(`products:response-tags:{id}`)에 응답 키를 기록합니다. delete_products는 상품 단건 키와 함께
+    태그된 응답 키를 삭제합니다. 응답은 response_ttl 동안만 보관하며 오래된 응답은 제공하지 않습니다.
+    
+    breaker를 지정하면 모든 Redis 호출이 Circuit Breaker를 거칩니다. 회로가 열려 있으면 Redis를 호출하지 않고
+    조회는 즉시 미스, 저장은 생략합니다 (경고 로그 없음).
+    """
     
-    def __init__(self, redis_client: redis.Redis, ttl: int = 300):
+    def __init__(
+        self,
+        redis_client: RedisCommands,
+        ttl: int = 300,
+        soft_ttl: int | None = None,
+        stale_ttl: int = 0,
+        ttl_jitter: float = 0.0,
+        negative_ttl: int = 30,
+        codec: CacheCodec | None = None,
+        compressor: PayloadCompressor | None = None,
+        breaker: CircuitBreaker | None = None,
+        response_ttl: int = 60,
+    ):
         """
         Args:
-            redis_client: Redis 클라이언트
-            ttl: 캐시 TTL (초 단위, 기본 5분)
+            redis_client: Redis 클라이언트 (AutoPipeline 래퍼 포함)
+            ttl: 캐시 TTL (Hard TTL, 초 단위, 기본 5분)
+            soft_ttl: Soft TTL (초 단위, None이면 ttl과 동일 - 백그라운드 갱신 구간 없음)
+            stale_ttl: Hard TTL 이후에도 장애 대비용으로 값을 보관하는 시간 (초 단위)
+            ttl_jitter: TTL 감소 비율 상한 (0.0 ~ 1.0, 예: 0.1이면 TTL의 0~10%를 무작위로 줄임)
+            negative_ttl: 부정 캐시(존재하지 않는 상품/쿠폰) TTL (초 단위, 기본 30초)
+            codec: 저장 형식 (None이면 envelope JSON)
+            compressor: 큰 값 압축기 (None이면 압축하지 않음, 압축된 값 읽기는 항상 지원)
+            breaker: Redis 호출 Circuit Breaker (None이면 사용하지 않음)
+            response_ttl: 직렬화된 목록 응답 TTL (초 단위, 0이면 응답 캐시 비활성화)
         """
         self.redis_client = redis_client
         self.ttl = ttl
+        self.soft_ttl = ttl if soft_ttl is None else min(soft_ttl, ttl)
+        self.stale_ttl = stale_ttl
+        self.ttl_jitter = min(max(ttl_jitter, 0.0), 1.0)
+        self.negative_ttl = negative_ttl
+        self.codec = codec or JsonCodec()
+        self.compressor = compressor
+        self.breaker = breaker
+        self.response_ttl = response_ttl
+        # 범위별 조회 시점 세대 (조회 후 DB 조회 중에 무효화되면 이전 세대 키에 저장되도록 조회 시점 값 사용)
+        self._generations: dict[str, tuple[int, int]] = {}
     
     async def get_product_list(
         self,
         category_id: int | None = None,
         offset: int = 0,
         limit: int = 20,
-    ) -> list[Product] | None:
-        """캐시에서 상품 목록 조회"""
-        try:
-            cache_key = self._build_list_cache_key(category_id, offset, limit)
-            cached_data = await self.redis_client.get(cache_key)
-            
-            if cached_data:
-                # JSON 역직렬화 후 Product Entity로 변환
-                data_list = json.loads(cached_data)
-                products = [
-                    Product(
-                        id=item["id"],
-                        name=item["name"],
-                        price=item["price"],
-                        stock=item["stock"],
-                        category_id=item["category_id"],
-                        discount_rate=item["discount_rate"],
-                    )
-                    for item in data_list
-                ]
-                return products
-            
+        after_id: int | None = None,
+    ) -> CacheEntry[list[Product]] | None:
+        """
+        캐시에서 상품 목록 조회 (ID 목록 GET + 상품 단건 MGET)
+        
+        페이지의 상품 중 하나라도 캐시에 없거나 부정 항목이면 페이지 전체를 미스로 처리합니다.
+        신선도는 ID 목록 항목을 따릅니다 (상품 단건 항목은 항상 그보다 같거나 최신).
+        """
+        generation = await self._read_generation(category_id)
+        if generation is None:
             return None
-        except Exception as e:
-            logger.warning(f"Redis 캐시 조회 실패: {e}")
+        cache_key = self._build_list_cache_key(category_id, offset, limit, generation, after_id)
+        ids_entry = await self._read(cache_key, PRODUCT_IDS)
+        if ids_entry is None:
             return None
+        
+        product_ids = ids_entry.value
+        product_entries = await self.get_products(product_ids) if product_ids else {}
+        products = []
+        for product_id in product_ids:
+            entry = product_entries.get(product_id)
+            if entry is None or entry.value is None:
+                return None
+            products.append(entry.value)
+        
+        return CacheEntry(
+            value=products,
+            stored_at=ids_entry.stored_at,
+            fresh_until=ids_entry.fresh_until,
+            expires_at=ids_entry.expires_at,
+            compute_time=ids_entry.compute_time,
+        )
     
     async def set_product_list(
         self,
@@ -58,88 +157,450 @@ class RedisCacheAdapter:
         category_id: int | None = None,
         offset: int = 0,
         limit: int = 20,
+        after_id: int | None = None,
+        compute_time: float = 0.0,
     ) -> None:
-        """상품 목록을 캐시에 저장"""
-        try:
-            cache_key = self._build_list_cache_key(category_id, offset, limit)
-            # Product Entity를 JSON으로 직렬화
-            data = [
-                {
-                    "id": p.id,
-                    "name": p.name,
-                    "price": p.price,
-                    "stock": p.stock,
-                    "category_id": p.category_id,
-                    "discount_rate": p.discount_rate,
-                }
-                for p in products
-            ]
-            await self.redis_client.setex(
-                cache_key,
-                self.ttl,
-                json.dumps(data),
-            )
-        except Exception as e:
-            logger.warning(f"Redis 캐시 저장 실패: {e}")
-            # 에러를 발생시키지 않고 조용히 실패 (fallback to DB)
+        """상품 목록을 캐시에 저장 (ID 목록 + 상품 단건, 파이프라인 1회)"""
+        generation = await self._generation_for_write(category_id)
+        if generation is None:
+            return
+        cache_key = self._build_list_cache_key(category_id, offset, limit, generation, after_id)
+        items: list[WriteItem] = [(cache_key, PRODUCT_IDS, [p.id for p in products], self.ttl, None)]
+        items += [
+            (self._build_product_cache_key(p.id), PRODUCT, p, self.ttl, None)
+            for p in products
+        ]
+        await self._write_many(items, compute_time)
     
     async def get_product_count(
         self,
         category_id: int | None = None,
-    ) -> int | None:
+    ) -> CacheEntry[int] | None:
         """캐시에서 상품 개수 조회"""
+        generation = await self._read_generation(category_id)
+        if generation is None:
+            return None
+        cache_key = self._build_count_cache_key(category_id, generation)
+        return await self._read(cache_key, COUNT)
+    
+    async def set_product_count(
+        self,
+        count: int,
+        category_id: int | None = None,
+        compute_time: float = 0.0,
+    ) -> None:
+        """상품 개수를 캐시에 저장"""
+        generation = await self._generation_for_write(category_id)
+        if generation is None:
+            return
+        cache_key = self._build_count_cache_key(category_id, generation)
+        await self._write(cache_key, COUNT, count, compute_time)
+    
+    async def get_list_response(
+        self,
+        category_id: int | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        after_id: int | None = None,
+    ) -> bytes | None:
+        """직렬화된 목록 응답 조회 (역직렬화 없이 저장한 바이트 반환, 실패 시 None)"""
+        if self.response_ttl <= 0:
+            return None
+        generation = await self._read_generation(category_id)
+        if generation is None:
+            return None
+        cache_key = self._build_response_cache_key(category_id, offset, limit, generation, after_id)
         try:
-            cache_key = self._build_count_cache_key(category_id)
-            cached_data = await self.redis_client.get(cache_key)
-            
-            if cached_data:
-                return int(cached_data)
-            
+            payload = await self._call(lambda: self.redis_client.get(cache_key))
+            if not payload:
+                return None
+            if isinstance(payload, str):
+                payload = payload.encode()
+            return self.compressor.decompress(payload) if self.compressor else decompress(payload)
+        except CircuitOpenError:
             return None
         except Exception as e:
             logger.warning(f"Redis 캐시 조회 실패: {e}")
             return None
     
-    async def set_product_count(
+    async def set_list_response(
         self,
-        count: int,
+        payload: bytes,
+        product_ids: list[int],
         category_id: int | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        after_id: int | None = None,
     ) -> None:
-        """상품 개수를 캐시에 저장"""
+        """
+        직렬화된 목록 응답 저장 + 상품별 태그 집합에 응답 키 추가 (파이프라인 1회)
+        
+        태그 집합은 응답과 같은 TTL로 갱신되어, 해당 상품이 새 응답에 포함되지 않으면 함께 사라집니다.
+        """
+        if self.response_ttl <= 0:
+            return
+        generation = await self._generation_for_write(category_id)
+        if generation is None:
+            return
+        cache_key = self._build_response_cache_key(category_id, offset, limit, generation, after_id)
+        ttl = max(1, int(self.response_ttl * self._jitter_scale()))
         try:
-            cache_key = self._build_count_cache_key(category_id)
-            await self.redis_client.setex(
-                cache_key,
-                self.ttl,
-                str(count),
-            )
+            if self.compressor is not None:
+                payload = self.compressor.compress(payload)
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.setex(cache_key, ttl, payload)
+            for product_id in product_ids:
+                tag_key = self._build_response_tag_key(product_id)
+                pipe.sadd(tag_key, cache_key)
+                pipe.expire(tag_key, self.response_ttl)
+            await self._call(pipe.execute)
+        except CircuitOpenError:
+            pass
+        except Exception as e:
+            logger.warning(f"Redis 캐시 저장 실패: {e}")
+    
+    async def get_products(
+        self,
+        product_ids: list[int],
+    ) -> dict[int, CacheEntry[Product | None]]:
+        """상품 단건 캐시 일괄 조회 (MGET 1회, 캐시에 없는 ID는 결과에서 제외)"""
+        if not product_ids:
+            return {}
+        
+        try:
+            keys = [self._build_product_cache_key(product_id) for product_id in product_ids]
+            values = await self._call(lambda: self.redis_client.mget(keys))
+        except CircuitOpenError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Redis 캐시 조회 실패: {e}")
+            return {}
+        
+        entries: dict[int, CacheEntry[Product | None]] = {}
+        for product_id, raw in zip(product_ids, values):
+            if not raw:
+                continue
+            entry = self._decode(raw, PRODUCT, f"product_id={product_id}")
+            if entry is not None:
+                entries[product_id] = entry
+        return entries
+    
+    async def set_products(
+        self,
+        products: list[Product],
+        missing_ids: list[int] | None = None,
+        compute_time: float = 0.0,
+    ) -> None:
+        """상품 단건 캐시 일괄 저장 (파이프라인 1회, missing_ids는 부정 항목)"""
+        items: list[WriteItem] = [
+            (self._build_product_cache_key(p.id), PRODUCT, p, self.ttl, None)
+            for p in products
+        ]
+        items += [
+            (self._build_product_cache_key(product_id), PRODUCT, None, self.negative_ttl, None)
+            for product_id in missing_ids or []
+        ]
+        await self._write_many(items, compute_time)
+    
+    async def get_coupon(
+        self,
+        coupon_code: str,
+    ) -> CacheEntry[Coupon | None] | None:
+        """캐시에서 쿠폰 조회"""
+        cache_key = self._build_coupon_cache_key(coupon_code)
+        return await self._read(cache_key, COUPON)
+    
+    async def set_coupon(
+        self,
+        coupon_code: str,
+        coupon: Coupon | None,
+        compute_time: float = 0.0,
+    ) -> None:
+        """
+        쿠폰을 캐시에 저장
+        
+        유효 종료일(valid_to)이 있으면 Redis 키가 그 이후까지 남지 않도록 TTL을 줄입니다.
+        이미 종료된 쿠폰은 더 바뀔 일이 없으므로 부정 항목과 같은 짧은 TTL로 저장합니다.
+        """
+        cache_key = self._build_coupon_cache_key(coupon_code)
+        item: WriteItem
+        if coupon is None:
+            item = (cache_key, COUPON, None, self.negative_ttl, None)
+        elif coupon.valid_to is None:
+            item = (cache_key, COUPON, coupon, self.ttl, None)
+        else:
+            remaining = (coupon.valid_to - datetime.now()).total_seconds()
+            if remaining < 1:
+                item = (cache_key, COUPON, coupon, self.negative_ttl, None)
+            else:
+                item = (cache_key, COUPON, coupon, self.ttl, remaining)
+        await self._write_many([item], compute_time)
+    
+    async def invalidate_product_lists(
+        self,
+        category_ids: list[int] | None = None,
+    ) -> None:
+        """
+        세대 카운터 증가로 상품 목록/개수 캐시 무효화 (SCAN/DEL 없음)
+        
+        Raises:
+            Exception: Redis 오류 (무효화 실패는 호출자가 알 수 있어야 하므로 전파)
+        """
+        if category_ids is None:
+            keys = [self._build_generation_key(None, global_scope=True)]
+        else:
+            # 카테고리 미지정 목록에도 해당 카테고리 상품이 포함되므로 함께 무효화
+            keys = [self._build_generation_key(None)]
+            keys += [self._build_generation_key(category_id) for category_id in category_ids]
+        
+        pipe = self.redis_client.pipeline(transaction=False)
+        for key in keys:
+            pipe.incr(key)
+        await self._call(pipe.execute)
+        self._generations.clear()
+    
+    async def delete_products(
+        self,
+        product_ids: list[int],
+    ) -> None:
+        """
+        상품 단건 캐시 삭제 + 해당 상품이 포함된 목록 응답 삭제 (태그 집합 조회 1회 + DEL 1회)
+        
+        Raises:
+            Exception: Redis 오류
+        """
+        if not product_ids:
+            return
+        keys = [self._build_product_cache_key(product_id) for product_id in product_ids]
+        if self.response_ttl > 0:
+            tag_keys = [self._build_response_tag_key(product_id) for product_id in product_ids]
+            pipe = self.redis_client.pipeline(transaction=False)
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            tagged = await self._call(pipe.execute)
+            keys += tag_keys
+            keys += sorted({key for members in tagged for key in members})
+        await self._call(lambda: self.redis_client.delete(*keys))
+    
+    async def _read_generation(self, category_id: int | None) -> tuple[int, int] | None:
+        """전체/범위 세대 조회 (MGET 1회, 실패 시 None)"""
+        keys = [
+            self._build_generation_key(None, global_scope=True),
+            self._build_generation_key(category_id),
+        ]
+        try:
+            values = await self._call(lambda: self.redis_client.mget(keys))
+        except CircuitOpenError:
+            return None
+        except Exception as e:
+            logger.warning(f"Redis 캐시 세대 조회 실패: {e}")
+            return None
+        generation = (int(values[0] or 0), int(values[1] or 0))
+        self._generations[self._build_generation_key(category_id)] = generation
+        return generation
+    
+    async def _generation_for_write(self, category_id: int | None) -> tuple[int, int] | None:
+        """저장용 세대 (같은 어댑터로 조회한 적이 있으면 조회 시점 값)"""
+        generation = self._generations.get(self._build_generation_key(category_id))
+        if generation is not None:
+            return generation
+        return await self._read_generation(category_id)
+    
+    async def _read(
+        self,
+        cache_key: str,
+        schema: ValueSchema,
+    ) -> CacheEntry | None:
+        """캐시 조회 후 해석 (실패 시 None - fallback to DB)"""
+        try:
+            cached_data = await self._call(lambda: self.redis_client.get(cache_key))
+        except CircuitOpenError:
+            return None
+        except Exception as e:
+            logger.warning(f"Redis 캐시 조회 실패: {e}")
+            return None
+        if not cached_data:
+            return None
+        return self._decode(cached_data, schema, cache_key)
+    
+    async def _write(
+        self,
+        cache_key: str,
+        schema: ValueSchema,
+        value: Any,
+        compute_time: float = 0.0,
+    ) -> None:
+        """신선도 메타데이터와 함께 저장 (실패해도 예외를 발생시키지 않음)"""
+        try:
+            ttl, payload = self._encode_entry(schema, value, self.ttl, None, compute_time)
+            await self._call(lambda: self.redis_client.setex(cache_key, ttl, payload))
+        except CircuitOpenError:
+            pass
         except Exception as e:
             logger.warning(f"Redis 캐시 저장 실패: {e}")
             # 에러를 발생시키지 않고 조용히 실패 (fallback to DB)
     
+    async def _write_many(
+        self,
+        items: list[WriteItem],
+        compute_time: float = 0.0,
+    ) -> None:
+        """
+        여러 키를 파이프라인 1회로 저장 (실패해도 예외를 발생시키지 않음)
+        
+        Args:
+            items: (캐시 키, 값 종류, 값, Hard TTL, 키 최대 유지 시간(초) 또는 None) 목록
+            compute_time: 값 계산 소요 시간 (초 단위)
+        """
+        if not items:
+            return
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for cache_key, schema, value, base_ttl, expire_within in items:
+                ttl, payload = self._encode_entry(schema, value, base_ttl, expire_within, compute_time)
+                pipe.setex(cache_key, ttl, payload)
+            await self._call(pipe.execute)
+        except CircuitOpenError:
+            pass
+        except Exception as e:
+            logger.warning(f"Redis 캐시 저장 실패: {e}")
+    
+    async def _call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Redis 호출 (breaker가 있으면 회로를 거침)
+        
+        Raises:
+            CircuitOpenError: 회로가 열려 있을 때 (Redis를 호출하지 않음)
+        """
+        if self.breaker is None:
+            return await fn()
+        return await self.breaker.call(fn)
+    
+    def _encode_entry(
+        self,
+        schema: ValueSchema,
+        value: Any,
+        base_ttl: int,
+        expire_within: float | None,
+        compute_time: float,
+    ) -> tuple[int, bytes]:
+        """
+        신선도 메타데이터 계산 및 직렬화
+        
+        Returns:
+            (Redis 키 TTL, 직렬화된 값)
+        """
+        now = time.time()
+        scale = self._jitter_scale()
+        ttl = max(1, int(base_ttl * scale))
+        key_ttl = ttl + self.stale_ttl
+        if expire_within is not None:
+            # 키가 expire_within 이후까지 남지 않도록 Hard TTL과 stale 구간을 함께 줄임
+            key_ttl = min(key_ttl, max(1, int(expire_within)))
+            ttl = min(ttl, key_ttl)
+        entry = CacheEntry(
+            value=value,
+            stored_at=now,
+            fresh_until=now + min(self.soft_ttl * scale, ttl),
+            expires_at=now + ttl,
+            compute_time=compute_time,
+        )
+        payload = self.codec.encode(schema, entry)
+        if self.compressor is not None:
+            payload = self.compressor.compress(payload)
+        return key_ttl, payload
+    
+    def _decode(self, raw: bytes | str, schema: ValueSchema, context: str) -> CacheEntry | None:
+        """
+        저장된 값을 CacheEntry로 변환 (해석할 수 없으면 None - 캐시 미스로 처리)
+        
+        envelope 도입 이전 형식(JSON 배열, 숫자 문자열)은 신선한 값으로 간주합니다 (롤링 배포 호환).
+        """
+        try:
+            if isinstance(raw, bytes):
+                raw = self.compressor.decompress(raw) if self.compressor else decompress(raw)
+            return decode_entry(raw, schema, self.soft_ttl, self.ttl, time.time())
+        except UnsupportedCacheFormat as e:
+            # 새 버전 워커가 저장한 형식 - 롤링 배포 중에는 정상이므로 조용히 미스 처리
+            logger.debug(f"해석할 수 없는 캐시 형식 ({context}): {e}")
+        except Exception as e:
+            logger.warning(f"Redis 캐시 해석 실패 ({context}): {e}")
+        return None
+    
+    def _jitter_scale(self) -> float:
+        """TTL 배율 (1.0 - jitter ~ 1.0) - 설정된 TTL을 넘기지 않도록 줄이는 방향으로만 적용"""
+        if self.ttl_jitter <= 0:
+            return 1.0
+        return 1.0 - random.uniform(0.0, self.ttl_jitter)
+    
     def _build_list_cache_key(
         self,
         category_id: int | None = None,
         offset: int = 0,
         limit: int = 20,
+        generation: tuple[int, int] = (0, 0),
+        after_id: int | None = None,
     ) -> str:
-        """상품 목록 캐시 키 생성"""
-        parts = ["products", "list"]
+        """상품 목록(ID 목록) 캐시 키 생성 (키셋 페이지는 offset 대신 after)"""
+        parts = ["products", "ids"]
+        if generation != (0, 0):
+            parts.append(f"gen:{generation[0]}.{generation[1]}")
         if category_id:
             parts.append(f"category:{category_id}")
-        parts.append(f"offset:{offset}")
+        parts.append(f"after:{after_id}" if after_id is not None else f"offset:{offset}")
         parts.append(f"limit:{limit}")
         return ":".join(parts)
     
     def _build_count_cache_key(
         self,
         category_id: int | None = None,
+        generation: tuple[int, int] = (0, 0),
     ) -> str:
         """상품 개수 캐시 키 생성"""
         parts = ["products", "count"]
+        if generation != (0, 0):
+            parts.append(f"gen:{generation[0]}.{generation[1]}")
         if category_id:
             parts.append(f"category:{category_id}")
         else:
             parts.append("all")
         return ":".join(parts)
-
+    
+    def _build_response_cache_key(
+        self,
+        category_id: int | None,
+        offset: int,
+        limit: int,
+        generation: tuple[int, int],
+        after_id: int | None = None,
+    ) -> str:
+        """직렬화된 목록 응답 캐시 키 생성 (목록 키와 같은 세대 사용)"""
+        parts = ["products", "response", f"gen:{generation[0]}.{generation[1]}"]
+        parts.append(f"category:{category_id}" if category_id else "all")
+        parts.append(f"after:{after_id}" if after_id is not None else f"offset:{offset}")
+        parts.append(f"limit:{limit}")
+        return ":".join(parts)
+    
+    def _build_response_tag_key(self, product_id: int) -> str:
+        """상품별 목록 응답 태그 집합 키 생성"""
+        return f"products:response-tags:{product_id}"
+    
+    def _build_generation_key(
+        self,
+        category_id: int | None = None,
+        global_scope: bool = False,
+    ) -> str:
+        """세대 카운터 키 생성 (전체 / 카테고리별 / 카테고리 미지정 목록)"""
+        if global_scope:
+            return "products:gen:global"
+        if category_id:
+            return f"products:gen:category:{category_id}"
+        return "products:gen:all"
+    
+    def _build_product_cache_key(self, product_id: int) -> str:
+        """상품 단건 캐시 키 생성"""
+        return f"products:item:{product_id}"
+    
+    def _build_coupon_cache_key(self, coupon_code: str) -> str:
+        """쿠폰 캐시 키 생성"""
+        return f"coupons:code:{coupon_code}"
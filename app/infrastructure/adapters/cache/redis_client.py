@@ -1,74 +1,213 @@
-"""Redis Client - 싱글톤 Redis 클라이언트 생성"""
+"""Redis Client - 커넥션 풀을 관리하는 Redis 연결 관리자"""
 
 import asyncio
 import logging
+from typing import Callable
 
 import redis.asyncio as redis
 
+from app.infrastructure.monitoring.metrics import MetricsRegistry, metrics as default_metrics
 from app.infrastructure.settings.config import settings
 
 logger = logging.getLogger(__name__)
 
-_redis_client: redis.Redis | None = None
-_lock = asyncio.Lock()  # Race condition 방지를 위한 락
+# Redis가 사용 가능해질 때(최초 연결, 재연결) 호출되는 리스너
+AvailabilityListener = Callable[[redis.Redis], None]
 
 
-async def get_redis_client() -> redis.Redis | None:
+class RedisConnectionManager:
     """
-    Redis 클라이언트 싱글톤 생성
+    Redis 연결 관리자 (워커 단위)
     
-    Returns:
-        Redis 클라이언트 인스턴스 또는 None (연결 실패 시)
+    - 크기가 정해진 커넥션 풀(BlockingConnectionPool)을 가진 클라이언트 1개를 공유합니다.
+      풀이 가득 차면 예외 대신 pool_timeout까지 빈 연결을 기다립니다.
+    - 백그라운드 헬스 체크가 주기적으로 PING하여 가용 여부를 갱신합니다.
+    - 요청 경로(get_client)는 락/PING 없이 상태 플래그만 확인합니다.
+    - 연결이 끊어지면 헬스 체크 태스크가 지수 백오프로 재연결하며, 그동안 get_client는 즉시 None을 반환합니다.
+    
+    클라이언트 객체는 재연결 후에도 그대로 유지되므로 구독/집계 태스크가 가진 참조도 계속 유효합니다.
+    시작 시 Redis가 없어도 add_listener로 등록한 리스너가 연결되는 시점에 호출되므로
+    구독/집계 태스크를 그때 시작할 수 있습니다.
     """
-    global _redis_client
     
-    # Redis가 비활성화되어 있으면 None 반환
-    if not settings.redis_enabled:
-        return None
+    def __init__(
+        self,
+        url: str,
+        max_connections: int = 50,
+        pool_timeout: float = 1.0,
+        socket_timeout: float | None = 1.0,
+        health_check_interval: float = 5.0,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        metrics: MetricsRegistry | None = None,
+    ):
+        """
+        Args:
+            url: Redis URL
+            max_connections: 커넥션 풀 최대 연결 수
+            pool_timeout: 풀이 가득 찼을 때 빈 연결을 기다리는 시간 (초 단위)
+            socket_timeout: 명령 응답 대기 시간 (초 단위)
+            health_check_interval: 헬스 체크 주기 (초 단위)
+            backoff_base: 재연결 첫 대기 시간 (초 단위, 실패할 때마다 2배)
+            backoff_max: 재연결 최대 대기 시간 (초 단위)
+            metrics: 메트릭 레지스트리 (None이면 전역 레지스트리)
+        """
+        self.health_check_interval = health_check_interval
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.metrics = metrics or default_metrics
+        self.pool = redis.BlockingConnectionPool.from_url(
+            url,
+            max_connections=max_connections,
+            timeout=pool_timeout,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_timeout,
+            decode_responses=False,  # JSON 직렬화를 위해 bytes로 받음
+        )
+        self.client = redis.Redis(connection_pool=self.pool)
+        self.available = False
+        self._task: asyncio.Task | None = None
+        self._listeners: list[AvailabilityListener] = []
     
-    # Race condition 방지: 락을 사용하여 동시 접근 제어
-    async with _lock:
-        # 이미 생성된 클라이언트가 있고 연결되어 있으면 반환
-        if _redis_client is not None:
-            try:
-                # 연결 상태 확인
-                await _redis_client.ping()
-                return _redis_client
-            except Exception:
-                # 연결이 끊어진 경우 클라이언트 초기화
-                logger.warning("Redis 연결이 끊어졌습니다. 재연결을 시도합니다.")
-                _redis_client = None
+    @property
+    def started(self) -> bool:
+        return self._task is not None
+    
+    async def start(self) -> bool:
+        """
+        첫 연결 확인 후 헬스 체크 시작
         
+        Returns:
+            연결 성공 여부 (실패해도 헬스 체크가 백그라운드에서 재연결)
+        """
+        if self._task is None:
+            await self._check()
+            self._task = asyncio.create_task(self._run())
+        return self.available
+    
+    def add_listener(self, listener: AvailabilityListener) -> None:
+        """연결 리스너 등록 (이미 연결되어 있으면 즉시 호출)"""
+        self._listeners.append(listener)
+        if self.available:
+            self._notify(listener)
+    
+    def get_client(self) -> redis.Redis | None:
+        """사용 가능한 클라이언트 반환 (재연결 중이면 즉시 None)"""
+        return self.client if self.available else None
+    
+    async def close(self) -> None:
+        """헬스 체크 종료 및 풀의 모든 연결 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._set_available(False)
+        await self.client.aclose()
+        await self.pool.disconnect()
+    
+    async def _check(self) -> bool:
+        try:
+            await self.client.ping()
+            self._set_available(True)
+        except Exception as e:
+            if self.available:
+                logger.warning("Redis 연결이 끊어졌습니다. 재연결을 시도합니다: %s", e)
+            self._set_available(False)
+        return self.available
+    
+    async def _reconnect(self) -> None:
+        """지수 백오프로 재연결 (끊어진 연결은 풀에서 버리고 새로 연결)"""
+        delay = self.backoff_base
+        while True:
+            await asyncio.sleep(delay)
+            self.metrics.increment("redis.reconnect.attempts")
+            await self.pool.disconnect(inuse_connections=False)
+            if await self._check():
+                logger.info("Redis 재연결 성공")
+                return
+            delay = min(delay * 2, self.backoff_max)
+    
+    async def _run(self) -> None:
+        while True:
+            if not self.available:
+                await self._reconnect()
+            await asyncio.sleep(self.health_check_interval)
+            await self._check()
+    
+    def _set_available(self, available: bool) -> None:
+        became_available = available and not self.available
+        self.available = available
+        self.metrics.set_gauge("redis.available", 1 if available else 0)
+        if became_available:
+            for listener in self._listeners:
+                self._notify(listener)
+    
+    def _notify(self, listener: AvailabilityListener) -> None:
         try:
-            # Redis 클라이언트 생성
-            _redis_client = redis.from_url(
-                settings.redis_url,
-                encoding="utf-8",
-                decode_responses=False,  # JSON 직렬화를 위해 bytes로 받음
-            )
-            
-            # 연결 테스트
-            await _redis_client.ping()
-            logger.info("Redis 클라이언트 연결 성공")
-            
-            return _redis_client
+            listener(self.client)
         except Exception as e:
-            logger.warning("Redis 연결 실패: %s. DB로 fallback합니다.", e)
-            _redis_client = None
-            return None
+            logger.warning("Redis 연결 리스너 실행 실패: %s", e)
 
 
-async def close_redis_client() -> None:
-    """Redis 클라이언트 연결 종료"""
-    global _redis_client
+_manager: RedisConnectionManager | None = None
+_start_lock = asyncio.Lock()  # 첫 연결(느린 경로)에서만 사용
+
+
+def get_redis_manager() -> RedisConnectionManager | None:
+    """Redis 연결 관리자 싱글톤 (Redis가 비활성화되어 있으면 None)"""
+    global _manager
     
-    async with _lock:
-        if _redis_client is not None:
-            try:
-                await _redis_client.close()
-            except Exception as e:
-                logger.warning("Redis 클라이언트 종료 중 오류 발생: %s", e)
-            finally:
-                _redis_client = None
-                logger.info("Redis 클라이언트 연결 종료")
+    if not settings.redis_enabled:
+        return None
+    if _manager is None:
+        _manager = RedisConnectionManager(
+            settings.redis_url,
+            max_connections=settings.redis_max_connections,
+            pool_timeout=settings.redis_pool_timeout,
+            socket_timeout=settings.redis_socket_timeout,
+            health_check_interval=settings.redis_health_check_interval,
+            backoff_base=settings.redis_reconnect_backoff_base,
+            backoff_max=settings.redis_reconnect_backoff_max,
+        )
+    return _manager
+
 
+async def get_redis_client() -> redis.Redis | None:
+    """
+    Redis 클라이언트 반환
+    
+    애플리케이션 시작 후에는 락/PING 없이 상태 플래그만 확인합니다.
+    시작 전(CLI 등)에 호출되면 연결 관리자를 먼저 시작합니다.
+    
+    Returns:
+        Redis 클라이언트 인스턴스 또는 None (비활성화 또는 재연결 중)
+    """
+    manager = get_redis_manager()
+    if manager is None:
+        return None
+    
+    if not manager.started:
+        async with _start_lock:
+            if not manager.started:
+                if await manager.start():
+                    logger.info("Redis 클라이언트 연결 성공")
+                else:
+                    logger.warning("Redis 연결 실패. DB로 fallback합니다.")
+    return manager.get_client()
+
+
+async def close_redis_client() -> None:
+    """Redis 연결 관리자 종료"""
+    global _manager
+    
+    if _manager is not None:
+        try:
+            await _manager.close()
+        except Exception as e:
+            logger.warning("Redis 클라이언트 종료 중 오류 발생: %s", e)
+        finally:
+            _manager = None
+            logger.info("Redis 클라이언트 연결 종료")
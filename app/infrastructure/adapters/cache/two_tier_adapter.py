@@ -0,0 +1,387 @@
+"""Two-Tier Cache Adapter - 프로세스 내 L1 + Redis L2 (Outbound Adapter)"""
+
+import time
+from typing import Any, Awaitable, Callable, Iterable, TypeVar
+
+from app.domain.entities.coupon import Coupon
+from app.domain.entities.product import Product
+from app.domain.ports.cache_adapter import CacheAdapter, CacheEntry
+from app.infrastructure.adapters.cache.invalidation_bus import (
+    CacheInvalidationBus,
+    get_invalidation_bus,
+)
+from app.infrastructure.adapters.cache.local_cache import LocalCache
+from app.infrastructure.monitoring.metrics import MetricsRegistry, metrics as default_metrics
+from app.infrastructure.settings.config import settings
+
+T = TypeVar("T")
+
+
+class TwoTierCacheAdapter:
+    """
+    2단계 캐시 어댑터 - CacheAdapter Port 구현
+    
+    - L1: 워커 프로세스 내 LRU/TTL 캐시 (역직렬화된 Domain Entity를 그대로 보관)
+    - L2: Redis 캐시 어댑터 (워커 간 공유)
+    - 조회: L1 → L2 순서, L2 히트 시 L1에 채움
+    - 저장(캐시 미스 채우기): L2에 쓰고 자신의 L1에도 채움 (값이 바뀐 것이 아니므로 무효화 메시지를 발행하지 않음)
+    - 무효화(delete_products, invalidate_product_lists): L2 삭제/세대 증가 후 L1 항목 제거 및 다른 워커에 발행
+    - L1 목록 항목에는 포함된 상품 키를 태그로 붙여, 상품 무효화 시 그 상품이 포함된 목록만 제거
+    - 직렬화된 목록 응답은 `response:{범위}:...` 키에 두고 목록과 같은 범위로 무효화
+      (L2에서 읽은 응답은 포함된 상품 ID를 알 수 없으므로 상품 무효화 시 L1 응답은 모두 제거 - 응답 TTL이 짧음)
+    
+    채우기로 L1에 넣은 항목은 L1 TTL 동안 신선한 값으로 취급합니다 (L1 TTL은 Soft TTL보다 짧게 설정).
+    어댑터 생성(요청 시작) 이후 L1 무효화가 있었으면 DB에서 읽은 값이 무효화 이전 값일 수 있으므로 채우지 않습니다.
+    """
+    
+    def __init__(
+        self,
+        l1: LocalCache,
+        l2: CacheAdapter,
+        invalidation_bus: CacheInvalidationBus | None = None,
+        l1_ttl: float | None = None,
+        metrics: MetricsRegistry | None = None,
+    ):
+        """
+        Args:
+            l1: 프로세스 내 캐시
+            l2: 공유 캐시 어댑터 (RedisCacheAdapter)
+            invalidation_bus: 워커 간 무효화 버스 (선택적)
+            l1_ttl: L1 TTL (초 단위, None이면 l1.default_ttl)
+            metrics: 메트릭 레지스트리 (None이면 전역 레지스트리)
+        """
+        self.l1 = l1
+        self.l2 = l2
+        self.invalidation_bus = invalidation_bus
+        self.l1_ttl = l1_ttl
+        self.metrics = metrics or default_metrics
+        # 생성 시점의 L1 무효화 횟수 (이후 무효화가 있었으면 L1을 채우지 않음)
+        self._l1_epoch = l1.invalidations
+    
+    async def get_product_list(
+        self,
+        category_id: int | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        after_id: int | None = None,
+    ) -> CacheEntry[list[Product]] | None:
+        """L1 → L2 순서로 상품 목록 조회"""
+        key = self._build_list_key(category_id, offset, limit, after_id)
+        
+        async def l2_get() -> CacheEntry[list[Product]] | None:
+            return await self.l2.get_product_list(
+                category_id=category_id,
+                offset=offset,
+                limit=limit,
+                after_id=after_id,
+            )
+        
+        return await self._get(key, l2_get, tags=lambda entry: self._product_tags(entry.value))
+    
+    async def set_product_list(
+        self,
+        products: list[Product],
+        category_id: int | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        after_id: int | None = None,
+        compute_time: float = 0.0,
+    ) -> None:
+        """L2 저장 후 L1에 목록과 포함된 상품 채움"""
+        await self.l2.set_product_list(
+            products=products,
+            category_id=category_id,
+            offset=offset,
+            limit=limit,
+            after_id=after_id,
+            compute_time=compute_time,
+        )
+        for product in products:
+            self._fill(self._build_product_key(product.id), product)
+        self._fill(
+            self._build_list_key(category_id, offset, limit, after_id),
+            products,
+            tags=self._product_tags(products),
+        )
+        self._record_l1_gauges()
+    
+    async def get_product_count(
+        self,
+        category_id: int | None = None,
+    ) -> CacheEntry[int] | None:
+        """L1 → L2 순서로 상품 개수 조회"""
+        key = self._build_count_key(category_id)
+        
+        async def l2_get() -> CacheEntry[int] | None:
+            return await self.l2.get_product_count(category_id=category_id)
+        
+        return await self._get(key, l2_get)
+    
+    async def set_product_count(
+        self,
+        count: int,
+        category_id: int | None = None,
+        compute_time: float = 0.0,
+    ) -> None:
+        """L2 저장 후 L1 채움"""
+        await self.l2.set_product_count(count=count, category_id=category_id, compute_time=compute_time)
+        self._fill(self._build_count_key(category_id), count)
+        self._record_l1_gauges()
+    
+    async def get_list_response(
+        self,
+        category_id: int | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        after_id: int | None = None,
+    ) -> bytes | None:
+        """L1 → L2 순서로 직렬화된 목록 응답 조회"""
+        key = self._build_response_key(category_id, offset, limit, after_id)
+        
+        async def l2_get() -> bytes | None:
+            return await self.l2.get_list_response(
+                category_id=category_id,
+                offset=offset,
+                limit=limit,
+                after_id=after_id,
+            )
+        
+        return await self._get(key, l2_get)
+    
+    async def set_list_response(
+        self,
+        payload: bytes,
+        product_ids: list[int],
+        category_id: int | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        after_id: int | None = None,
+    ) -> None:
+        """L2 저장 후 L1 채움"""
+        await self.l2.set_list_response(
+            payload,
+            product_ids,
+            category_id=category_id,
+            offset=offset,
+            limit=limit,
+            after_id=after_id,
+        )
+        if self.l1.invalidations == self._l1_epoch:
+            self.l1.set(self._build_response_key(category_id, offset, limit, after_id), payload, ttl=self.l1_ttl)
+            self._record_l1_gauges()
+    
+    async def get_products(
+        self,
+        product_ids: list[int],
+    ) -> dict[int, CacheEntry[Product | None]]:
+        """L1에서 찾지 못한 상품만 L2에서 한 번에 조회"""
+        entries: dict[int, CacheEntry[Product | None]] = {}
+        l1_misses: list[int] = []
+        for product_id in product_ids:
+            cached = self.l1.get(self._build_product_key(product_id))
+            if cached is not None:
+                entries[product_id] = cached
+            else:
+                l1_misses.append(product_id)
+        self.metrics.increment("cache.l1.hits", len(entries))
+        self.metrics.increment("cache.l1.misses", len(l1_misses))
+        if not l1_misses:
+            return entries
+        
+        l2_entries = await self.l2.get_products(l1_misses)
+        self.metrics.increment("cache.l2.hits", len(l2_entries))
+        self.metrics.increment("cache.l2.misses", len(l1_misses) - len(l2_entries))
+        for product_id, entry in l2_entries.items():
+            self.l1.set(self._build_product_key(product_id), entry, ttl=self.l1_ttl)
+            entries[product_id] = entry
+        self._record_l1_gauges()
+        return entries
+    
+    async def set_products(
+        self,
+        products: list[Product],
+        missing_ids: list[int] | None = None,
+        compute_time: float = 0.0,
+    ) -> None:
+        """L2 저장 후 L1 채움 (missing_ids는 부정 항목)"""
+        await self.l2.set_products(products, missing_ids=missing_ids, compute_time=compute_time)
+        for product in products:
+            self._fill(self._build_product_key(product.id), product)
+        for product_id in missing_ids or []:
+            self._fill(self._build_product_key(product_id), None)
+        self._record_l1_gauges()
+    
+    async def get_coupon(
+        self,
+        coupon_code: str,
+    ) -> CacheEntry[Coupon | None] | None:
+        """L1 → L2 순서로 쿠폰 조회"""
+        key = self._build_coupon_key(coupon_code)
+        
+        async def l2_get() -> CacheEntry[Coupon | None] | None:
+            return await self.l2.get_coupon(coupon_code)
+        
+        return await self._get(key, l2_get)
+    
+    async def set_coupon(
+        self,
+        coupon_code: str,
+        coupon: Coupon | None,
+        compute_time: float = 0.0,
+    ) -> None:
+        """L2 저장 후 L1 채움"""
+        await self.l2.set_coupon(coupon_code, coupon, compute_time=compute_time)
+        self._fill(self._build_coupon_key(coupon_code), coupon)
+        self._record_l1_gauges()
+    
+    async def invalidate_product_lists(
+        self,
+        category_ids: list[int] | None = None,
+    ) -> None:
+        """L2 세대 증가 후 L1 목록/개수 항목 제거 및 무효화 발행"""
+        await self.l2.invalidate_product_lists(category_ids)
+        
+        if category_ids is None:
+            keys, prefixes = [], ["list:", "count:", "response:"]
+        else:
+            scopes = ["all"] + [f"category:{category_id}" for category_id in category_ids]
+            keys = [f"count:{scope}" for scope in scopes]
+            prefixes = [f"{kind}:{scope}:" for scope in scopes for kind in ("list", "response")]
+        
+        self.l1.invalidate(keys, prefixes)
+        self._record_l1_gauges()
+        if self.invalidation_bus is not None:
+            await self.invalidation_bus.publish(keys=keys, prefixes=prefixes)
+    
+    async def delete_products(
+        self,
+        product_ids: list[int],
+    ) -> None:
+        """
+        L2 삭제 후 L1 제거 및 무효화 발행
+        
+        L1 목록 항목은 상품을 복사해 보관하므로 상품 키를 태그로 가진 L1 목록도 함께 제거합니다
+        (L2 목록은 ID만 보관하므로 유지). L1 응답은 포함된 상품을 알 수 없어 모두 제거합니다.
+        """
+        if not product_ids:
+            return
+        await self.l2.delete_products(product_ids)
+        
+        keys = [self._build_product_key(product_id) for product_id in product_ids]
+        prefixes = ["response:"]
+        self.l1.invalidate(keys, prefixes)
+        self._record_l1_gauges()
+        if self.invalidation_bus is not None:
+            await self.invalidation_bus.publish(keys=keys, prefixes=prefixes)
+    
+    async def _get(
+        self,
+        key: str,
+        l2_get: Callable[[], Awaitable[T | None]],
+        tags: Callable[[T], Iterable[str]] | None = None,
+    ) -> T | None:
+        cached: T | None = self.l1.get(key)
+        if cached is not None:
+            self.metrics.increment("cache.l1.hits")
+            return cached
+        self.metrics.increment("cache.l1.misses")
+        
+        value = await l2_get()
+        if value is None:
+            self.metrics.increment("cache.l2.misses")
+            return None
+        
+        self.metrics.increment("cache.l2.hits")
+        self.l1.set(key, value, ttl=self.l1_ttl, tags=tags(value) if tags else ())
+        self._record_l1_gauges()
+        return value
+    
+    def _fill(self, key: str, value: Any, tags: Iterable[str] = ()) -> None:
+        """
+        방금 L2에 저장한 값으로 L1 채움 (무효화 발행 없음)
+        
+        L2가 계산한 신선도(jitter 포함)를 알 수 없으므로 L1 TTL 동안 신선한 항목으로 저장합니다.
+        compute_time은 0으로 두어 L1 만료 시각 기준의 조기 갱신(XFetch)이 일어나지 않도록 합니다.
+        """
+        if self.l1.invalidations != self._l1_epoch:
+            return
+        ttl = self.l1.default_ttl if self.l1_ttl is None else self.l1_ttl
+        now = time.time()
+        entry = CacheEntry(value=value, stored_at=now, fresh_until=now + ttl, expires_at=now + ttl)
+        self.l1.set(key, entry, ttl=ttl, tags=tags)
+    
+    def _record_l1_gauges(self) -> None:
+        self.metrics.set_gauge("cache.l1.entries", len(self.l1))
+        self.metrics.set_gauge("cache.l1.bytes", self.l1.bytes_used)
+        self.metrics.set_gauge("cache.l1.evictions", self.l1.evictions)
+    
+    def _product_tags(self, products: list[Product]) -> list[str]:
+        """L1 목록 항목 태그 (포함된 상품 키)"""
+        return [self._build_product_key(p.id) for p in products]
+    
+    @staticmethod
+    def _build_list_key(
+        category_id: int | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        after_id: int | None = None,
+    ) -> str:
+        """L1 상품 목록 키 (카테고리 접두사 무효화를 위해 카테고리를 앞에 둠, 키셋 페이지는 offset 대신 after)"""
+        scope = f"category:{category_id}" if category_id else "all"
+        page = f"after:{after_id}" if after_id is not None else f"offset:{offset}"
+        return f"list:{scope}:{page}:limit:{limit}"
+    
+    @staticmethod
+    def _build_response_key(
+        category_id: int | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        after_id: int | None = None,
+    ) -> str:
+        """L1 목록 응답 키 (범위 접두사 무효화를 위해 범위를 앞에 둠)"""
+        scope = f"category:{category_id}" if category_id else "all"
+        page = f"after:{after_id}" if after_id is not None else f"offset:{offset}"
+        return f"response:{scope}:{page}:limit:{limit}"
+    
+    @staticmethod
+    def _build_count_key(category_id: int | None = None) -> str:
+        """L1 상품 개수 키"""
+        scope = f"category:{category_id}" if category_id else "all"
+        return f"count:{scope}"
+    
+    @staticmethod
+    def _build_product_key(product_id: int) -> str:
+        """L1 상품 단건 키"""
+        return f"product:{product_id}"
+    
+    @staticmethod
+    def _build_coupon_key(coupon_code: str) -> str:
+        """L1 쿠폰 키"""
+        return f"coupon:{coupon_code}"
+
+
+_l1_cache: LocalCache | None = None
+
+
+def get_l1_cache() -> LocalCache:
+    """
+    L1 캐시 싱글톤 (워커 단위)
+    
+    최초 생성 시 무효화 버스에 L1 제거 리스너를 등록합니다.
+    """
+    global _l1_cache
+    
+    if _l1_cache is None:
+        _l1_cache = LocalCache(
+            max_entries=settings.cache_l1_max_entries,
+            max_bytes=settings.cache_l1_max_bytes,
+            default_ttl=settings.cache_l1_ttl,
+        )
+        l1 = _l1_cache
+        
+        def _on_invalidate(keys: list[str], prefixes: list[str]) -> None:
+            removed = l1.invalidate(keys, prefixes)
+            default_metrics.increment("cache.l1.invalidations", removed)
+        
+        get_invalidation_bus().add_listener(_on_invalidate)
+    return _l1_cache
@@ -0,0 +1,5 @@
+"""CDN Adapters - 엣지 캐시 삭제"""
+
+from app.infrastructure.adapters.cdn.purger import HttpCdnPurger, NoopCdnPurger, get_cdn_purger
+
+__all__ = ["HttpCdnPurger", "NoopCdnPurger", "get_cdn_purger"]
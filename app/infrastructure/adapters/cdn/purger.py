@@ -0,0 +1,83 @@
+"""CDN Purger - Surrogate-Key 단위 엣지 캐시 삭제 (Outbound Adapter)"""
+
+import asyncio
+import json
+import logging
+import urllib.request
+
+from app.domain.ports.cdn_purger import CdnPurger
+from app.infrastructure.settings.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class NoopCdnPurger:
+    """CDN을 사용하지 않을 때 - 아무것도 하지 않음"""
+    
+    async def purge(self, surrogate_keys: list[str]) -> None:
+        return None
+
+
+class HttpCdnPurger:
+    """
+    HTTP 엔드포인트로 Surrogate-Key 삭제 요청
+    
+    `POST {url}`에 `Surrogate-Key: k1 k2 ...` 헤더와 `{"surrogate_keys": [...]}` 본문을 보냅니다.
+    Fastly/Varnish(xkey) 등 Surrogate-Key를 지원하는 프록시 앞의 삭제 엔드포인트나
+    테스트용 로컬 HTTP 서버에 연결합니다. 추가 의존성 없이 표준 라이브러리로 요청합니다.
+    """
+    
+    def __init__(
+        self,
+        url: str,
+        timeout: float = 2.0,
+        token: str | None = None,
+    ):
+        """
+        Args:
+            url: 삭제 요청 URL
+            timeout: 요청 타임아웃 (초 단위)
+            token: 인증 토큰 (선택적, Authorization: Bearer 헤더로 전송)
+        """
+        self.url = url
+        self.timeout = timeout
+        self.token = token
+    
+    async def purge(self, surrogate_keys: list[str]) -> None:
+        """
+        Surrogate-Key 삭제 요청
+        
+        Raises:
+            Exception: 요청 실패 (삭제 실패는 호출자가 알 수 있어야 하므로 전파)
+        """
+        if not surrogate_keys:
+            return
+        await asyncio.to_thread(self._send, surrogate_keys)
+        logger.info("CDN 캐시 삭제 요청: %s", " ".join(surrogate_keys))
+    
+    def _send(self, surrogate_keys: list[str]) -> None:
+        headers = {
+            "Content-Type": "application/json",
+            "Surrogate-Key": " ".join(surrogate_keys),
+        }
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps({"surrogate_keys": surrogate_keys}).encode("utf-8"),
+            headers=headers,
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+def get_cdn_purger() -> CdnPurger:
+    """설정에 따른 CDN Purger (CDN_PURGE_URL이 없으면 Noop)"""
+    if not settings.cdn_purge_url:
+        return NoopCdnPurger()
+    return HttpCdnPurger(
+        url=settings.cdn_purge_url,
+        timeout=settings.cdn_purge_timeout,
+        token=settings.cdn_purge_token or None,
+    )
@@ -0,0 +1,176 @@
+"""Batch Loader - 동시 요청의 단건 조회를 하나의 IN 쿼리로 자동 묶음 (DataLoader 방식)"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+from app.domain.entities.coupon import Coupon
+from app.domain.entities.product import Product
+from app.infrastructure.monitoring.metrics import MetricsRegistry, metrics as default_metrics
+from app.infrastructure.settings.config import settings
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# 키 목록 → {키: 값} 일괄 조회 함수 (결과에 없는 키는 None으로 응답)
+BatchFn = Callable[[list[K]], Awaitable[dict[K, V]]]
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    키 단건 조회 자동 묶음
+    
+    같은 이벤트 루프 틱(window > 0이면 그 시간) 안에 여러 코루틴이 요청한 키를 모아
+    batch_fn 1회(IN 쿼리 1회)로 조회하고, 각 결과를 요청한 코루틴의 Future로 돌려줍니다.
+    같은 키를 여러 코루틴이 요청하면 한 번만 조회합니다.
+    
+    묶인 조회는 요청 세션이 아닌 별도 읽기 세션(복제본, 없으면 primary)에서 실행되므로
+    요청 트랜잭션에서 아직 커밋하지 않은 변경은 보이지 않습니다 (읽기 전용 조회에만 사용).
+    `X-Read-Consistency: strong` 요청은 로더 없이 요청 세션(primary)으로 조회합니다
+    (get_read_product_repository / get_read_coupon_repository).
+    
+    메트릭 (name별):
+    - db.loader.<name>.batch_size: 쿼리 1회의 키 수
+    - db.loader.<name>.calls / queries: 조회 요청 수 / 실제 쿼리 수
+    - db.loader.<name>.queries_saved: 묶지 않았다면 더 실행했을 쿼리 수 (calls - queries)
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        batch_fn: BatchFn[K, V],
+        window: float = 0.0,
+        max_batch: int = 100,
+        metrics: MetricsRegistry | None = None,
+    ):
+        """
+        Args:
+            name: 메트릭 이름에 쓰는 조회 대상 이름 (예: products)
+            batch_fn: 키 목록 일괄 조회 함수
+            window: 조회를 모으는 시간 (초 단위, 0이면 현재 틱에 쌓인 조회만)
+            max_batch: 쿼리 1회 최대 키 수 (도달하면 즉시 조회)
+            metrics: 메트릭 레지스트리 (None이면 전역 레지스트리)
+        """
+        self.name = name
+        self.batch_fn = batch_fn
+        self.window = window
+        self.max_batch = max_batch
+        self.metrics = metrics or default_metrics
+        self._pending: dict[K, list[asyncio.Future[V | None]]] = {}
+        self._flush_handle: asyncio.Handle | asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+    
+    async def load(self, key: K) -> V | None:
+        """키 1개 조회 (없으면 None)"""
+        return await self._enqueue(key)
+    
+    def _enqueue(self, key: K) -> asyncio.Future[V | None]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[V | None] = loop.create_future()
+        waiters = self._pending.get(key)
+        if waiters is None:
+            self._pending[key] = [future]
+        else:
+            waiters.append(future)
+        
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            if self.window > 0:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+            else:
+                self._flush_handle = loop.call_soon(self._flush)
+        return future
+    
+    def _flush(self) -> None:
+        """쌓인 키를 쿼리 1회로 조회 (결과는 별도 태스크에서 분배)"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        
+        task = asyncio.get_running_loop().create_task(self._execute(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _execute(self, batch: dict[K, list[asyncio.Future[V | None]]]) -> None:
+        calls = sum(len(waiters) for waiters in batch.values())
+        prefix = f"db.loader.{self.name}"
+        self.metrics.observe(f"{prefix}.batch_size", len(batch))
+        self.metrics.increment(f"{prefix}.calls", calls)
+        self.metrics.increment(f"{prefix}.queries")
+        self.metrics.increment(f"{prefix}.queries_saved", calls - 1)
+        try:
+            results = await self.batch_fn(list(batch))
+        except Exception as e:
+            # DB 오류 등 - 묶인 모든 조회를 실패 처리
+            logger.warning("일괄 조회 실패 (%s, 키 %d개): %s", self.name, len(batch), e)
+            for waiters in batch.values():
+                for future in waiters:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        
+        for key, waiters in batch.items():
+            value = results.get(key)
+            for future in waiters:
+                if not future.done():  # 호출한 쪽이 취소함
+                    future.set_result(value)
+
+
+async def _load_products(product_ids: list[int]) -> dict[int, Product]:
+    from app.infrastructure.adapters.db.product_repository_impl import ProductRepositoryImpl
+    from app.infrastructure.adapters.db.replica_router import get_replica_router
+    products = await get_replica_router().read(lambda session: ProductRepositoryImpl(session).find_by_ids(product_ids))
+    return {product.id: product for product in products}
+
+
+async def _load_coupons(coupon_codes: list[str]) -> dict[str, Coupon]:
+    from app.infrastructure.adapters.db.coupon_repository_impl import CouponRepositoryImpl
+    from app.infrastructure.adapters.db.replica_router import get_replica_router
+    coupons = await get_replica_router().read(lambda session: CouponRepositoryImpl(session).find_by_codes(coupon_codes))
+    return {coupon.code: coupon for coupon in coupons}
+
+
+_product_loader: BatchLoader[int, Product] | None = None
+_coupon_loader: BatchLoader[str, Coupon] | None = None
+
+
+def get_product_loader() -> BatchLoader[int, Product] | None:
+    """
+    상품 ID 조회 로더 싱글톤 (워커 단위, DB_BATCH_LOADER_ENABLED=false이면 None)
+    
+    요청마다 새로 만들면 요청 간 조회가 묶이지 않으므로 모든 요청이 공유합니다.
+    """
+    global _product_loader
+    
+    if not settings.db_batch_loader_enabled:
+        return None
+    if _product_loader is None:
+        _product_loader = BatchLoader(
+            "products",
+            _load_products,
+            window=settings.db_batch_loader_window,
+            max_batch=settings.db_batch_loader_max_batch,
+        )
+    return _product_loader
+
+
+def get_coupon_loader() -> BatchLoader[str, Coupon] | None:
+    """쿠폰 코드 조회 로더 싱글톤 (워커 단위, DB_BATCH_LOADER_ENABLED=false이면 None)"""
+    global _coupon_loader
+    
+    if not settings.db_batch_loader_enabled:
+        return None
+    if _coupon_loader is None:
+        _coupon_loader = BatchLoader(
+            "coupons",
+            _load_coupons,
+            window=settings.db_batch_loader_window,
+            max_batch=settings.db_batch_loader_max_batch,
+        )
+    return _coupon_loader
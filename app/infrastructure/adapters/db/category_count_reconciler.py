@@ -0,0 +1,129 @@
+"""category_product_counts 재구성 (Outbound Adapter)"""
+
+import logging
+
+from sqlalchemy import delete, exists, func, select
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.models.category_model import CategoryModel
+from app.infrastructure.models.category_product_count_model import CategoryProductCountModel
+from app.infrastructure.models.product_model import ProductModel
+
+logger = logging.getLogger(__name__)
+
+
+class CategoryCountReconciler:
+    """
+    요약 테이블을 products 기준으로 다시 계산
+    
+    트리거가 개수를 유지하지만 트리거 없이 적재한 데이터나 수동 수정으로 어긋난 값을 바로잡습니다.
+    카테고리 ID 순서로 청크를 나눠 청크마다 짧은 트랜잭션으로 처리하므로 products 전체를 한 번에 잠그지 않습니다.
+    마지막으로 삭제된 카테고리의 요약 행을 지웁니다 (전체 개수는 카테고리 행의 합이므로 남으면 어긋남).
+    """
+    
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession]):
+        self.session_maker = session_maker
+    
+    async def reconcile(self, chunk_size: int = 500) -> int:
+        """
+        전체 재구성
+        
+        Args:
+            chunk_size: 트랜잭션 1개에서 다시 셀 카테고리 수
+        
+        Returns:
+            값을 바로잡거나 삭제한 행 수
+        """
+        fixed = 0
+        last_id = 0
+        async with self.session_maker() as session:
+            while True:
+                async with session.begin():
+                    category_ids = list(
+                        (await session.execute(
+                            select(CategoryModel.id)
+                            .where(CategoryModel.id > last_id)
+                            .order_by(CategoryModel.id)
+                            .limit(chunk_size)
+                        )).scalars()
+                    )
+                    if not category_ids:
+                        break
+                    fixed += await self._reconcile_chunk(session, category_ids)
+                last_id = category_ids[-1]
+            
+            async with session.begin():
+                fixed += await self._delete_orphans(session)
+        return fixed
+    
+    async def _reconcile_chunk(self, session: AsyncSession, category_ids: list[int]) -> int:
+        """
+        카테고리 청크 재계산
+        
+        잠금 순서는 트리거와 같게 products(공유 잠금) → 요약 행(배타 잠금)입니다.
+        공유 잠금 읽기는 진행 중인 쓰기의 커밋을 기다리고 청크 범위의 새 INSERT를 막으므로
+        계산하는 동안 트리거가 같은 행을 바꿔 값이 어긋나지 않습니다.
+        """
+        actual = dict(
+            (await session.execute(
+                select(ProductModel.category_id, func.count())
+                .where(ProductModel.category_id.in_(category_ids))
+                .group_by(ProductModel.category_id)
+                .with_for_update(read=True)
+            )).all()
+        )
+        stored = dict(
+            (await session.execute(
+                select(CategoryProductCountModel.category_id, CategoryProductCountModel.product_count)
+                .where(CategoryProductCountModel.category_id.in_(category_ids))
+                .with_for_update()
+            )).all()
+        )
+        
+        fixes = {
+            category_id: actual.get(category_id, 0)
+            for category_id in category_ids
+            if stored.get(category_id, 0) != actual.get(category_id, 0)
+        }
+        for category_id, count in fixes.items():
+            logger.warning(
+                "카테고리 상품 개수 보정 (category_id=%s, %s → %s)",
+                category_id, stored.get(category_id, 0), count,
+            )
+        await self._upsert(session, fixes)
+        return len(fixes)
+    
+    async def _delete_orphans(self, session: AsyncSession) -> int:
+        """
+        categories에 없는 카테고리의 요약 행 삭제
+        
+        products가 categories를 외래 키로 참조하므로 삭제된 카테고리에는 상품이 없고,
+        트리거도 이 행들을 건드리지 않습니다.
+        """
+        orphans = (await session.execute(
+            select(CategoryProductCountModel.category_id, CategoryProductCountModel.product_count)
+            .where(~exists().where(CategoryModel.id == CategoryProductCountModel.category_id))
+            .with_for_update()
+        )).all()
+        if not orphans:
+            return 0
+        
+        for category_id, count in orphans:
+            logger.warning("삭제된 카테고리의 요약 행 제거 (category_id=%s, product_count=%s)", category_id, count)
+        await session.execute(
+            delete(CategoryProductCountModel)
+            .where(CategoryProductCountModel.category_id.in_([category_id for category_id, _ in orphans]))
+        )
+        return len(orphans)
+    
+    @staticmethod
+    async def _upsert(session: AsyncSession, counts: dict[int, int]) -> None:
+        if not counts:
+            return
+        stmt = insert(CategoryProductCountModel).values(
+            [{"category_id": category_id, "product_count": count} for category_id, count in counts.items()]
+        )
+        await session.execute(
+            stmt.on_duplicate_key_update(product_count=stmt.inserted.product_count)
+        )
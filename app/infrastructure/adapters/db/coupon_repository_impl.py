@@ -1,5 +1,7 @@
 """CouponRepository 구현체 (Outbound Adapter)"""
 
+from typing import TYPE_CHECKING
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.domain.entities.coupon import Coupon
@@ -7,16 +9,28 @@ from app.domain.ports.coupon_repository import CouponRepository
 from app.infrastructure.models.coupon_model import CouponModel
 from app.infrastructure.mappers.coupon_mapper import CouponMapper
 
+if TYPE_CHECKING:
+    from app.infrastructure.adapters.db.batch_loader import BatchLoader
+
 
 class CouponRepositoryImpl:
     """CouponRepository 구현체 - Outbound Adapter"""
     
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, loader: "BatchLoader[str, Coupon] | None" = None):
+        """
+        Args:
+            session: 요청 세션
+            loader: 쿠폰 코드 조회 로더 (선택적, 있으면 find_by_code를 다른 요청의 조회와 IN 쿼리 1회로 묶음)
+        """
         self.session = session
         self.mapper = CouponMapper()
+        self.loader = loader
     
     async def find_by_code(self, coupon_code: str) -> Coupon | None:
         """쿠폰 코드로 조회"""
+        if self.loader is not None:
+            return await self.loader.load(coupon_code)
+        
         stmt = select(CouponModel).where(CouponModel.code == coupon_code)
         result = await self.session.execute(stmt)
         coupon_model = result.scalar_one_or_none()
@@ -25,4 +39,9 @@ class CouponRepositoryImpl:
             return None
         
         return self.mapper.to_domain(coupon_model)
-
+    
+    async def find_by_codes(self, coupon_codes: list[str]) -> list[Coupon]:
+        """쿠폰 코드 목록으로 일괄 조회 (idx_coupons_code IN 조회, 결과 순서 보장 안 함)"""
+        stmt = select(CouponModel).where(CouponModel.code.in_(coupon_codes))
+        result = await self.session.execute(stmt)
+        return [self.mapper.to_domain(model) for model in result.scalars().all()]
@@ -1,30 +1,60 @@
 """ProductRepository 구현체 (Outbound Adapter)"""
 
+from typing import TYPE_CHECKING
+
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import Select, func, select
 from app.domain.entities.product import Product
 from app.domain.ports.product_repository import ProductRepository
+from app.infrastructure.models.category_product_count_model import CategoryProductCountModel
 from app.infrastructure.models.product_model import ProductModel
 from app.infrastructure.mappers.product_mapper import ProductMapper
 
+if TYPE_CHECKING:
+    from app.infrastructure.adapters.db.batch_loader import BatchLoader
+
+# Core 조회용 테이블 (ORM 엔티티 로딩 없이 컬럼만 선택)
+product_table = ProductModel.__table__
+
 
 class ProductRepositoryImpl:
     """ProductRepository 구현체 - Outbound Adapter"""
     
-    def __init__(self, session: AsyncSession):
+    # find_by_ids의 IN 목록 최대 길이 (긴 목록을 쿼리 여러 개로 나눔)
+    IN_CHUNK_SIZE = 500
+    
+    def __init__(self, session: AsyncSession, loader: "BatchLoader[int, Product] | None" = None):
+        """
+        Args:
+            session: 요청 세션
+            loader: 상품 ID 조회 로더 (선택적, 있으면 find_by_id를 다른 요청의 조회와 IN 쿼리 1회로 묶음)
+        """
         self.session = session
         self.mapper = ProductMapper()
+        self.loader = loader
     
     async def find_by_id(self, product_id: int) -> Product | None:
         """상품 ID로 조회"""
-        stmt = select(ProductModel).where(ProductModel.id == product_id)
-        result = await self.session.execute(stmt)
-        product_model = result.scalar_one_or_none()
+        if self.loader is not None:
+            return await self.loader.load(product_id)
+        
+        stmt = select(*ProductMapper.COLUMNS).where(product_table.c.id == product_id)
+        found = await self._fetch(stmt)
         
-        if not product_model:
-            return None
+        return found[0] if found else None
+    
+    async def find_by_ids(self, product_ids: list[int]) -> list[Product]:
+        """
+        상품 ID 목록으로 일괄 조회 (PRIMARY KEY IN 조회, 결과 순서 보장 안 함)
         
-        return self.mapper.to_domain(product_model)
+        IN 목록이 너무 길면 파싱 비용과 패킷 크기가 커지므로 IN_CHUNK_SIZE개씩 나눠 조회합니다.
+        """
+        found: list[Product] = []
+        for start in range(0, len(product_ids), self.IN_CHUNK_SIZE):
+            chunk = product_ids[start:start + self.IN_CHUNK_SIZE]
+            stmt = select(*ProductMapper.COLUMNS).where(product_table.c.id.in_(chunk))
+            found += await self._fetch(stmt)
+        return found
     
     async def find_by_category(
         self,
@@ -34,17 +64,14 @@ class ProductRepositoryImpl:
     ) -> list[Product]:
         """카테고리별 상품 조회 (OFFSET 기반 페이지네이션)"""
         stmt = (
-            select(ProductModel)
-            .where(ProductModel.category_id == category_id)
-            .order_by(ProductModel.id)
+            select(*ProductMapper.COLUMNS)
+            .where(product_table.c.category_id == category_id)
+            .order_by(product_table.c.id)
             .offset(offset)
             .limit(limit)
         )
         
-        result = await self.session.execute(stmt)
-        product_models = result.scalars().all()
-        
-        return [self.mapper.to_domain(model) for model in product_models]
+        return await self._fetch(stmt)
     
     async def find_all(
         self,
@@ -53,28 +80,120 @@ class ProductRepositoryImpl:
     ) -> list[Product]:
         """전체 상품 조회 (OFFSET 기반 페이지네이션)"""
         stmt = (
-            select(ProductModel)
-            .order_by(ProductModel.id)
+            select(*ProductMapper.COLUMNS)
+            .order_by(product_table.c.id)
             .offset(offset)
             .limit(limit)
         )
         
-        result = await self.session.execute(stmt)
-        product_models = result.scalars().all()
+        return await self._fetch(stmt)
+    
+    async def find_by_category_after(
+        self,
+        category_id: int,
+        after_id: int,
+        limit: int = 20,
+    ) -> list[Product]:
+        """
+        카테고리별 상품 조회 (키셋 페이지네이션)
+        
+        idx_products_category_id (category_id, id) 범위 조회로 시작 위치를 바로 찾으므로
+        OFFSET과 달리 앞 페이지 행을 읽고 버리지 않습니다 (페이지 깊이와 무관한 비용).
+        """
+        stmt = (
+            select(*ProductMapper.COLUMNS)
+            .where(product_table.c.category_id == category_id, product_table.c.id > after_id)
+            .order_by(product_table.c.id)
+            .limit(limit)
+        )
         
-        return [self.mapper.to_domain(model) for model in product_models]
+        return await self._fetch(stmt)
     
-    async def count_by_category(self, category_id: int) -> int:
-        """카테고리별 상품 개수 조회"""
-        stmt = select(func.count(ProductModel.id)).where(
-            ProductModel.category_id == category_id
+    async def find_all_after(
+        self,
+        after_id: int,
+        limit: int = 20,
+    ) -> list[Product]:
+        """전체 상품 조회 (키셋 페이지네이션 - PRIMARY KEY 범위 조회)"""
+        stmt = (
+            select(*ProductMapper.COLUMNS)
+            .where(product_table.c.id > after_id)
+            .order_by(product_table.c.id)
+            .limit(limit)
+        )
+        
+        return await self._fetch(stmt)
+    
+    async def find_page_with_count(
+        self,
+        category_id: int | None = None,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> tuple[list[Product], int]:
+        """
+        상품 목록과 전체 개수를 한 번의 쿼리로 조회 (DB 왕복 1회)
+        
+        개수는 category_product_counts 요약 테이블을 읽는 스칼라 서브쿼리로 함께 가져옵니다.
+        offset이 범위를 벗어나 행이 없으면 개수를 알 수 없으므로 개수 쿼리를 한 번 더 실행합니다.
+        """
+        page_stmt = select(*ProductMapper.COLUMNS)
+        if category_id:
+            page_stmt = page_stmt.where(product_table.c.category_id == category_id)
+        total_count = self._count_stmt(category_id).scalar_subquery().label("total_count")
+        stmt = (
+            page_stmt
+            .add_columns(total_count)
+            .order_by(product_table.c.id)
+            .offset(offset)
+            .limit(limit)
         )
-        result = await self.session.execute(stmt)
-        return result.scalar_one()
+        
+        connection = await self.session.connection()
+        rows = (await connection.execute(stmt)).all()
+        
+        if not rows:
+            if offset == 0:
+                return [], 0
+            count = await (self.count_by_category(category_id) if category_id else self.count_all())
+            return [], count
+        # 요약 행이 아직 없으면 서브쿼리 결과가 NULL
+        # 마지막 컬럼은 total_count
+        from_row = self.mapper.from_row
+        return [from_row(row[:-1]) for row in rows], int(rows[0].total_count or 0)
+    
+    async def count_by_category(self, category_id: int) -> int:
+        """카테고리별 상품 개수 조회 (요약 테이블 1행, 행이 없으면 0)"""
+        result = await self.session.execute(self._count_stmt(category_id))
+        return result.scalar_one_or_none() or 0
     
     async def count_all(self) -> int:
-        """전체 상품 개수 조회"""
-        stmt = select(func.count(ProductModel.id))
-        result = await self.session.execute(stmt)
-        return result.scalar_one()
-
+        """전체 상품 개수 조회 (요약 테이블 카테고리 행의 합)"""
+        result = await self.session.execute(self._count_stmt(None))
+        # MySQL SUM은 DECIMAL을 반환
+        return int(result.scalar_one())
+    
+    async def _fetch(self, stmt: Select) -> list[Product]:
+        """
+        Core로 실행해 행 튜플에서 바로 Product 복원
+        
+        ORM 인스턴스 생성, identity map 등록, 속성 계측(instrumentation)을 거치지 않고
+        필요한 컬럼만 읽어 검증 없이 엔티티를 만듭니다 (DB 값은 이미 검증된 값으로 신뢰).
+        """
+        connection = await self.session.connection()
+        result = await connection.execute(stmt)
+        from_row = self.mapper.from_row
+        return [from_row(row) for row in result]
+    
+    @staticmethod
+    def _count_stmt(category_id: int | None):
+        """
+        요약 테이블 개수 조회문 (category_id가 없으면 카테고리 행의 합)
+        
+        products를 COUNT(*)로 세지 않고 트리거가 쓰기 트랜잭션 안에서 유지하는 값을 읽습니다.
+        카테고리별 개수는 PRIMARY KEY로 1행, 전체 개수는 카테고리 수만큼의 행을 더합니다.
+        """
+        if category_id:
+            return select(CategoryProductCountModel.product_count).where(
+                CategoryProductCountModel.category_id == category_id
+            )
+        return select(func.coalesce(func.sum(CategoryProductCountModel.product_count), 0))
@@ -0,0 +1,293 @@
+"""Replica Router - 읽기 전용 조회를 MySQL 읽기 복제본으로 분산"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
+
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError, TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from app.infrastructure.monitoring.metrics import MetricsRegistry, metrics as default_metrics
+from app.infrastructure.settings.config import async_session_maker, settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 복제 지연 조회 함수 (초 단위, 복제가 멈췄으면 None)
+LagProbe = Callable[[], Awaitable[float | None]]
+
+
+async def replication_lag(connection: AsyncConnection) -> float | None:
+    """
+    MySQL 복제 지연 (Seconds_Behind_Source, 초 단위)
+    
+    SHOW REPLICA STATUS(MySQL 8.0.22+)가 없으면 SHOW SLAVE STATUS로 조회합니다.
+    복제 상태가 없는 노드(관리형 읽기 엔드포인트 등)는 지연 0으로, 복제 스레드가 멈춰
+    지연 값이 NULL이면 None으로 봅니다.
+    """
+    try:
+        result = await connection.exec_driver_sql("SHOW REPLICA STATUS")
+    except DBAPIError:
+        result = await connection.exec_driver_sql("SHOW SLAVE STATUS")
+    row = result.mappings().first()
+    if row is None:
+        return 0.0
+    lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+    return None if lag is None else float(lag)
+
+
+class Replica:
+    """읽기 복제본 1개 - 세션 팩토리와 마지막 헬스 체크 결과"""
+    
+    def __init__(
+        self,
+        name: str,
+        session_maker: Callable[[], AsyncSession],
+        probe: LagProbe,
+        engine: AsyncEngine | None = None,
+    ):
+        """
+        Args:
+            name: 메트릭/로그에 쓰는 이름
+            session_maker: 복제본 세션 팩토리
+            probe: 복제 지연 조회 함수 (연결 실패 시 예외)
+            engine: 종료 시 정리할 엔진 (선택적)
+        """
+        self.name = name
+        self.session_maker = session_maker
+        self.probe = probe
+        self.engine = engine
+        self.healthy = False  # 첫 헬스 체크를 통과하기 전에는 사용하지 않음
+        self.lag: float | None = None
+        self.in_flight = 0
+
+
+class ReplicaRouter:
+    """
+    읽기 세션 라우터 (워커 단위)
+    
+    - 백그라운드 헬스 체크가 주기적으로 각 복제본의 연결과 복제 지연을 확인합니다.
+      연결에 실패하거나 지연이 max_lag를 넘은 복제본은 다음 확인까지 제외합니다.
+    - 요청 경로(read_session)는 헬스 체크 결과만 보고 사용 중인 세션이 가장 적은 복제본을 고릅니다
+      (같으면 번갈아 선택).
+    - 사용할 수 있는 복제본이 없으면 primary 세션으로 대체합니다.
+    - 세션은 처음 조회할 때 연결을 받습니다 (캐시 히트 등 조회하지 않는 요청은 체크아웃/pre-ping 없음).
+    - 조회 중 연결 오류가 난 복제본은 다음 헬스 체크까지 바로 제외합니다.
+    - read()로 실행한 조회는 복제본 연결 오류/풀 대기 시간 초과 시 primary에서 한 번 다시 실행합니다.
+    """
+    
+    def __init__(
+        self,
+        primary: Callable[[], AsyncSession],
+        replicas: list[Replica],
+        max_lag: float = 2.0,
+        check_interval: float = 5.0,
+        check_timeout: float = 1.0,
+        metrics: MetricsRegistry | None = None,
+    ):
+        """
+        Args:
+            primary: primary 세션 팩토리 (대체 경로)
+            replicas: 읽기 복제본 목록
+            max_lag: 조회를 보낼 복제본의 최대 복제 지연 (초 단위)
+            check_interval: 헬스 체크 주기 (초 단위)
+            check_timeout: 복제본 1개 확인 최대 시간 (초 단위)
+            metrics: 메트릭 레지스트리 (None이면 전역 레지스트리)
+        """
+        self.primary = primary
+        self.replicas = replicas
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.check_timeout = check_timeout
+        self.metrics = metrics or default_metrics
+        self._next = 0
+        self._task: asyncio.Task | None = None
+    
+    @property
+    def started(self) -> bool:
+        return self._task is not None
+    
+    async def start(self) -> int:
+        """
+        첫 헬스 체크 후 주기적 확인 시작
+        
+        Returns:
+            사용 가능한 복제본 수
+        """
+        if self.replicas and self._task is None:
+            await self.check_all()
+            self._task = asyncio.create_task(self._run())
+        return sum(replica.healthy for replica in self.replicas)
+    
+    async def close(self) -> None:
+        """헬스 체크 종료 및 복제본 엔진 정리"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for replica in self.replicas:
+            if replica.engine is not None:
+                await replica.engine.dispose()
+    
+    def choose(self) -> Replica | None:
+        """조회를 보낼 복제본 (없으면 None - primary 사용)"""
+        candidates = [replica for replica in self.replicas if replica.healthy]
+        if not candidates:
+            return None
+        # 사용 중인 세션 수가 같으면 시작 위치를 돌려가며 선택
+        self._next = (self._next + 1) % len(candidates)
+        rotated = candidates[self._next:] + candidates[:self._next]
+        return min(rotated, key=lambda replica: replica.in_flight)
+    
+    @asynccontextmanager
+    async def read_session(self) -> AsyncIterator[AsyncSession]:
+        """
+        읽기 전용 세션 (복제본, 사용할 수 없으면 primary)
+        
+        세션 사용 중 연결 오류가 나면 복제본을 제외하고 오류를 그대로 전달합니다
+        (세션을 쓰는 쪽의 조회를 다시 실행할 수 없으므로 대체는 read()에서만 함).
+        """
+        replica = self.choose()
+        if replica is None:
+            if self.replicas:
+                self.metrics.increment("db.replica.fallbacks")
+            async with self.primary() as session:
+                yield session
+            return
+        
+        replica.in_flight += 1
+        try:
+            async with replica.session_maker() as session:
+                self.metrics.increment(f"db.replica.{replica.name}.sessions")
+                try:
+                    yield session
+                except (OperationalError, InterfaceError) as e:
+                    self._mark_down(replica, e)
+                    raise
+        finally:
+            replica.in_flight -= 1
+    
+    async def read(self, fetch: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        """
+        읽기 전용 조회 실행 (복제본 연결 오류/풀 대기 시간 초과 시 primary에서 한 번 다시 실행)
+        
+        fetch는 조회만 해야 합니다 (다시 실행해도 결과가 같아야 함).
+        
+        Args:
+            fetch: 세션으로 조회하는 함수
+        """
+        replica = self.choose()
+        if replica is not None:
+            replica.in_flight += 1
+            try:
+                async with replica.session_maker() as session:
+                    self.metrics.increment(f"db.replica.{replica.name}.sessions")
+                    return await fetch(session)
+            except (OperationalError, InterfaceError) as e:
+                self._mark_down(replica, e)
+            except PoolTimeoutError as e:
+                logger.warning("읽기 복제본 %s 커넥션 풀 대기 시간 초과, primary로 조회합니다: %s", replica.name, e)
+            finally:
+                replica.in_flight -= 1
+        
+        if self.replicas:
+            self.metrics.increment("db.replica.fallbacks")
+        async with self.primary() as session:
+            return await fetch(session)
+    
+    async def check_all(self) -> None:
+        """모든 복제본 헬스 체크 (동시 실행)"""
+        await asyncio.gather(*(self._check(replica) for replica in self.replicas))
+    
+    async def _check(self, replica: Replica) -> None:
+        try:
+            lag = await asyncio.wait_for(replica.probe(), self.check_timeout)
+        except Exception as e:
+            if replica.healthy:
+                logger.warning("읽기 복제본 %s 연결 실패, 조회에서 제외합니다: %s", replica.name, e)
+            self._set_state(replica, healthy=False, lag=None)
+            return
+        
+        healthy = lag is not None and lag <= self.max_lag
+        if replica.healthy and not healthy:
+            logger.warning("읽기 복제본 %s 복제 지연 %s초 (기준 %s초), 조회에서 제외합니다", replica.name, lag, self.max_lag)
+        elif healthy and not replica.healthy:
+            logger.info("읽기 복제본 %s 조회 대상에 포함 (복제 지연 %s초)", replica.name, lag)
+        self._set_state(replica, healthy=healthy, lag=lag)
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            await self.check_all()
+    
+    def _mark_down(self, replica: Replica, error: Exception) -> None:
+        if replica.healthy:
+            logger.warning("읽기 복제본 %s 조회 중 연결 오류, 다음 헬스 체크까지 제외합니다: %s", replica.name, error)
+        self.metrics.increment(f"db.replica.{replica.name}.errors")
+        self._set_state(replica, healthy=False, lag=replica.lag)
+    
+    def _set_state(self, replica: Replica, healthy: bool, lag: float | None) -> None:
+        replica.healthy = healthy
+        replica.lag = lag
+        self.metrics.set_gauge(f"db.replica.{replica.name}.healthy", 1 if healthy else 0)
+        if lag is not None:
+            self.metrics.set_gauge(f"db.replica.{replica.name}.lag_seconds", lag)
+
+
+def create_mysql_replica(name: str, url: str) -> Replica:
+    """URL로 복제본 엔진/세션 팩토리 생성 (커넥션 풀 설정은 primary와 같음)"""
+    engine = create_async_engine(
+        url,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+    )
+    
+    async def probe() -> float | None:
+        async with engine.connect() as connection:
+            return await replication_lag(connection)
+    
+    return Replica(
+        name,
+        async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False),
+        probe,
+        engine=engine,
+    )
+
+
+_router: ReplicaRouter | None = None
+
+
+def get_replica_router() -> ReplicaRouter:
+    """읽기 세션 라우터 싱글톤 (DATABASE_REPLICA_URLS가 비어 있으면 항상 primary)"""
+    global _router
+    
+    if _router is None:
+        urls = [url.strip() for url in settings.database_replica_urls.split(",") if url.strip()]
+        _router = ReplicaRouter(
+            async_session_maker,
+            [create_mysql_replica(f"replica{index}", url) for index, url in enumerate(urls)],
+            max_lag=settings.database_replica_max_lag,
+            check_interval=settings.database_replica_check_interval,
+            check_timeout=settings.database_replica_check_timeout,
+        )
+    return _router
+
+
+async def close_replica_router() -> None:
+    """읽기 세션 라우터 종료"""
+    global _router
+    
+    if _router is not None:
+        try:
+            await _router.close()
+        except Exception as e:
+            logger.warning("읽기 복제본 종료 중 오류 발생: %s", e)
+        finally:
+            _router = None
@@ -7,6 +7,16 @@ from app.infrastructure.models.product_model import ProductModel
 class ProductMapper:
     """Product Domain Model ↔ Infrastructure Model 변환"""
     
+    # from_row가 기대하는 컬럼 순서 (도메인에 필요한 컬럼만 - created_at 제외)
+    COLUMNS = (
+        ProductModel.__table__.c.id,
+        ProductModel.__table__.c.name,
+        ProductModel.__table__.c.price,
+        ProductModel.__table__.c.stock,
+        ProductModel.__table__.c.category_id,
+        ProductModel.__table__.c.discount_rate,
+    )
+    
     @staticmethod
     def to_domain(product_model: ProductModel) -> Product:
         """Infrastructure Model → Domain Model 변환"""
@@ -19,6 +29,10 @@ class ProductMapper:
             discount_rate=product_model.discount_rate,
         )
     
+    # Core 행 → Domain Model 변환 (COLUMNS 순서의 행 - ORM 인스턴스 없이 검증 생략하고 복원)
+    # 행마다 호출되므로 감싸는 함수 없이 Product.restore를 그대로 사용
+    from_row = Product.restore
+    
     @staticmethod
     def to_model(product: Product, product_model: ProductModel | None = None) -> ProductModel:
         """Domain Model → Infrastructure Model 변환"""
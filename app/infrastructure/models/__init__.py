@@ -2,7 +2,7 @@
 
 from app.infrastructure.models.product_model import ProductModel
 from app.infrastructure.models.category_model import CategoryModel
+from app.infrastructure.models.category_product_count_model import CategoryProductCountModel
 from app.infrastructure.models.coupon_model import CouponModel
 
-__all__ = ["ProductModel", "CategoryModel", "CouponModel"]
-
+__all__ = ["ProductModel", "CategoryModel", "CategoryProductCountModel", "CouponModel"]
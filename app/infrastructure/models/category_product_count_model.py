@@ -0,0 +1,19 @@
+"""CategoryProductCount ORM Model (Infrastructure Model)"""
+
+from sqlalchemy.orm import Mapped, mapped_column
+from app.infrastructure.settings.config import Base
+
+
+class CategoryProductCountModel(Base):
+    """
+    카테고리별 상품 개수 요약 ORM 모델
+    
+    products 테이블 트리거가 상품 INSERT/DELETE/카테고리 변경과 같은 트랜잭션에서 갱신합니다.
+    전체 상품 개수는 카테고리 행의 합입니다 (전용 행을 두면 모든 상품 쓰기가 같은 행을 잠가 경합).
+    삭제된 카테고리의 행이 남을 수 있도록 categories 외래 키는 두지 않습니다 (재구성 명령이 정리).
+    """
+    
+    __tablename__ = "category_product_counts"
+    
+    category_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    product_count: Mapped[int] = mapped_column(default=0, server_default="0")
@@ -0,0 +1,6 @@
+"""Monitoring - 프로세스 내 메트릭 및 인기 키 수집"""
+
+from app.infrastructure.monitoring.hot_keys import HotKeyTracker, get_hot_key_tracker
+from app.infrastructure.monitoring.metrics import MetricsRegistry, metrics
+
+__all__ = ["HotKeyTracker", "MetricsRegistry", "get_hot_key_tracker", "metrics"]
@@ -0,0 +1,122 @@
+"""Hot Key Tracker - 자주 요청되는 캐시 키 집계 및 Redis 저장 (배포 후 워밍용)"""
+
+import asyncio
+import logging
+from collections import Counter
+
+import redis.asyncio as redis
+
+from app.infrastructure.settings.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class HotKeyTracker:
+    """
+    워커 단위 인기 키 집계기
+    
+    - 요청마다 record()로 키를 세고, 주기적으로 Redis Sorted Set에 합산합니다.
+    - 저장할 때마다 기존 점수에 decay를 곱해 최근 요청이 더 큰 비중을 갖도록 합니다.
+    - 여러 워커가 같은 Sorted Set에 합산하므로 배포 후 어떤 워커든 같은 목록으로 워밍할 수 있습니다.
+    """
+    
+    def __init__(
+        self,
+        redis_key: str = "cache:hotkeys",
+        max_keys: int = 1000,
+        decay: float = 0.9,
+        ttl: int = 86400,
+    ):
+        """
+        Args:
+            redis_key: 인기 키를 저장할 Redis Sorted Set 키
+            max_keys: 워커 내 집계 및 Redis에 유지할 최대 키 수
+            decay: 저장 시 기존 점수에 곱하는 감쇠 계수 (0.0 ~ 1.0)
+            ttl: Redis 키 TTL (초 단위, 트래픽이 없으면 자연 소멸)
+        """
+        self.redis_key = redis_key
+        self.max_keys = max_keys
+        self.decay = decay
+        self.ttl = ttl
+        self._counts: Counter[str] = Counter()
+        self._task: asyncio.Task | None = None
+    
+    def record(self, key: str) -> None:
+        """요청 1회 기록 (집계 키가 상한의 2배를 넘으면 상위 max_keys개만 유지)"""
+        self._counts[key] += 1
+        if len(self._counts) > self.max_keys * 2:
+            self._counts = Counter(dict(self._counts.most_common(self.max_keys)))
+    
+    def drain(self) -> dict[str, int]:
+        """집계 결과를 반환하고 초기화"""
+        counts = dict(self._counts.most_common(self.max_keys))
+        self._counts.clear()
+        return counts
+    
+    async def persist(self, redis_client: redis.Redis) -> int:
+        """
+        집계 결과를 Redis에 합산 (감쇠 → 합산 → 상위 max_keys개 유지)
+        
+        Returns:
+            저장한 키 수
+        """
+        counts = self.drain()
+        if not counts:
+            return 0
+        
+        pipe = redis_client.pipeline(transaction=True)
+        pipe.zunionstore(self.redis_key, {self.redis_key: self.decay})
+        for key, count in counts.items():
+            pipe.zincrby(self.redis_key, count, key)
+        pipe.zremrangebyrank(self.redis_key, 0, -(self.max_keys + 1))
+        pipe.expire(self.redis_key, self.ttl)
+        await pipe.execute()
+        return len(counts)
+    
+    async def load(self, redis_client: redis.Redis, limit: int) -> list[str]:
+        """점수 높은 순으로 인기 키 조회"""
+        keys = await redis_client.zrevrange(self.redis_key, 0, limit - 1)
+        return [key.decode() if isinstance(key, bytes) else str(key) for key in keys]
+    
+    def start(self, redis_client: redis.Redis, interval: float) -> None:
+        """주기적 저장 태스크 시작"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(redis_client, interval))
+    
+    async def stop(self, redis_client: redis.Redis | None = None) -> None:
+        """주기적 저장 태스크 종료 (redis_client를 주면 남은 집계를 저장)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if redis_client is not None:
+            try:
+                await self.persist(redis_client)
+            except Exception as e:
+                logger.warning("인기 키 저장 실패: %s", e)
+    
+    async def _run(self, redis_client: redis.Redis, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.persist(redis_client)
+            except Exception as e:
+                logger.warning("인기 키 저장 실패: %s", e)
+
+
+_hot_keys: HotKeyTracker | None = None
+
+
+def get_hot_key_tracker() -> HotKeyTracker:
+    """인기 키 집계기 싱글톤 (워커 단위)"""
+    global _hot_keys
+    
+    if _hot_keys is None:
+        _hot_keys = HotKeyTracker(
+            redis_key=settings.warmup_hot_keys_redis_key,
+            max_keys=settings.warmup_hot_keys_limit,
+        )
+    return _hot_keys
@@ -0,0 +1,100 @@
+"""Metrics Registry - 워커(프로세스) 단위 카운터/분포 메트릭"""
+
+from collections import defaultdict
+
+
+class _Summary:
+    """관측값 분포 요약 (개수, 합계, 최소, 최대)"""
+    
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+    
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+    
+    def to_dict(self) -> dict:
+        if self.count == 0:
+            return {"count": 0, "sum": 0.0, "avg": 0.0, "min": 0.0, "max": 0.0}
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "avg": self.total / self.count,
+            "min": self.min,
+            "max": self.max,
+        }
+
+
+class MetricsRegistry:
+    """
+    프로세스 내 메트릭 레지스트리
+    
+    - counter: 단조 증가 카운터 (예: cache.l1.hits)
+    - gauge: 마지막 값 (예: cache.l1.bytes)
+    - summary: 관측값 분포 (예: cache.compress.seconds)
+    
+    `<prefix>.hits` / `<prefix>.misses` 카운터 쌍은 스냅샷에서 `<prefix>.hit_rate`로 함께 노출됩니다.
+    """
+    
+    def __init__(self):
+        self._counters: dict[str, float] = defaultdict(float)
+        self._gauges: dict[str, float] = {}
+        self._summaries: dict[str, _Summary] = {}
+    
+    def increment(self, name: str, value: float = 1) -> None:
+        """카운터 증가"""
+        self._counters[name] += value
+    
+    def set_gauge(self, name: str, value: float) -> None:
+        """게이지 값 설정"""
+        self._gauges[name] = value
+    
+    def observe(self, name: str, value: float) -> None:
+        """분포 관측값 기록"""
+        summary = self._summaries.get(name)
+        if summary is None:
+            summary = self._summaries[name] = _Summary()
+        summary.observe(value)
+    
+    def counter(self, name: str) -> float:
+        """카운터 현재 값"""
+        return self._counters.get(name, 0)
+    
+    def hit_rate(self, prefix: str) -> float | None:
+        """`<prefix>.hits` / (`hits` + `misses`) 비율 (요청이 없으면 None)"""
+        hits = self.counter(f"{prefix}.hits")
+        misses = self.counter(f"{prefix}.misses")
+        total = hits + misses
+        if total == 0:
+            return None
+        return hits / total
+    
+    def snapshot(self) -> dict:
+        """현재 메트릭 스냅샷 (JSON 직렬화 가능)"""
+        hit_rates = {}
+        for name in self._counters:
+            if name.endswith(".hits"):
+                prefix = name[: -len(".hits")]
+                hit_rates[f"{prefix}.hit_rate"] = self.hit_rate(prefix)
+        
+        return {
+            "counters": dict(self._counters),
+            "gauges": dict(self._gauges),
+            "summaries": {name: s.to_dict() for name, s in self._summaries.items()},
+            "hit_rates": hit_rates,
+        }
+    
+    def reset(self) -> None:
+        """모든 메트릭 초기화 (테스트용)"""
+        self._counters.clear()
+        self._gauges.clear()
+        self._summaries.clear()
+
+
+# 애플리케이션 전역 레지스트리 (워커 단위)
+metrics = MetricsRegistry()
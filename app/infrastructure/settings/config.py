@@ -15,11 +15,71 @@ class Settings(BaseSettings):
     )
     database_pool_size: int = 10
     database_max_overflow: int = 20
+    database_replica_urls: str = os.getenv("DATABASE_REPLICA_URLS", "")  # 읽기 복제본 URL (쉼표로 구분, 비어 있으면 모든 조회를 primary에서)
+    database_replica_max_lag: float = float(os.getenv("DATABASE_REPLICA_MAX_LAG", "2.0"))  # 조회를 보낼 복제본의 최대 복제 지연 (초 단위, 초과하면 제외)
+    database_replica_check_interval: float = float(os.getenv("DATABASE_REPLICA_CHECK_INTERVAL", "5.0"))  # 복제본 연결/지연 확인 주기 (초 단위)
+    database_replica_check_timeout: float = float(os.getenv("DATABASE_REPLICA_CHECK_TIMEOUT", "1.0"))  # 복제본 1개 확인 최대 시간 (초 단위)
+    db_batch_loader_enabled: bool = os.getenv("DB_BATCH_LOADER_ENABLED", "true").lower() == "true"  # 동시 요청의 상품 ID/쿠폰 코드 단건 조회를 IN 쿼리 1회로 묶을지 여부
+    db_batch_loader_window: float = float(os.getenv("DB_BATCH_LOADER_WINDOW", "0.0"))  # 조회 수집 시간 (초 단위, 0이면 같은 이벤트 루프 틱, 예: 0.001~0.002)
+    db_batch_loader_max_batch: int = int(os.getenv("DB_BATCH_LOADER_MAX_BATCH", "100"))  # IN 쿼리 1회 최대 키 수
     debug: bool = os.getenv("DEBUG", "false").lower() == "true"  # 개발 환경 여부
     environment: str = os.getenv("ENVIRONMENT", "development")  # 환경 (development, production)
     redis_url: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
     redis_enabled: bool = os.getenv("REDIS_ENABLED", "true").lower() == "true"
+    redis_max_connections: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))  # 워커당 Redis 커넥션 풀 크기
+    redis_pool_timeout: float = float(os.getenv("REDIS_POOL_TIMEOUT", "1.0"))  # 풀이 가득 찼을 때 연결 대기 시간 (초 단위)
+    redis_socket_timeout: float = float(os.getenv("REDIS_SOCKET_TIMEOUT", "1.0"))  # Redis 연결/응답 대기 시간 (초 단위)
+    redis_health_check_interval: float = float(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "5.0"))  # 백그라운드 PING 주기 (초 단위)
+    redis_reconnect_backoff_base: float = float(os.getenv("REDIS_RECONNECT_BACKOFF_BASE", "0.5"))  # 재연결 첫 대기 시간 (초 단위, 실패 시 2배)
+    redis_reconnect_backoff_max: float = float(os.getenv("REDIS_RECONNECT_BACKOFF_MAX", "30.0"))  # 재연결 최대 대기 시간 (초 단위)
+    redis_auto_pipeline_enabled: bool = os.getenv("REDIS_AUTO_PIPELINE_ENABLED", "true").lower() == "true"  # 동시 요청의 GET/MGET/SETEX 자동 파이프라이닝 여부
+    redis_auto_pipeline_window: float = float(os.getenv("REDIS_AUTO_PIPELINE_WINDOW", "0.0"))  # 명령 수집 시간 (초 단위, 0이면 같은 이벤트 루프 틱)
+    redis_auto_pipeline_max_batch: int = int(os.getenv("REDIS_AUTO_PIPELINE_MAX_BATCH", "128"))  # 파이프라인 1회 최대 명령 수
     cache_ttl: int = int(os.getenv("CACHE_TTL", "300"))  # 캐시 TTL (초 단위, 기본 5분)
+    cache_soft_ttl: int = int(os.getenv("CACHE_SOFT_TTL", "240"))  # Soft TTL (초 단위, 경과 시 오래된 값 반환 + 백그라운드 갱신)
+    cache_ttl_jitter: float = float(os.getenv("CACHE_TTL_JITTER", "0.1"))  # TTL 무작위 감소 비율 상한 (동시 만료 방지)
+    cache_xfetch_beta: float = float(os.getenv("CACHE_XFETCH_BETA", "1.0"))  # 확률적 조기 갱신 강도 (0이면 비활성화)
+    cache_list_block_size: int = int(os.getenv("CACHE_LIST_BLOCK_SIZE", "100"))  # 상품 목록 캐시 블록 크기 (0이면 offset/limit별 캐싱)
+    cache_codec: str = os.getenv("CACHE_CODEC", "compact")  # 캐시 저장 형식 (json: envelope JSON, compact: 행 배열 JSON, msgpack: 행 배열 msgpack)
+    cache_compression_enabled: bool = os.getenv("CACHE_COMPRESSION_ENABLED", "true").lower() == "true"  # 큰 캐시 값 압축 여부
+    cache_compression_threshold: int = int(os.getenv("CACHE_COMPRESSION_THRESHOLD", "1024"))  # 압축 최소 크기 (bytes)
+    cache_compression_level: int = int(os.getenv("CACHE_COMPRESSION_LEVEL", "6"))  # 압축 레벨 (zlib 1~9)
+    cache_compression_algorithm: str = os.getenv("CACHE_COMPRESSION_ALGORITHM", "auto")  # zlib, lz4, auto (lz4 설치 시 lz4)
+    cache_negative_ttl: int = int(os.getenv("CACHE_NEGATIVE_TTL", "30"))  # 존재하지 않는 상품/쿠폰 부정 캐시 TTL (초 단위)
+    cache_stale_while_revalidate: bool = os.getenv("CACHE_STALE_WHILE_REVALIDATE", "true").lower() == "true"
+    cache_stale_if_error: bool = os.getenv("CACHE_STALE_IF_ERROR", "true").lower() == "true"
+    cache_stale_if_error_ttl: int = int(os.getenv("CACHE_STALE_IF_ERROR_TTL", "3600"))  # DB 장애 시 마지막 정상 값을 사용할 수 있는 최대 기간 (Hard TTL 이후, 초 단위)
+    cache_l1_enabled: bool = os.getenv("CACHE_L1_ENABLED", "true").lower() == "true"  # 프로세스 내 L1 캐시 사용 여부
+    cache_l1_ttl: float = float(os.getenv("CACHE_L1_TTL", "30"))  # L1 TTL (초 단위, Pub/Sub 유실 대비 상한)
+    cache_l1_max_entries: int = int(os.getenv("CACHE_L1_MAX_ENTRIES", "10000"))  # L1 최대 항목 수
+    cache_l1_max_bytes: int = int(os.getenv("CACHE_L1_MAX_BYTES", str(64 * 1024 * 1024)))  # L1 최대 메모리 (bytes)
+    cache_backend: str = os.getenv("CACHE_BACKEND", "redis")  # 캐시 저장소 (redis, memory: Redis 없이 프로세스 내 캐시 - 무효화가 워커 간에 전파되지 않음)
+    cache_memory_max_entries: int = int(os.getenv("CACHE_MEMORY_MAX_ENTRIES", "50000"))  # 프로세스 내 캐시 최대 항목 수
+    cache_memory_max_bytes: int = int(os.getenv("CACHE_MEMORY_MAX_BYTES", str(128 * 1024 * 1024)))  # 프로세스 내 캐시 최대 메모리 (bytes)
+    cache_response_ttl: int = int(os.getenv("CACHE_RESPONSE_TTL", "60"))  # 직렬화된 상품 목록 응답 캐시 TTL (초 단위, 0이면 비활성화)
+    cache_single_flight_enabled: bool = os.getenv("CACHE_SINGLE_FLIGHT_ENABLED", "true").lower() == "true"  # 캐시 미스 DB 조회 병합 여부
+    cache_single_flight_timeout: float = float(os.getenv("CACHE_SINGLE_FLIGHT_TIMEOUT", "5.0"))  # 병합 대기 최대 시간 (초 단위)
+    cache_invalidation_channel: str = os.getenv("CACHE_INVALIDATION_CHANNEL", "cache:invalidate")  # L1 무효화 Pub/Sub 채널
+    cache_breaker_enabled: bool = os.getenv("CACHE_BREAKER_ENABLED", "true").lower() == "true"  # Redis Circuit Breaker 사용 여부
+    cache_breaker_failure_rate: float = float(os.getenv("CACHE_BREAKER_FAILURE_RATE", "0.5"))  # 회로를 여는 실패율 (0.0 ~ 1.0)
+    cache_breaker_slow_call_seconds: float = float(os.getenv("CACHE_BREAKER_SLOW_CALL_SECONDS", "0.2"))  # 느린 호출 기준 (초 단위)
+    cache_breaker_slow_call_rate: float = float(os.getenv("CACHE_BREAKER_SLOW_CALL_RATE", "0.5"))  # 회로를 여는 느린 호출 비율 (0.0 ~ 1.0)
+    cache_breaker_window_size: int = int(os.getenv("CACHE_BREAKER_WINDOW_SIZE", "50"))  # 비율 계산에 쓰는 최근 호출 수
+    cache_breaker_minimum_calls: int = int(os.getenv("CACHE_BREAKER_MINIMUM_CALLS", "20"))  # 회로 판단 최소 호출 수
+    cache_breaker_open_seconds: float = float(os.getenv("CACHE_BREAKER_OPEN_SECONDS", "5.0"))  # 회로 열림 유지 시간 (초 단위, 이후 시험 호출)
+    cache_breaker_half_open_probes: int = int(os.getenv("CACHE_BREAKER_HALF_OPEN_PROBES", "3"))  # 회로를 닫기 위한 연속 성공 시험 호출 수
+    http_cache_max_age: int = int(os.getenv("HTTP_CACHE_MAX_AGE", "60"))  # 상품 응답 Cache-Control max-age (초 단위, 0이면 no-store)
+    http_cache_stale_while_revalidate: int = int(os.getenv("HTTP_CACHE_STALE_WHILE_REVALIDATE", "30"))  # Cache-Control stale-while-revalidate (초 단위)
+    cdn_purge_url: str = os.getenv("CDN_PURGE_URL", "")  # Surrogate-Key 삭제 요청 URL (비어 있으면 삭제 요청 안 함)
+    cdn_purge_timeout: float = float(os.getenv("CDN_PURGE_TIMEOUT", "2.0"))  # 삭제 요청 타임아웃 (초 단위)
+    cdn_purge_token: str = os.getenv("CDN_PURGE_TOKEN", "")  # 삭제 요청 인증 토큰 (선택)
+    warmup_enabled: bool = os.getenv("WARMUP_ENABLED", "true").lower() == "true"  # 시작 시 커넥션 풀/캐시 워밍 여부
+    warmup_concurrency: int = int(os.getenv("WARMUP_CONCURRENCY", "4"))  # 캐시 워밍 동시 실행 수 (MySQL 부하 상한)
+    warmup_timeout: float = float(os.getenv("WARMUP_TIMEOUT", "30.0"))  # 워밍 최대 시간 (초 단위, 초과 시 중단하고 ready)
+    warmup_redis_connections: int = int(os.getenv("WARMUP_REDIS_CONNECTIONS", "10"))  # 미리 열어둘 Redis 연결 수
+    warmup_hot_keys_limit: int = int(os.getenv("WARMUP_HOT_KEYS_LIMIT", "200"))  # 워밍할 인기 키 수 (저장 상한 겸용)
+    warmup_hot_keys_redis_key: str = os.getenv("WARMUP_HOT_KEYS_REDIS_KEY", "cache:hotkeys")  # 인기 키 Sorted Set
+    warmup_hot_keys_persist_interval: float = float(os.getenv("WARMUP_HOT_KEYS_PERSIST_INTERVAL", "60.0"))  # 인기 키 저장 주기 (초 단위)
     
     model_config = SettingsConfigDict(
         env_file=".env",
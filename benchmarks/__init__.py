@@ -0,0 +1 @@
+"""성능 벤치마크 스크립트 (외부 의존성 없이 실행 가능)"""
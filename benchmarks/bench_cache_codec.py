@@ -0,0 +1,98 @@
+"""
+캐시 코덱 벤치마크 - 상품 목록 1페이지 인코딩/디코딩 시간 및 크기 비교
+
+limit=100 페이지(한글 상품명)를 RedisCacheAdapter가 저장하는 형태 그대로
+(ID 목록 키 1개 + 상품 단건 키 100개) 각 코덱으로 직렬화/역직렬화하여
+페이지 1개당 평균 시간(µs)과 저장 크기(bytes, 키별 압축 임계값 적용 후 크기 포함)를 비교합니다.
+
+실행:
+    uv run python -m benchmarks.bench_cache_codec
+"""
+
+import argparse
+import time
+import timeit
+
+from app.domain.entities.product import Product
+from app.domain.ports.cache_adapter import CacheEntry
+from app.infrastructure.adapters.cache.codec import (
+    PRODUCT,
+    PRODUCT_IDS,
+    CacheCodec,
+    CompactCodec,
+    JsonCodec,
+    JsonSerializer,
+    MsgpackSerializer,
+    decode_entry,
+)
+from app.infrastructure.adapters.cache.compression import PayloadCompressor
+from app.infrastructure.monitoring.metrics import MetricsRegistry
+
+
+def build_page(size: int) -> tuple[CacheEntry[list[int]], list[CacheEntry[Product]]]:
+    """한글 상품명으로 채운 상품 목록 1페이지 - (ID 목록 항목, 상품 단건 항목)"""
+    products = [
+        Product(
+            id=100000 + i,
+            name=f"[무료배송] 프리미엄 무선 기계식 키보드 저소음 적축 한글 각인 {i}번 모델",
+            price=89000 + i * 100,
+            stock=i % 50,
+            category_id=3,
+            discount_rate=0.15,
+        )
+        for i in range(size)
+    ]
+    now = time.time()
+    
+    def entry(value):
+        return CacheEntry(value=value, stored_at=now, fresh_until=now + 240, expires_at=now + 300, compute_time=0.012)
+    
+    return entry([p.id for p in products]), [entry(p) for p in products]
+
+
+def codecs() -> list[tuple[str, CacheCodec]]:
+    """비교 대상 코덱 (msgpack은 설치된 경우에만)"""
+    result: list[tuple[str, CacheCodec]] = [
+        ("json (dict envelope)", JsonCodec()),
+        ("compact (json rows)", CompactCodec(JsonSerializer())),
+    ]
+    try:
+        result.append(("msgpack (rows)", CompactCodec(MsgpackSerializer())))
+    except ImportError:
+        print("msgpack 미설치 - msgpack 코덱은 건너뜁니다")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="캐시 코덱 벤치마크")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--number", type=int, default=500, help="측정 반복 횟수")
+    parser.add_argument("--compression-threshold", type=int, default=1024, help="키별 압축 임계값 (bytes)")
+    args = parser.parse_args()
+    
+    ids_entry, product_entries = build_page(args.page_size)
+    targets = codecs()
+    compressor = PayloadCompressor(threshold=args.compression_threshold, algorithm="zlib", metrics=MetricsRegistry())
+    print(f"page_size={args.page_size} number={args.number} (ID 목록 1개 + 상품 {args.page_size}개)")
+    print(f"{'codec':<24}{'encode µs':>12}{'decode µs':>12}{'bytes':>10}{'zlib bytes':>12}")
+    for name, codec in targets:
+        def encode_page() -> list[bytes]:
+            return [codec.encode(PRODUCT_IDS, ids_entry)] + [codec.encode(PRODUCT, e) for e in product_entries]
+        
+        raw_ids, *raw_products = encode_page()
+        
+        def decode_page() -> None:
+            decode_entry(raw_ids, PRODUCT_IDS, 240, 300, 0.0)
+            for raw in raw_products:
+                decode_entry(raw, PRODUCT, 240, 300, 0.0)
+        
+        encode = timeit.timeit(encode_page, number=args.number)
+        decode = timeit.timeit(decode_page, number=args.number)
+        raws = [raw_ids, *raw_products]
+        size = sum(len(raw) for raw in raws)
+        compressed = sum(len(compressor.compress(raw)) for raw in raws)
+        print(f"{name:<24}{encode / args.number * 1e6:>12.1f}{decode / args.number * 1e6:>12.1f}{size:>10}{compressed:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+캐시 동시 만료(Miss Burst) 벤치마크 - TTL Jitter / XFetch 효과 측정
+
+배포 직후처럼 모든 키가 같은 시각에 채워진 상황을 가상 시계로 시뮬레이션하고,
+1초 구간별 DB 재계산 횟수의 최댓값(miss burst)을 비교합니다.
+
+실행:
+    uv run python -m benchmarks.bench_cache_expiry
+"""
+
+import argparse
+import random
+from collections import Counter
+
+from app.application.utils.cache_helper import should_refresh_early
+from app.domain.ports.cache_adapter import CacheEntry
+
+
+def simulate(
+    keys: int,
+    ttl: float,
+    duration: float,
+    request_rate: float,
+    compute_time: float,
+    jitter: float,
+    beta: float,
+    tick: float = 0.1,
+    seed: int = 42,
+) -> tuple[int, int]:
+    """
+    가상 시계 시뮬레이션
+    
+    Returns:
+        (1초 구간 최대 재계산 수, 전체 재계산 수)
+    """
+    rng = random.Random(seed)
+    
+    def store(now: float) -> CacheEntry:
+        # RedisCacheAdapter._write와 같은 방식으로 TTL을 줄이는 방향의 jitter 적용
+        scale = 1.0 - rng.uniform(0.0, jitter) if jitter > 0 else 1.0
+        return CacheEntry(
+            value=None,
+            stored_at=now,
+            fresh_until=now + ttl * scale,
+            expires_at=now + ttl * scale,
+            compute_time=compute_time,
+        )
+    
+    cache = {key: store(0.0) for key in range(keys)}  # 배포 직후 일괄 워밍
+    recomputes: Counter[int] = Counter()
+    per_tick_probability = request_rate * tick
+    
+    steps = int(duration / tick)
+    for step in range(1, steps + 1):
+        now = step * tick
+        for key in range(keys):
+            if rng.random() >= per_tick_probability:
+                continue
+            entry = cache[key]
+            if entry.is_expired(now) or should_refresh_early(entry, beta, now=now, rand=rng.random()):
+                cache[key] = store(now)
+                recomputes[int(now)] += 1
+    
+    return max(recomputes.values(), default=0), sum(recomputes.values())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="캐시 동시 만료 벤치마크")
+    parser.add_argument("--keys", type=int, default=300)
+    parser.add_argument("--ttl", type=float, default=120.0)
+    parser.add_argument("--duration", type=float, default=600.0)
+    parser.add_argument("--rate", type=float, default=1.0, help="키당 초당 요청 수")
+    parser.add_argument("--compute-time", type=float, default=0.2, help="DB 재계산 소요 시간 (초)")
+    args = parser.parse_args()
+    
+    scenarios = [
+        ("baseline", 0.0, 0.0),
+        ("jitter=0.1", 0.1, 0.0),
+        ("xfetch beta=1", 0.0, 1.0),
+        ("jitter=0.1 + xfetch", 0.1, 1.0),
+    ]
+    
+    print(f"keys={args.keys} ttl={args.ttl}s duration={args.duration}s rate={args.rate}/s compute={args.compute_time}s")
+    print(f"{'scenario':<24}{'max burst/1s':>14}{'total recomputes':>18}")
+    for name, jitter, beta in scenarios:
+        burst, total = simulate(
+            keys=args.keys,
+            ttl=args.ttl,
+            duration=args.duration,
+            request_rate=args.rate,
+            compute_time=args.compute_time,
+            jitter=jitter,
+            beta=beta,
+        )
+        print(f"{name:<24}{burst:>14}{total:>18}")
+
+
+if __name__ == "__main__":
+    main()
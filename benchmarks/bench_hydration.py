@@ -0,0 +1,120 @@
+"""
+상품 행 → 도메인 엔티티 변환(hydration) 벤치마크 - ORM → 매퍼 경로와 Core 행 직접 복원 비교
+
+- orm: select(ProductModel) → ORM 인스턴스(identity map, 속성 계측, created_at 포함) → ProductMapper.to_domain (검증)
+- core+validate: 필요한 컬럼만 Core로 조회 → Product 생성자 (검증)
+- core+restore: 필요한 컬럼만 Core로 조회 → Product.restore (검증 생략, 저장소 경로)
+
+요청마다 세션을 새로 여는 것처럼 페이지 1개마다 세션 1개를 사용합니다.
+기본값은 메모리 SQLite에 상품을 채워 측정하므로 MySQL이 필요 없습니다.
+--database-url(동기 드라이버, 예: mysql+pymysql://...)을 지정하면 기존 products 테이블에서 측정합니다.
+
+실행:
+    uv run python -m benchmarks.bench_hydration
+    uv run python -m benchmarks.bench_hydration --limit 20 100 1000
+"""
+
+import argparse
+import time
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.domain.entities.product import Product
+from app.infrastructure.mappers.product_mapper import ProductMapper
+from app.infrastructure.models.category_model import CategoryModel
+from app.infrastructure.models.product_model import ProductModel
+from app.infrastructure.settings.config import Base
+
+product_table = ProductModel.__table__
+
+
+def create_sqlite(rows: int, category_id: int) -> Engine:
+    """메모리 SQLite에 상품 rows개 적재"""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine, tables=[CategoryModel.__table__, product_table])
+    with engine.begin() as connection:
+        connection.execute(insert(CategoryModel.__table__), [{"id": category_id, "name": "벤치마크"}])
+        connection.execute(
+            insert(product_table),
+            [
+                {
+                    "id": i,
+                    "name": f"[무료배송] 프리미엄 무선 기계식 키보드 저소음 적축 한글 각인 {i}번 모델",
+                    "price": 89000 + i,
+                    "stock": i % 50,
+                    "category_id": category_id,
+                    "discount_rate": 0.15,
+                }
+                for i in range(1, rows + 1)
+            ],
+        )
+    return engine
+
+
+def orm(session: Session, category_id: int, limit: int) -> list[Product]:
+    stmt = select(ProductModel).where(ProductModel.category_id == category_id).order_by(ProductModel.id).limit(limit)
+    return [ProductMapper.to_domain(model) for model in session.execute(stmt).scalars().all()]
+
+
+def core_validate(session: Session, category_id: int, limit: int) -> list[Product]:
+    stmt = select(*ProductMapper.COLUMNS).where(product_table.c.category_id == category_id).order_by(product_table.c.id).limit(limit)
+    return [Product(*row) for row in session.connection().execute(stmt)]
+
+
+def core_restore(session: Session, category_id: int, limit: int) -> list[Product]:
+    stmt = select(*ProductMapper.COLUMNS).where(product_table.c.category_id == category_id).order_by(product_table.c.id).limit(limit)
+    from_row = ProductMapper.from_row
+    return [from_row(row) for row in session.connection().execute(stmt)]
+
+
+def measure(engine: Engine, path, category_id: int, limit: int, duration: float, repeat: int) -> float:
+    """rows/sec (페이지마다 세션 1개, repeat회 중 최댓값으로 잡음 영향 감소)"""
+    # 워밍업 (문장 컴파일 캐시)
+    with Session(engine) as session:
+        path(session, category_id, limit)
+    
+    best = 0.0
+    for _ in range(repeat):
+        hydrated = 0
+        started = time.perf_counter()
+        deadline = started + duration
+        while time.perf_counter() < deadline:
+            with Session(engine) as session:
+                hydrated += len(path(session, category_id, limit))
+        best = max(best, hydrated / (time.perf_counter() - started))
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="상품 hydration 벤치마크 (ORM → 매퍼 vs Core 행 직접 복원)")
+    parser.add_argument("--database-url", default=None, help="동기 드라이버 DB URL (없으면 메모리 SQLite)")
+    parser.add_argument("--rows", type=int, default=5000, help="메모리 SQLite에 적재할 상품 수")
+    parser.add_argument("--category-id", type=int, default=1)
+    parser.add_argument("--limit", type=int, nargs="+", default=[20, 100, 1000], help="페이지 크기")
+    parser.add_argument("--duration", type=float, default=0.5, help="1회 측정 시간 (초)")
+    parser.add_argument("--repeat", type=int, default=5, help="경로별 반복 횟수 (최댓값 사용)")
+    args = parser.parse_args()
+    
+    if args.database_url:
+        engine = create_engine(args.database_url)
+        print(f"DB: {args.database_url.rsplit('@', 1)[-1]}")
+    else:
+        engine = create_sqlite(args.rows, args.category_id)
+        print(f"메모리 SQLite (상품 {args.rows}개)")
+    
+    paths = [("orm", orm), ("core+validate", core_validate), ("core+restore", core_restore)]
+    print(f"{'path':<15}{'limit':>7}{'rows/sec':>12}{'vs orm':>9}")
+    for limit in args.limit:
+        baseline = None
+        for name, path in paths:
+            rps = measure(engine, path, args.category_id, limit, args.duration, args.repeat)
+            baseline = baseline or rps
+            print(f"{name:<15}{limit:>7}{rps:>12.0f}{rps / baseline:>8.2f}x")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
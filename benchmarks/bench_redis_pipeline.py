@@ -0,0 +1,150 @@
+"""
+Redis 자동 파이프라이닝 벤치마크 - 동시성 수준별 처리량(ops/sec)과 p99 지연 비교
+
+동시 코루틴 N개가 상품 목록 요청과 같은 순서(ID 목록 GET → 상품 MGET → 개수 GET)로
+명령을 보내며, 직접 호출과 AutoPipeline을 비교합니다.
+
+기본값은 네트워크 왕복 지연(--rtt-ms)을 흉내 낸 가상 Redis를 사용하므로 Redis가 필요 없습니다.
+--redis-url을 지정하면 실제 Redis로 측정합니다.
+
+실행:
+    uv run python -m benchmarks.bench_redis_pipeline
+    uv run python -m benchmarks.bench_redis_pipeline --redis-url redis://localhost:6379/0
+"""
+
+import argparse
+import asyncio
+import time
+
+from app.infrastructure.adapters.cache.auto_pipeline import AutoPipeline
+from app.infrastructure.monitoring.metrics import MetricsRegistry
+
+
+class SimulatedRedis:
+    """
+    가상 Redis - 명령 1회(파이프라인 포함)마다 연결 1개를 왕복 지연 동안 점유
+    
+    연결 풀 크기(connections)를 넘는 동시 명령은 연결을 기다리므로,
+    실제 클라이언트처럼 왕복 횟수가 처리량의 상한이 됩니다.
+    """
+    
+    def __init__(self, rtt: float, connections: int):
+        self.rtt = rtt
+        self.data: dict[str, bytes] = {}
+        self._connections = asyncio.Semaphore(connections)
+    
+    async def round_trip(self) -> None:
+        async with self._connections:
+            await asyncio.sleep(self.rtt)
+    
+    async def get(self, key: str) -> bytes | None:
+        await self.round_trip()
+        return self.data.get(key)
+    
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        await self.round_trip()
+        return [self.data.get(key) for key in keys]
+    
+    async def setex(self, key: str, ttl: int, value: bytes) -> bool:
+        await self.round_trip()
+        self.data[key] = value
+        return True
+    
+    def pipeline(self, transaction: bool = True) -> "SimulatedPipeline":
+        return SimulatedPipeline(self)
+
+
+class SimulatedPipeline:
+    def __init__(self, redis: SimulatedRedis):
+        self.redis = redis
+        self.commands: list[tuple] = []
+    
+    def get(self, key: str) -> None:
+        self.commands.append((self.redis.data.get, key))
+    
+    def mget(self, keys: list[str]) -> None:
+        self.commands.append((lambda ks: [self.redis.data.get(k) for k in ks], keys))
+    
+    def setex(self, key: str, ttl: int, value: bytes) -> None:
+        self.commands.append((self.redis.data.__setitem__, key, value))
+    
+    async def execute(self, raise_on_error: bool = True) -> list:
+        await self.redis.round_trip()
+        return [command(*args) for command, *args in self.commands]
+
+
+async def seed(client, items: int) -> None:
+    await client.setex("bench:ids", 300, b",".join(str(i).encode() for i in range(items)))
+    await client.setex("bench:count", 300, str(items).encode())
+    for i in range(items):
+        await client.setex(f"bench:item:{i}", 300, b"x" * 200)
+
+
+async def run_level(client, concurrency: int, duration: float, items: int) -> tuple[float, float]:
+    """
+    동시성 수준 1개 측정
+    
+    Returns:
+        (ops/sec, p99 지연 ms) - op는 목록 요청 1회(명령 3개)
+    """
+    latencies: list[float] = []
+    item_keys = [f"bench:item:{i}" for i in range(items)]
+    deadline = time.perf_counter() + duration
+    
+    async def worker() -> None:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            await client.get("bench:ids")
+            await client.mget(item_keys)
+            await client.get("bench:count")
+            latencies.append(time.perf_counter() - started)
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return len(latencies) / elapsed, p99 * 1000
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    if args.redis_url:
+        import redis.asyncio as redis
+        pool = redis.BlockingConnectionPool.from_url(args.redis_url, max_connections=args.connections)
+        raw = redis.Redis(connection_pool=pool)
+        print(f"Redis: {args.redis_url}")
+    else:
+        raw = SimulatedRedis(args.rtt_ms / 1000, args.connections)
+        print(f"가상 Redis (RTT {args.rtt_ms}ms, 연결 {args.connections}개)")
+    
+    await seed(raw, args.items)
+    clients = [
+        ("direct", raw),
+        ("auto-pipeline", AutoPipeline(raw, window=args.window, metrics=MetricsRegistry())),
+    ]
+    
+    print(f"{'client':<16}{'concurrency':>12}{'ops/sec':>12}{'p99 ms':>10}")
+    for concurrency in args.concurrency:
+        for name, client in clients:
+            ops, p99 = await run_level(client, concurrency, args.duration, args.items)
+            print(f"{name:<16}{concurrency:>12}{ops:>12.0f}{p99:>10.2f}")
+    
+    if args.redis_url:
+        await raw.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Redis 자동 파이프라이닝 벤치마크")
+    parser.add_argument("--redis-url", default=None, help="실제 Redis URL (없으면 가상 Redis)")
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="가상 Redis 왕복 지연 (ms)")
+    parser.add_argument("--connections", type=int, default=10, help="연결 풀 크기")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50, 200])
+    parser.add_argument("--duration", type=float, default=2.0, help="동시성 수준별 측정 시간 (초)")
+    parser.add_argument("--items", type=int, default=20, help="MGET 키 수 (페이지 크기)")
+    parser.add_argument("--window", type=float, default=0.0, help="AutoPipeline 수집 시간 (초)")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
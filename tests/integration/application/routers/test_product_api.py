@@ -59,6 +59,23 @@ async def test_get_product_list_validation_error(client: AsyncClient):
     assert response.status_code == 422
 
 
+@pytest.mark.asyncio
+async def test_get_product_list_cursor_matches_offset_pages(client: AsyncClient):
+    """상품 목록 조회 API - 커서로 이어 받은 페이지가 OFFSET 페이지와 같은지 검증"""
+    page_1 = (await client.get("/api/products?limit=5&page=1")).json()
+    page_2 = (await client.get("/api/products?limit=5&page=2")).json()
+    if page_1["next_cursor"] is None:
+        pytest.skip("상품이 5개 이하라 다음 페이지가 없습니다")
+    
+    response = await client.get("/api/products", params={"limit": 5, "cursor": page_1["next_cursor"]})
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["products"] == page_2["products"]
+    assert data["current_page"] is None
+    assert data["total_count"] == page_1["total_count"]
+
+
 @pytest.mark.asyncio
 async def test_get_product_detail_not_found(client: AsyncClient):
     """상품 상세 조회 API - 상품 없음 404 에러 핸들링 검증"""
@@ -114,3 +131,20 @@ async def test_get_product_detail_with_valid_coupon_format(client: AsyncClient):
         data = response.json()
         assert "detail" in data
 
+
+
+@pytest.mark.asyncio
+async def test_get_product_batch_matches_detail(client: AsyncClient):
+    """상품 일괄 조회 API - 목록의 상품을 역순으로 요청하면 같은 순서로, 없는 ID는 missing_ids로 응답"""
+    listing = (await client.get("/api/products?limit=5&page=1")).json()
+    ids = [p["id"] for p in listing["products"]][::-1]
+    
+    response = await client.get(f"/api/products/batch?ids={','.join(map(str, ids + [999999999]))}")
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert [p["id"] for p in data["products"]] == ids
+    assert data["missing_ids"] == [999999999]
+    for item in data["products"]:
+        detail = (await client.get(f"/api/products/{item['id']}")).json()
+        assert item == detail
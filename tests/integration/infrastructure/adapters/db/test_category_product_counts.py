@@ -0,0 +1,95 @@
+"""카테고리별 상품 개수 요약 테이블 통합 테스트 - 트리거 유지 + 재구성 검증"""
+
+import pytest
+from tests.integration.helpers.db_helpers import (
+    with_db_session,
+    execute_sql,
+    create_test_category,
+    cleanup_test_category,
+    create_test_product,
+    cleanup_test_product,
+)
+from app.infrastructure.adapters.db.category_count_reconciler import CategoryCountReconciler
+from app.infrastructure.adapters.db.product_repository_impl import ProductRepositoryImpl
+from app.infrastructure.models.category_product_count_model import CategoryProductCountModel
+from app.infrastructure.settings.config import async_session_maker
+
+
+async def _counts() -> tuple[int, int, int]:
+    async with with_db_session() as session:
+        repository = ProductRepositoryImpl(session)
+        return (
+            await repository.count_by_category(998),
+            await repository.count_by_category(999),
+            await repository.count_all(),
+        )
+
+
+async def _cleanup() -> None:
+    await cleanup_test_product(997)
+    await cleanup_test_product(998)
+    await cleanup_test_category(998)
+    await cleanup_test_category(999)
+    await execute_sql("DELETE FROM category_product_counts WHERE category_id IN (996, 998, 999)")
+
+
+@pytest.mark.asyncio
+async def test_counts_follow_product_writes():
+    """상품 INSERT/카테고리 이동/DELETE가 같은 트랜잭션에서 요약 테이블에 반영"""
+    await create_test_category(998, "테스트 카테고리 2")
+    await create_test_category(999)
+    _, _, total_before = await _counts()
+    
+    try:
+        await create_test_product(997, "상품 1", 1000, 1, 999)
+        await create_test_product(998, "상품 2", 2000, 1, 999)
+        assert await _counts() == (0, 2, total_before + 2)
+        
+        await execute_sql("UPDATE products SET category_id = 998 WHERE id = 998")
+        assert await _counts() == (1, 1, total_before + 2)
+        
+        await cleanup_test_product(997)
+        assert await _counts() == (1, 0, total_before + 1)
+    finally:
+        await _cleanup()
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_insert_does_not_change_count():
+    """롤백된 INSERT는 개수에도 반영되지 않음"""
+    await create_test_category(999)
+    _, _, total_before = await _counts()
+    
+    try:
+        await execute_sql(
+            "INSERT INTO products (id, name, price, stock, category_id) VALUES (997, '상품', 1000, 1, 999)",
+            commit=False,
+        )
+        assert await _counts() == (0, 0, total_before)
+    finally:
+        await _cleanup()
+
+
+@pytest.mark.asyncio
+async def test_reconcile_fixes_drift():
+    """어긋난 요약 행과 삭제된 카테고리의 행을 재구성 명령이 바로잡음"""
+    await create_test_category(998, "테스트 카테고리 2")
+    await create_test_category(999)
+    
+    try:
+        await create_test_product(997, "상품 1", 1000, 1, 999)
+        _, _, total = await _counts()
+        await execute_sql("UPDATE category_product_counts SET product_count = 42 WHERE category_id = 999")
+        await execute_sql("INSERT INTO category_product_counts (category_id, product_count) VALUES (998, 7)")
+        await execute_sql("INSERT INTO category_product_counts (category_id, product_count) VALUES (996, 5)")
+        
+        fixed = await CategoryCountReconciler(async_session_maker).reconcile(chunk_size=1)
+        
+        assert fixed >= 3  # 카테고리 998, 999 보정 + 없는 카테고리 996 행 삭제
+        assert await _counts() == (0, 1, total)
+        async with with_db_session() as session:
+            orphan = await session.get(CategoryProductCountModel, 996)
+        assert orphan is None
+        assert await CategoryCountReconciler(async_session_maker).reconcile() == 0
+    finally:
+        await _cleanup()
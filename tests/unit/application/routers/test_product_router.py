@@ -0,0 +1,177 @@
+"""Product Router 테스트 - 캐시에 채운 데이터로 DB 없이 응답"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from unittest.mock import AsyncMock
+from app.application.dependencies import get_cache_adapter, get_cache_policy, get_read_db_session
+from app.application.main import app
+from app.application.utils.cache_helper import CachePolicy
+from app.application.utils.http_cache import unpack_response
+from app.domain.entities.product import Product
+from app.infrastructure.adapters.cache.local_cache import LocalCache
+from app.infrastructure.adapters.cache.memory_adapter import InMemoryCacheAdapter, MemoryCacheStore
+from app.infrastructure.monitoring.metrics import MetricsRegistry
+
+
+@pytest.fixture
+async def cache_adapter():
+    """상품 2개가 채워진 프로세스 내 캐시"""
+    adapter = InMemoryCacheAdapter(MemoryCacheStore(LocalCache()), metrics=MetricsRegistry())
+    products = [
+        Product(id=1, name="노트북", price=1000000, stock=10, category_id=1, discount_rate=0.2),
+        Product(id=2, name="마우스", price=30000, stock=5, category_id=1, discount_rate=0.0),
+    ]
+    await adapter.set_product_list(products, offset=0, limit=20)
+    await adapter.set_product_count(2)
+    await adapter.set_products(products)
+    return adapter
+
+
+@pytest.fixture
+async def client(cache_adapter):
+    """DB 세션 대신 Mock, 캐시 어댑터는 채워진 프로세스 내 캐시 사용"""
+    async def fake_session():
+        yield AsyncMock()
+    
+    app.dependency_overrides[get_read_db_session] = fake_session
+    app.dependency_overrides[get_cache_adapter] = lambda: cache_adapter
+    app.dependency_overrides[get_cache_policy] = lambda: CachePolicy()  # 블록 정렬 없이 요청 범위 그대로
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/api/products?limit=20&page=1", "/api/products/1", "/api/products/batch?ids=2,1"])
+async def test_etag_revalidation_returns_304(client: AsyncClient, path: str):
+    """ETag가 일치하면 본문 없이 304, 다르면 200"""
+    first = await client.get(path)
+    etag = first.headers["etag"]
+    
+    revalidated = await client.get(path, headers={"If-None-Match": etag})
+    changed = await client.get(path, headers={"If-None-Match": '"stale"'})
+    
+    assert first.status_code == 200
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+    assert changed.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_cdn_headers(client: AsyncClient):
+    """Cache-Control과 상품/카테고리 Surrogate-Key (304에도 포함)"""
+    listing = await client.get("/api/products?limit=20&page=1")
+    detail = await client.get("/api/products/1")
+    revalidated = await client.get("/api/products/1", headers={"If-None-Match": detail.headers["etag"]})
+    
+    assert listing.headers["cache-control"].startswith("public, max-age=")
+    assert listing.headers["surrogate-key"] == "products category-all product-1 product-2"
+    assert detail.headers["surrogate-key"] == "products product-1"
+    assert revalidated.headers["surrogate-key"] == "products product-1"
+
+
+@pytest.mark.asyncio
+async def test_list_response_served_from_serialized_cache(client: AsyncClient, cache_adapter):
+    """첫 응답의 직렬화 결과를 저장하고, 이후에는 저장된 바이트를 그대로 응답"""
+    first = await client.get("/api/products?limit=20&page=1")
+    etag, surrogate_keys, body = unpack_response(await cache_adapter.get_list_response(offset=0, limit=20))
+    second = await client.get("/api/products?limit=20&page=1")
+    
+    assert first.json()["total_count"] == 2
+    assert [p["id"] for p in first.json()["products"]] == [1, 2]
+    assert body == first.content == second.content
+    assert etag == first.headers["etag"] == second.headers["etag"]
+    assert second.headers["surrogate-key"] == surrogate_keys
+    assert second.headers["content-type"] == "application/json"
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination(client: AsyncClient, cache_adapter):
+    """next_cursor로 다음 페이지를 키셋 조회 (offset 페이지와 별도 캐시 키)"""
+    entries = await cache_adapter.get_products([1, 2])
+    await cache_adapter.set_product_list([entries[1].value], offset=0, limit=1)
+    await cache_adapter.set_product_list([entries[2].value], limit=1, after_id=1)
+    
+    first = await client.get("/api/products?limit=1&page=1")
+    second = await client.get("/api/products", params={"limit": 1, "cursor": first.json()["next_cursor"]})
+    invalid = await client.get("/api/products?cursor=invalid")
+    
+    assert [p["id"] for p in first.json()["products"]] == [1]
+    assert first.json()["current_page"] == 1
+    assert [p["id"] for p in second.json()["products"]] == [2]
+    assert second.json()["current_page"] is None
+    assert second.json()["next_cursor"] != first.json()["next_cursor"]
+    assert second.headers["etag"] != first.headers["etag"]
+    assert invalid.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_batch_keeps_requested_order_and_reports_missing(client: AsyncClient, cache_adapter):
+    """요청 순서대로 응답하고 존재하지 않는 ID는 missing_ids로 (중복 ID는 한 번만)"""
+    await cache_adapter.set_products([], missing_ids=[999])
+    
+    response = await client.get("/api/products/batch?ids=2,999,1,2")
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert [p["id"] for p in data["products"]] == [2, 1]
+    assert data["products"][1]["discounted_price"] == 800000
+    assert data["missing_ids"] == [999]
+    assert response.headers["surrogate-key"] == "products category-all product-2 product-1"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ids, status_code", [("1,,2", 422), ("0", 422), (",".join(str(i) for i in range(1, 202)), 400)])
+async def test_batch_rejects_invalid_ids(client: AsyncClient, ids: str, status_code: int):
+    """형식이 잘못된 ID 목록은 422, 최대 개수 초과는 400"""
+    response = await client.get(f"/api/products/batch?ids={ids}")
+    
+    assert response.status_code == status_code
+
+
+class PrimarySession:
+    """primary 세션 대신 사용 - 실행한 조회를 기록하고 상품 3을 반환"""
+    
+    def __init__(self, statements: list):
+        self.statements = statements
+    
+    async def __aenter__(self) -> "PrimarySession":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+    
+    async def connection(self) -> "PrimarySession":
+        return self
+    
+    async def execute(self, stmt) -> list[tuple]:
+        self.statements.append(stmt)
+        return [(3, "키보드", 50000, 3, 1, 0.0)]
+
+
+@pytest.mark.asyncio
+async def test_strong_consistency_detail_reads_primary(cache_adapter, monkeypatch):
+    """X-Read-Consistency: strong이면 캐시 미스 조회를 읽기 복제본/일괄 조회 로더 없이 primary에서 실행"""
+    from app.application import dependencies
+    from app.infrastructure.adapters.db import replica_router
+    
+    class NoReplica:
+        def read_session(self):
+            raise AssertionError("strong 요청이 읽기 복제본을 사용함")
+    
+    statements: list = []
+    monkeypatch.setattr(dependencies, "async_session_maker", lambda: PrimarySession(statements))
+    monkeypatch.setattr(replica_router, "get_replica_router", lambda: NoReplica())
+    app.dependency_overrides[get_cache_adapter] = lambda: cache_adapter
+    app.dependency_overrides[get_cache_policy] = lambda: CachePolicy()
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/api/products/3", headers={"X-Read-Consistency": "strong"})
+    finally:
+        app.dependency_overrides.clear()
+    
+    assert response.status_code == 200
+    assert response.json()["name"] == "키보드"
+    assert len(statements) == 1
@@ -1,8 +1,11 @@
 """ProductService Application Service 테스트 (비즈니스 로직 중심)"""
 
+import asyncio
 import pytest
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock
 from app.application.services.product_service import ProductService
+from app.application.utils.cache_helper import CachePolicy
 from app.domain.entities.product import Product
 from app.domain.entities.coupon import Coupon
 from app.domain.exceptions import (
@@ -10,7 +13,10 @@ from app.domain.exceptions import (
     CouponNotFoundException,
     InvalidCouponException,
 )
-from app.domain.ports.cache_adapter import CacheAdapter
+from app.domain.ports.cache_adapter import CacheAdapter, CacheEntry
+from app.infrastructure.adapters.cache.local_cache import LocalCache
+from app.infrastructure.adapters.cache.memory_adapter import InMemoryCacheAdapter, MemoryCacheStore
+from app.infrastructure.monitoring.metrics import MetricsRegistry
 from datetime import datetime, timedelta
 
 
@@ -107,6 +113,125 @@ async def test_get_product_list_without_category(
     )
 
 
+@pytest.mark.asyncio
+async def test_get_product_list_keyset(
+    mock_product_repository,
+    sample_product,
+    mock_cache_adapter,
+):
+    """after_id가 있으면 키셋 조회 (블록 정렬 없이 after_id/limit으로 캐싱)"""
+    mock_product_repository.find_by_category_after = AsyncMock(return_value=[sample_product])
+    mock_cache_adapter.get_product_list = AsyncMock(return_value=None)
+    
+    service = ProductService(
+        product_repository=mock_product_repository,
+        coupon_repository=None,
+        cache_adapter=mock_cache_adapter,
+        cache_policy=CachePolicy(list_block_size=100),
+    )
+    
+    products = await service.get_product_list(category_id=1, limit=20, after_id=500)
+    
+    assert products == [sample_product]
+    mock_product_repository.find_by_category_after.assert_awaited_once_with(
+        category_id=1,
+        after_id=500,
+        limit=20,
+    )
+    mock_product_repository.find_by_category.assert_not_called()
+    mock_cache_adapter.set_product_list.assert_awaited_once()
+    assert mock_cache_adapter.set_product_list.await_args.kwargs["after_id"] == 500
+    assert mock_cache_adapter.set_product_list.await_args.kwargs["limit"] == 20
+
+
+@pytest.mark.asyncio
+async def test_get_product_list_with_count_single_query_on_double_miss(mock_product_repository, sample_product):
+    """개수/목록 캐시가 모두 미스이면 한 쿼리로 조회해 블록 목록과 개수를 함께 캐시"""
+    mock_product_repository.find_page_with_count = AsyncMock(return_value=([sample_product], 1))
+    adapter = InMemoryCacheAdapter(MemoryCacheStore(LocalCache()), metrics=MetricsRegistry())
+    service = ProductService(
+        product_repository=mock_product_repository,
+        coupon_repository=None,
+        cache_adapter=adapter,
+        cache_policy=CachePolicy(list_block_size=100),
+    )
+    
+    products, total_count = await service.get_product_list_with_count(category_id=1, offset=0, limit=20)
+    
+    assert (products, total_count) == ([sample_product], 1)
+    mock_product_repository.find_page_with_count.assert_awaited_once_with(category_id=1, offset=0, limit=100)
+    mock_product_repository.find_by_category.assert_not_called()
+    mock_product_repository.count_by_category.assert_not_called()
+    assert (await adapter.get_product_count(category_id=1)).value == 1
+
+
+@pytest.mark.asyncio
+async def test_get_product_list_with_count_concurrent_pages_fetch_own_block(mock_product_repository, sample_product):
+    """다른 목록 구간의 동시 이중 미스는 개수 병합을 공유하지 않고 각자 한 쿼리로 조회"""
+    release = asyncio.Event()
+    
+    async def find_page_with_count(category_id, offset, limit):
+        await release.wait()
+        return [sample_product], 150
+    
+    mock_product_repository.find_page_with_count = AsyncMock(side_effect=find_page_with_count)
+    adapter = InMemoryCacheAdapter(MemoryCacheStore(LocalCache()), metrics=MetricsRegistry())
+    service = ProductService(
+        product_repository=mock_product_repository,
+        coupon_repository=None,
+        cache_adapter=adapter,
+        cache_policy=CachePolicy(list_block_size=100),
+    )
+    
+    first = asyncio.create_task(service.get_product_list_with_count(category_id=1, offset=0, limit=20))
+    second = asyncio.create_task(service.get_product_list_with_count(category_id=1, offset=100, limit=20))
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(first, second)
+    
+    assert results == [([sample_product], 150), ([sample_product], 150)]
+    assert sorted(call.kwargs["offset"] for call in mock_product_repository.find_page_with_count.await_args_list) == [0, 100]
+    mock_product_repository.find_by_category.assert_not_called()
+    mock_product_repository.count_by_category.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_product_list_with_count_does_not_cache_empty_page(mock_product_repository):
+    """한 쿼리 조회 결과가 빈 목록이면 목록 캐시에 저장하지 않음 (cache_aside의 빈 결과 규칙과 동일)"""
+    mock_product_repository.find_page_with_count = AsyncMock(return_value=([], 0))
+    mock_product_repository.find_by_category = AsyncMock(return_value=[])
+    adapter = InMemoryCacheAdapter(MemoryCacheStore(LocalCache()), metrics=MetricsRegistry())
+    service = ProductService(
+        product_repository=mock_product_repository,
+        coupon_repository=None,
+        cache_adapter=adapter,
+        cache_policy=CachePolicy(list_block_size=100),
+    )
+    
+    products, total_count = await service.get_product_list_with_count(category_id=1, offset=0, limit=20)
+    
+    assert (products, total_count) == ([], 0)
+    assert await adapter.get_product_list(category_id=1, offset=0, limit=100) is None
+
+
+@pytest.mark.asyncio
+async def test_get_product_list_with_count_counts_only_when_page_cached(mock_product_repository, sample_product):
+    """목록이 이미 캐시에 있으면 개수만 조회"""
+    mock_product_repository.count_all = AsyncMock(return_value=7)
+    adapter = InMemoryCacheAdapter(MemoryCacheStore(LocalCache()), metrics=MetricsRegistry())
+    await adapter.set_product_list([sample_product], offset=0, limit=20)
+    service = ProductService(
+        product_repository=mock_product_repository,
+        coupon_repository=None,
+        cache_adapter=adapter,
+    )
+    
+    products, total_count = await service.get_product_list_with_count(offset=0, limit=20)
+    
+    assert (products, total_count) == ([sample_product], 7)
+    mock_product_repository.find_page_with_count.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_get_product_detail_success(
     mock_product_repository,
@@ -130,6 +255,45 @@ async def test_get_product_detail_success(
     mock_product_repository.find_by_id.assert_called_once_with(1)
 
 
+@pytest.mark.asyncio
+async def test_get_product_detail_miss_uses_own_scope(
+    mock_product_repository,
+    mock_coupon_repository,
+    sample_product,
+    sample_coupon,
+    mock_cache_adapter,
+):
+    """repository_scope가 있으면 병합된 캐시 미스 조회는 요청 세션이 아닌 별도 세션 Repository로 실행"""
+    scoped_products = AsyncMock()
+    scoped_products.find_by_id = AsyncMock(return_value=sample_product)
+    scoped_coupons = AsyncMock()
+    scoped_coupons.find_by_code = AsyncMock(return_value=sample_coupon)
+    
+    @asynccontextmanager
+    async def product_scope():
+        yield scoped_products
+    
+    @asynccontextmanager
+    async def coupon_scope():
+        yield scoped_coupons
+    
+    service = ProductService(
+        product_repository=mock_product_repository,
+        coupon_repository=mock_coupon_repository,
+        cache_adapter=mock_cache_adapter,
+        repository_scope=product_scope,
+        coupon_repository_scope=coupon_scope,
+    )
+    
+    product, coupon = await service.get_product_detail(product_id=1, coupon_code="SAVE102024AB")
+    
+    assert product == sample_product and coupon == sample_coupon
+    scoped_products.find_by_id.assert_awaited_once_with(1)
+    scoped_coupons.find_by_code.assert_awaited_once_with("SAVE102024AB")
+    mock_product_repository.find_by_id.assert_not_called()
+    mock_coupon_repository.find_by_code.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_get_product_detail_with_coupon(
     mock_product_repository,
@@ -238,8 +402,11 @@ async def test_get_product_detail_invalid_coupon(
 
 @pytest.fixture
 def mock_cache_adapter():
-    """Mock CacheAdapter"""
-    return AsyncMock(spec=CacheAdapter)
+    """Mock CacheAdapter (단건 엔티티 캐시는 기본적으로 미스)"""
+    adapter = AsyncMock(spec=CacheAdapter)
+    adapter.get_products.return_value = {}
+    adapter.get_coupon.return_value = None
+    return adapter
 
 
 @pytest.mark.asyncio
@@ -268,6 +435,7 @@ async def test_get_product_list_cache_hit(
         category_id=1,
         offset=0,
         limit=20,
+        after_id=None,
     )
 
 
@@ -371,3 +539,228 @@ async def test_get_product_count_cache_miss(
     # 캐시에 저장
     mock_cache_adapter.set_product_count.assert_called_once()
 
+
+def _fresh_entry(value):
+    """신선한 캐시 항목"""
+    now = datetime.now().timestamp()
+    return CacheEntry(value=value, stored_at=now, fresh_until=now + 60, expires_at=now + 120)
+
+
+@pytest.mark.asyncio
+async def test_get_product_detail_cache_hit(
+    mock_product_repository,
+    mock_coupon_repository,
+    sample_product,
+    sample_coupon,
+    mock_cache_adapter,
+):
+    """상품/쿠폰 캐시 히트 시 DB를 조회하지 않음"""
+    mock_cache_adapter.get_products.return_value = {1: _fresh_entry(sample_product)}
+    mock_cache_adapter.get_coupon.return_value = _fresh_entry(sample_coupon)
+    
+    service = ProductService(
+        product_repository=mock_product_repository,
+        coupon_repository=mock_coupon_repository,
+        cache_adapter=mock_cache_adapter,
+    )
+    
+    product, coupon = await service.get_product_detail(product_id=1, coupon_code="SAVE102024AB")
+    
+    assert product.id == 1
+    assert coupon.code == "SAVE102024AB"
+    mock_product_repository.find_by_id.assert_not_called()
+    mock_coupon_repository.find_by_code.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_product_detail_negative_cache(
+    mock_product_repository,
+    mock_cache_adapter,
+):
+    """존재하지 않는 상품은 부정 항목으로 저장되고, 이후 요청은 DB를 조회하지 않음"""
+    mock_product_repository.find_by_id = AsyncMock(return_value=None)
+    
+    service = ProductService(
+        product_repository=mock_product_repository,
+        coupon_repository=None,
+        cache_adapter=mock_cache_adapter,
+    )
+    
+    with pytest.raises(ProductNotFoundException):
+        await service.get_product_detail(product_id=999)
+    mock_cache_adapter.set_products.assert_called_once()
+    assert mock_cache_adapter.set_products.await_args.kwargs["missing_ids"] == [999]
+    
+    # 부정 항목 히트
+    mock_cache_adapter.get_products.return_value = {999: _fresh_entry(None)}
+    with pytest.raises(ProductNotFoundException):
+        await service.get_product_detail(product_id=999)
+    mock_product_repository.find_by_id.assert_called_once_with(999)
+
+
+@pytest.mark.asyncio
+async def test_get_product_detail_cached_coupon_still_validated(
+    mock_product_repository,
+    mock_coupon_repository,
+    sample_product,
+    mock_cache_adapter,
+):
+    """캐시된 쿠폰도 매 요청 유효 기간을 검사"""
+    now = datetime.now()
+    expired_coupon = Coupon(
+        id=2,
+        code="EXPIREDCODE1",
+        discount_type="rate",
+        discount_value=0.1,
+        valid_from=now - timedelta(days=10),
+        valid_to=now - timedelta(days=1),
+    )
+    mock_cache_adapter.get_products.return_value = {1: _fresh_entry(sample_product)}
+    mock_cache_adapter.get_coupon.return_value = _fresh_entry(expired_coupon)
+    
+    service = ProductService(
+        product_repository=mock_product_repository,
+        coupon_repository=mock_coupon_repository,
+        cache_adapter=mock_cache_adapter,
+    )
+    
+    with pytest.raises(InvalidCouponException):
+        await service.get_product_detail(product_id=1, coupon_code="EXPIREDCODE1")
+
+
+def _products(start: int, count: int) -> list[Product]:
+    return [Product(id=i, name=f"상품{i}", price=1000, stock=1, category_id=1) for i in range(start, start + count)]
+
+
+@pytest.mark.asyncio
+async def test_get_product_list_block_aligned(
+    mock_product_repository,
+    mock_cache_adapter,
+):
+    """블록 캐싱 시 요청 범위가 걸친 블록 전체를 조회/저장하고 잘라서 응답"""
+    async def find_all(offset: int, limit: int) -> list[Product]:
+        return _products(offset, limit)
+    
+    mock_product_repository.find_all = AsyncMock(side_effect=find_all)
+    mock_cache_adapter.get_product_list = AsyncMock(return_value=None)
+    
+    service = ProductService(
+        product_repository=mock_product_repository,
+        coupon_repository=None,
+        cache_adapter=mock_cache_adapter,
+        cache_policy=CachePolicy(list_block_size=100),
+    )
+    
+    products = await service.get_product_list(offset=90, limit=20)
+    
+    assert [p.id for p in products] == list(range(90, 110))
+    assert [call.kwargs for call in mock_product_repository.find_all.await_args_list] == [
+        {"offset": 0, "limit": 100},
+        {"offset": 100, "limit": 100},
+    ]
+    assert [call.kwargs["offset"] for call in mock_cache_adapter.set_product_list.await_args_list] == [0, 100]
+
+
+@pytest.mark.asyncio
+async def test_get_product_list_block_aligned_stops_at_last_block(
+    mock_product_repository,
+    mock_cache_adapter,
+):
+    """마지막 블록이 블록 크기보다 작으면 다음 블록은 조회하지 않음"""
+    mock_product_repository.find_by_category = AsyncMock(return_value=_products(0, 95))
+    mock_cache_adapter.get_product_list = AsyncMock(return_value=None)
+    
+    service = ProductService(
+        product_repository=mock_product_repository,
+        coupon_repository=None,
+        cache_adapter=mock_cache_adapter,
+        cache_policy=CachePolicy(list_block_size=100),
+    )
+    
+    products = await service.get_product_list(category_id=1, offset=90, limit=20)
+    
+    assert [p.id for p in products] == list(range(90, 95))
+    mock_product_repository.find_by_category.assert_called_once_with(category_id=1, offset=0, limit=100)
+
+
+@pytest.mark.asyncio
+async def test_get_products_by_ids_backfills_only_cache_misses(mock_product_repository, sample_product):
+    """캐시에 있는 ID는 DB를 조회하지 않고, 미스인 ID만 한 번에 조회해 캐시를 채움"""
+    cached = Product(id=2, name="마우스", price=30000, stock=5, category_id=1)
+    mock_product_repository.find_by_ids = AsyncMock(return_value=[sample_product])
+    adapter = InMemoryCacheAdapter(MemoryCacheStore(LocalCache()), metrics=MetricsRegistry())
+    await adapter.set_products([cached])
+    service = ProductService(
+        product_repository=mock_product_repository,
+        coupon_repository=None,
+        cache_adapter=adapter,
+    )
+    
+    products, missing_ids, coupon = await service.get_products_by_ids([3, 2, 1, 2])
+    
+    assert [p.id for p in products] == [2, 1]
+    assert missing_ids == [3]
+    assert coupon is None
+    mock_product_repository.find_by_ids.assert_awaited_once_with([3, 1])
+    
+    # 두 번째 요청은 부정 항목까지 캐시에서 응답
+    products, missing_ids, _ = await service.get_products_by_ids([1, 3])
+    assert [p.id for p in products] == [1]
+    assert missing_ids == [3]
+    mock_product_repository.find_by_ids.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_products_by_ids_invalid_coupon_skips_product_lookup(
+    mock_product_repository,
+    mock_coupon_repository,
+    mock_cache_adapter,
+):
+    """쿠폰이 없으면 상품을 조회하지 않고 CouponNotFoundException"""
+    mock_coupon_repository.find_by_code = AsyncMock(return_value=None)
+    service = ProductService(
+        product_repository=mock_product_repository,
+        coupon_repository=mock_coupon_repository,
+        cache_adapter=mock_cache_adapter,
+    )
+    
+    with pytest.raises(CouponNotFoundException):
+        await service.get_products_by_ids([1, 2], coupon_code="INVALID12345")
+    mock_cache_adapter.get_products.assert_not_called()
+    mock_product_repository.find_by_ids.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_cache(mock_product_repository, mock_cache_adapter):
+    """상품 값 변경은 단건 삭제만, 구성 변경은 목록 세대 증가"""
+    service = ProductService(
+        product_repository=mock_product_repository,
+        coupon_repository=None,
+        cache_adapter=mock_cache_adapter,
+    )
+    
+    await service.invalidate_cache(product_ids=[42])
+    mock_cache_adapter.delete_products.assert_awaited_once_with([42])
+    mock_cache_adapter.invalidate_product_lists.assert_not_called()
+    
+    await service.invalidate_cache(category_ids=[3], product_ids=[42])
+    mock_cache_adapter.invalidate_product_lists.assert_awaited_once_with([3])
+    
+    await service.invalidate_cache()
+    mock_cache_adapter.invalidate_product_lists.assert_awaited_with(None)
+
+
+@pytest.mark.asyncio
+async def test_invalidate_cache_purges_cdn(mock_product_repository, mock_cache_adapter):
+    """애플리케이션 캐시 무효화 후 같은 범위의 Surrogate-Key를 CDN에서 삭제"""
+    cdn_purger = AsyncMock()
+    service = ProductService(
+        product_repository=mock_product_repository,
+        coupon_repository=None,
+        cache_adapter=mock_cache_adapter,
+        cdn_purger=cdn_purger,
+    )
+    
+    await service.invalidate_cache(category_ids=[3], product_ids=[42])
+    
+    cdn_purger.purge.assert_awaited_once_with(["product-42", "category-all", "category-3"])
@@ -0,0 +1,54 @@
+"""시작 워밍 테스트"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from app.application.warmup import build_warm_call, count_key, detail_key, list_key, warm_hot_keys
+
+
+@pytest.mark.asyncio
+async def test_descriptors_roundtrip_to_service_calls():
+    """서술자가 같은 인자의 Service 호출로 변환됨"""
+    service = MagicMock()
+    service.get_product_list = AsyncMock()
+    service.get_product_count = AsyncMock()
+    service.get_product_detail = AsyncMock()
+    
+    await build_warm_call(list_key(3, 40, 20))(service)
+    await build_warm_call(count_key(None))(service)
+    await build_warm_call(detail_key(7))(service)
+    
+    service.get_product_list.assert_awaited_once_with(category_id=3, offset=40, limit=20)
+    service.get_product_count.assert_awaited_once_with(category_id=None)
+    service.get_product_detail.assert_awaited_once_with(product_id=7)
+
+
+@pytest.mark.parametrize("key", ["unknown:1", "list:all:0", "detail:abc", ""])
+def test_unknown_descriptor_is_ignored(key):
+    """형식이 맞지 않는 서술자는 None"""
+    assert build_warm_call(key) is None
+
+
+@pytest.mark.asyncio
+async def test_warm_hot_keys_bounds_concurrency_and_skips_failures():
+    """동시 실행 수를 넘지 않고, 실패한 키는 건너뜀"""
+    running = 0
+    peak = 0
+    
+    async def run(call):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        service = MagicMock()
+        service.get_product_detail = AsyncMock(side_effect=Exception("없는 상품"))
+        service.get_product_count = AsyncMock(return_value=10)
+        return await call(service)
+    
+    keys = [count_key(category_id) for category_id in range(1, 10)] + [detail_key(1), "bogus"]
+    warmed = await warm_hot_keys(keys, run, concurrency=3)
+    
+    assert warmed == 9
+    assert peak == 3
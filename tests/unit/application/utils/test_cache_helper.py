@@ -0,0 +1,275 @@
+"""cache_aside / Single-Flight 테스트"""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import AsyncMock
+from app.application.utils.cache_helper import CachePolicy, cache_aside, should_refresh_early
+from app.application.utils.single_flight import SingleFlight
+from app.domain.ports.cache_adapter import CacheEntry
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_db_fetch():
+    """같은 키의 동시 캐시 미스는 DB 조회 1회로 병합"""
+    calls = 0
+    
+    async def db_fetch() -> list[int]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return [1, 2, 3]
+    
+    cache_get = AsyncMock(return_value=None)
+    cache_set = AsyncMock()
+    
+    results = await asyncio.gather(*[
+        cache_aside(cache_get, db_fetch, cache_set, key="products:list:all:0:20")
+        for _ in range(50)
+    ])
+    
+    assert calls == 1
+    assert all(result == [1, 2, 3] for result in results)
+    assert cache_set.await_args.args[0] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_without_key_each_miss_fetches():
+    """key가 없으면 병합하지 않음 (기존 동작)"""
+    db_fetch = AsyncMock(return_value=[1])
+    
+    await asyncio.gather(*[
+        cache_aside(AsyncMock(return_value=None), db_fetch) for _ in range(3)
+    ])
+    
+    assert db_fetch.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_leader_error_propagates_to_followers():
+    """leader의 DB 예외는 모든 follower에게 전파"""
+    async def db_fetch() -> int:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("DB down")
+    
+    results = await asyncio.gather(
+        *[cache_aside(AsyncMock(return_value=None), db_fetch, key="k") for _ in range(5)],
+        return_exceptions=True,
+    )
+    
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_follower_timeout_falls_back_to_own_fetch():
+    """follower 대기 시간 초과 시 직접 DB 조회"""
+    started = asyncio.Event()
+    calls = 0
+    
+    async def db_fetch() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            started.set()
+            await asyncio.sleep(0.2)
+            return "leader"
+        return "own"
+    
+    policy = CachePolicy(single_flight_timeout=0.01)
+    cache_get = AsyncMock(return_value=None)
+    leader = asyncio.create_task(cache_aside(cache_get, db_fetch, key="k", policy=policy))
+    await started.wait()
+    
+    follower = await cache_aside(cache_get, db_fetch, key="k", policy=policy)
+    
+    assert follower == "own"
+    assert await leader == "leader"
+
+
+@pytest.mark.asyncio
+async def test_coalesced_fetch_runs_in_own_scope():
+    """병합된 조회는 요청 세션(db_fetch) 대신 refresh(별도 세션)로 실행, 대기 시간 초과 시에만 db_fetch"""
+    db_fetch = AsyncMock(return_value="request-session")
+    
+    async def refresh() -> str:
+        await asyncio.sleep(0.01)
+        return "own-session"
+    
+    cache_get = AsyncMock(return_value=None)
+    leader = asyncio.create_task(cache_aside(cache_get, db_fetch, key="scoped", refresh=refresh))
+    await asyncio.sleep(0)
+    leader.cancel()  # 클라이언트 연결 종료 - 요청 세션이 닫혀도 병합된 조회는 계속됨
+    
+    follower = await cache_aside(cache_get, db_fetch, key="scoped", refresh=refresh)
+    assert follower == "own-session"
+    db_fetch.assert_not_awaited()
+    
+    slow = asyncio.create_task(
+        cache_aside(cache_get, db_fetch, key="slow", refresh=lambda: asyncio.sleep(0.2, "own-session"))
+    )
+    await asyncio.sleep(0)
+    timed_out = await cache_aside(
+        cache_get,
+        db_fetch,
+        key="slow",
+        refresh=refresh,
+        policy=CachePolicy(single_flight_timeout=0.01),
+    )
+    assert timed_out == "request-session"
+    assert await slow == "own-session"
+
+
+@pytest.mark.asyncio
+async def test_strong_read_does_not_join_replica_backed_leader():
+    """strong 요청은 읽기 복제본에서 조회 중인 leader를 기다리지 않고 primary에서 조회"""
+    release = asyncio.Event()
+    
+    async def replica_fetch() -> str:
+        await release.wait()
+        return "replica"
+    
+    primary_fetch = AsyncMock(return_value="primary")
+    cache_get = AsyncMock(return_value=None)
+    leader = asyncio.create_task(cache_aside(cache_get, replica_fetch, key="consistency", refresh=replica_fetch))
+    await asyncio.sleep(0)
+    
+    follower = await cache_aside(
+        cache_get,
+        primary_fetch,
+        key="consistency",
+        refresh=primary_fetch,
+        policy=CachePolicy(strong_read=True),
+    )
+    
+    assert follower == "primary"
+    assert not leader.done()
+    release.set()
+    assert await leader == "replica"
+
+
+@pytest.mark.asyncio
+async def test_single_flight_survives_leader_cancellation():
+    """leader 요청이 취소되어도 follower는 결과를 받음"""
+    flight = SingleFlight()
+    
+    async def fn() -> int:
+        await asyncio.sleep(0.01)
+        return 7
+    
+    leader = asyncio.create_task(flight.do("k", fn))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("k", fn))
+    await asyncio.sleep(0)
+    leader.cancel()
+    
+    assert await follower == 7
+    assert not flight.in_flight("k")
+
+
+def _entry(value, fresh_in: float, expires_in: float) -> CacheEntry:
+    """현재 시각 기준 신선도를 지정한 CacheEntry 생성"""
+    now = time.time()
+    return CacheEntry(value=value, stored_at=now - 10, fresh_until=now + fresh_in, expires_at=now + expires_in)
+
+
+@pytest.mark.asyncio
+async def test_fresh_entry_returned_without_fetch():
+    """Soft TTL 이내 항목은 DB 조회 없이 반환"""
+    db_fetch = AsyncMock(return_value=[2])
+    
+    result = await cache_aside(AsyncMock(return_value=_entry([1], 10, 20)), db_fetch, key="fresh")
+    
+    assert result == [1]
+    db_fetch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_returned_and_refreshed_in_background():
+    """Soft TTL 경과 항목은 즉시 반환하고 refresh로 백그라운드 갱신"""
+    db_fetch = AsyncMock(return_value=[2])
+    refresh = AsyncMock(return_value=[3])
+    cache_set = AsyncMock()
+    
+    result = await cache_aside(
+        AsyncMock(return_value=_entry([1], -1, 20)),
+        db_fetch,
+        cache_set,
+        key="swr",
+        refresh=refresh,
+    )
+    await asyncio.sleep(0.01)
+    
+    assert result == [1]
+    db_fetch.assert_not_called()
+    refresh.assert_awaited_once()
+    cache_set.assert_awaited_once()
+    assert cache_set.await_args.args[0] == [3]
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_without_refresh_fetches_synchronously():
+    """refresh가 없으면 Soft TTL 경과 항목도 동기 갱신"""
+    db_fetch = AsyncMock(return_value=[2])
+    
+    result = await cache_aside(AsyncMock(return_value=_entry([1], -1, 20)), db_fetch, key="sync")
+    
+    assert result == [2]
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_served_when_db_fails():
+    """Hard TTL 경과 후 DB 조회 실패 시 마지막 정상 값 반환 (stale-if-error)"""
+    db_fetch = AsyncMock(side_effect=RuntimeError("DB down"))
+    
+    result = await cache_aside(AsyncMock(return_value=_entry([1], -20, -10)), db_fetch, key="sie")
+    
+    assert result == [1]
+
+
+@pytest.mark.asyncio
+async def test_db_error_raised_when_stale_if_error_disabled():
+    """stale-if-error 비활성화 시 DB 예외 전파"""
+    db_fetch = AsyncMock(side_effect=RuntimeError("DB down"))
+    policy = CachePolicy(stale_if_error=False)
+    
+    with pytest.raises(RuntimeError):
+        await cache_aside(AsyncMock(return_value=_entry([1], -20, -10)), db_fetch, key="sie-off", policy=policy)
+
+
+def test_xfetch_probability_rises_near_expiry():
+    """만료에 가까울수록 조기 갱신 판단 비율 증가"""
+    now = 1000.0
+    rands = [i / 1000 for i in range(1, 1001)]
+    
+    def ratio(seconds_left: float) -> float:
+        entry = CacheEntry(value=1, stored_at=0, fresh_until=now + seconds_left, expires_at=now + 100, compute_time=0.5)
+        return sum(should_refresh_early(entry, 1.0, now=now, rand=r) for r in rands) / len(rands)
+    
+    assert ratio(10.0) == 0.0
+    assert 0.0 < ratio(1.0) < ratio(0.1) < 1.0
+
+
+def test_xfetch_disabled_without_compute_time_or_beta():
+    """compute_time이 없거나 beta가 0이면 조기 갱신하지 않음"""
+    entry = CacheEntry(value=1, stored_at=0, fresh_until=1.0, expires_at=2.0)
+    assert should_refresh_early(entry, 1.0, now=0.99, rand=1e-9) is False
+    
+    entry.compute_time = 1.0
+    assert should_refresh_early(entry, 0.0, now=0.99, rand=1e-9) is False
+    assert should_refresh_early(entry, 1.0, now=0.99, rand=1e-9) is True
+
+
+@pytest.mark.asyncio
+async def test_db_fetch_duration_passed_to_cache_set():
+    """DB 조회 소요 시간을 cache_set에 전달"""
+    async def db_fetch() -> int:
+        await asyncio.sleep(0.02)
+        return 5
+    
+    cache_set = AsyncMock()
+    await cache_aside(AsyncMock(return_value=None), db_fetch, cache_set)
+    
+    value, compute_time = cache_set.await_args.args
+    assert value == 5
+    assert compute_time >= 0.015
@@ -0,0 +1,19 @@
+"""키셋 페이지네이션 커서 테스트"""
+
+import pytest
+from app.application.utils.cursor import decode_cursor, encode_cursor
+
+
+def test_cursor_roundtrip():
+    """커서는 URL에 안전한 문자열이며 마지막 ID로 복원"""
+    cursor = encode_cursor(12345)
+    
+    assert cursor.isalnum()
+    assert decode_cursor(cursor) == 12345
+
+
+@pytest.mark.parametrize("cursor", ["", "!!!", encode_cursor(1)[:-1] + "$", "aWQ6LTE", "b2Zmc2V0OjE"])
+def test_invalid_cursor_raises_value_error(cursor: str):
+    """형식이 다르거나 숫자가 아닌 커서는 ValueError"""
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
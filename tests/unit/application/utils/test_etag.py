@@ -0,0 +1,28 @@
+"""ETag 유틸리티 테스트"""
+
+from app.application.utils.etag import compute_etag, etag_matches, product_fingerprint
+from app.domain.entities.product import Product
+
+
+def make_product(stock: int = 10) -> Product:
+    return Product(id=1, name="노트북", price=1000000, stock=stock, category_id=1, discount_rate=0.2)
+
+
+def test_etag_is_stable_and_changes_with_content():
+    """같은 데이터는 같은 ETag, 필드가 바뀌면 다른 ETag"""
+    etag = compute_etag((product_fingerprint(make_product()),), 1)
+    
+    assert etag == compute_etag((product_fingerprint(make_product()),), 1)
+    assert etag != compute_etag((product_fingerprint(make_product(stock=9)),), 1)
+    assert etag.startswith('"') and etag.endswith('"')
+
+
+def test_if_none_match_parsing():
+    """목록, 약한 ETag, * 지원"""
+    etag = compute_etag("a")
+    
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
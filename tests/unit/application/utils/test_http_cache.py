@@ -0,0 +1,39 @@
+"""HTTP 캐시 헤더 유틸리티 테스트"""
+
+from app.application.utils.http_cache import (
+    cache_control,
+    list_surrogate_keys,
+    pack_response,
+    purge_keys,
+    unpack_response,
+)
+from app.domain.entities.product import Product
+
+
+def test_cache_control():
+    """max-age/stale-while-revalidate 조합, 0이면 no-store"""
+    assert cache_control(60, 30) == "public, max-age=60, stale-while-revalidate=30"
+    assert cache_control(60) == "public, max-age=60"
+    assert cache_control(0, 30) == "no-store"
+
+
+def test_list_keys_include_scope_and_products():
+    """목록 응답에는 범위 키와 포함된 상품 키가 모두 붙음"""
+    products = [Product(id=7, name="노트북", price=1000, stock=1, category_id=3)]
+    
+    assert list_surrogate_keys(products, 3) == "products category-3 product-7"
+    assert list_surrogate_keys([], None) == "products category-all"
+
+
+def test_purge_keys_follow_invalidation_scope():
+    """무효화 범위와 같은 규칙으로 삭제 키 결정"""
+    assert purge_keys(product_ids=[1, 2]) == ["product-1", "product-2"]
+    assert purge_keys(category_ids=[3]) == ["category-all", "category-3"]
+    assert purge_keys() == ["products"]
+
+
+def test_pack_response_roundtrip():
+    """ETag/Surrogate-Key와 본문을 함께 저장하고 그대로 복원 (본문의 줄바꿈 유지)"""
+    payload = pack_response('"abc"', "products product-1", b'{"a":\n1}')
+    
+    assert unpack_response(payload) == ('"abc"', "products product-1", b'{"a":\n1}')
@@ -160,3 +160,20 @@ def test_product_get_discounted_price():
     discounted_price = product.get_discounted_price()
     assert discounted_price == 800000
 
+
+
+def test_product_restore_matches_constructor():
+    """저장소 값 복원 - 생성자와 같은 상태의 엔티티"""
+    restored = Product.restore((1, "노트북", 1000000, 10, 1, 0.2))
+    created = Product(id=1, name="노트북", price=1000000, stock=10, category_id=1, discount_rate=0.2)
+    
+    assert vars(restored) == vars(created)
+    assert restored.get_discounted_price() == 800000
+
+
+def test_product_restore_skips_validation():
+    """신뢰된 값 복원은 검증하지 않음 (생성자는 같은 값을 거부)"""
+    with pytest.raises(ValueError):
+        Product(id=1, name="상품", price=-1, stock=0, category_id=1)
+    
+    assert Product.restore((1, "상품", -1, 0, 1, 0.0)).price == -1
@@ -0,0 +1,97 @@
+"""캐시 어댑터 테스트 공통 Fixtures"""
+
+import pytest
+
+
+class FakeRedis:
+    """테스트용 최소 Redis 대체 (GET/MGET/SETEX/INCR/DELETE/SADD/SMEMBERS/EXPIRE/파이프라인만 지원, TTL은 기록만 함)"""
+    
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+        self.sets: dict[str, set[bytes]] = {}
+        self.ttls: dict[str, int] = {}
+        self.mget_calls = 0
+        self.pipeline_executions = 0
+    
+    async def get(self, key: str) -> bytes | None:
+        return self.data.get(key)
+    
+    async def setex(self, key: str, ttl: int, value: str | bytes) -> bool:
+        self.data[key] = value.encode() if isinstance(value, str) else value
+        self.ttls[key] = ttl
+        return True
+    
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        self.mget_calls += 1
+        return [self.data.get(key) for key in keys]
+    
+    async def incr(self, key: str) -> int:
+        value = int(self.data.get(key, b"0")) + 1
+        self.data[key] = str(value).encode()
+        return value
+    
+    async def delete(self, *keys: str | bytes) -> int:
+        keys = [key.decode() if isinstance(key, bytes) else key for key in keys]
+        removed = [key for key in keys if self.data.pop(key, None) is not None or self.sets.pop(key, None) is not None]
+        return len(removed)
+    
+    async def sadd(self, key: str, *members: str) -> int:
+        added = {member.encode() for member in members} - self.sets.setdefault(key, set())
+        self.sets[key] |= added
+        return len(added)
+    
+    async def smembers(self, key: str) -> set[bytes]:
+        return set(self.sets.get(key, set()))
+    
+    async def expire(self, key: str, ttl: int) -> bool:
+        self.ttls[key] = ttl
+        return key in self.data or key in self.sets
+    
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """명령을 모았다가 execute 시 한 번에 실행"""
+    
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.commands: list[tuple] = []
+    
+    def get(self, key: str) -> "FakePipeline":
+        self.commands.append((self.redis.get, key))
+        return self
+    
+    def mget(self, keys: list[str]) -> "FakePipeline":
+        self.commands.append((self.redis.mget, keys))
+        return self
+    
+    def setex(self, key: str, ttl: int, value: str | bytes) -> "FakePipeline":
+        self.commands.append((self.redis.setex, key, ttl, value))
+        return self
+    
+    def incr(self, key: str) -> "FakePipeline":
+        self.commands.append((self.redis.incr, key))
+        return self
+    
+    def sadd(self, key: str, *members: str) -> "FakePipeline":
+        self.commands.append((self.redis.sadd, key, *members))
+        return self
+    
+    def smembers(self, key: str) -> "FakePipeline":
+        self.commands.append((self.redis.smembers, key))
+        return self
+    
+    def expire(self, key: str, ttl: int) -> "FakePipeline":
+        self.commands.append((self.redis.expire, key, ttl))
+        return self
+    
+    async def execute(self, raise_on_error: bool = True) -> list:
+        self.redis.pipeline_executions += 1
+        return [await command(*args) for command, *args in self.commands]
+
+
+@pytest.fixture
+def fake_redis():
+    """Fake Redis 클라이언트"""
+    return FakeRedis()
@@ -0,0 +1,72 @@
+"""자동 파이프라이닝 테스트"""
+
+import asyncio
+
+import pytest
+from unittest.mock import MagicMock
+from app.infrastructure.adapters.cache.auto_pipeline import AutoPipeline
+from app.infrastructure.monitoring.metrics import MetricsRegistry
+
+
+@pytest.mark.asyncio
+async def test_concurrent_commands_share_one_pipeline(fake_redis):
+    """같은 틱에 보낸 명령은 파이프라인 1회로 실행되고 응답은 각 호출로 돌아감"""
+    fake_redis.data = {"a": b"1", "b": b"2"}
+    client = AutoPipeline(fake_redis, metrics=MetricsRegistry())
+    
+    results = await asyncio.gather(
+        client.get("a"),
+        client.get("b"),
+        client.mget(["a", "missing"]),
+        client.setex("c", 10, b"3"),
+    )
+    
+    assert results == [b"1", b"2", [b"1", None], True]
+    assert fake_redis.pipeline_executions == 1
+    assert fake_redis.data["c"] == b"3"
+
+
+@pytest.mark.asyncio
+async def test_max_batch_flushes_immediately(fake_redis):
+    """최대 명령 수에 도달하면 나머지는 다음 파이프라인으로"""
+    client = AutoPipeline(fake_redis, max_batch=2, metrics=MetricsRegistry())
+    
+    await asyncio.gather(*(client.get(f"k{i}") for i in range(5)))
+    
+    assert fake_redis.pipeline_executions == 3
+
+
+@pytest.mark.asyncio
+async def test_command_error_is_delivered_to_its_caller_only():
+    """명령별 오류는 해당 호출에만, 파이프라인 전체 실패는 모든 호출에 전달"""
+    pipe = MagicMock()
+    
+    async def execute(raise_on_error=True):
+        return [b"ok", ValueError("WRONGTYPE")]
+    
+    pipe.execute = execute
+    redis_client = MagicMock()
+    redis_client.pipeline.return_value = pipe
+    client = AutoPipeline(redis_client, metrics=MetricsRegistry())
+    
+    results = await asyncio.gather(client.get("a"), client.get("b"), return_exceptions=True)
+    
+    assert results[0] == b"ok"
+    assert isinstance(results[1], ValueError)
+    
+    async def fail(raise_on_error=True):
+        raise ConnectionError("down")
+    
+    pipe.execute = fail
+    results = await asyncio.gather(client.get("a"), client.get("b"), return_exceptions=True)
+    
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_other_commands_pass_through(fake_redis):
+    """자동 파이프라이닝 대상이 아닌 명령은 원래 클라이언트로 전달"""
+    client = AutoPipeline(fake_redis, metrics=MetricsRegistry())
+    
+    assert await client.incr("counter") == 1
+    assert fake_redis.pipeline_executions == 0
@@ -0,0 +1,114 @@
+"""Circuit Breaker 테스트"""
+
+import pytest
+from unittest.mock import AsyncMock
+from app.infrastructure.adapters.cache.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from app.infrastructure.adapters.cache.redis_adapter import RedisCacheAdapter
+from app.infrastructure.monitoring.metrics import MetricsRegistry
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_breaker(clock: FakeClock) -> CircuitBreaker:
+    return CircuitBreaker(
+        window_size=10,
+        minimum_calls=4,
+        open_duration=5.0,
+        half_open_probes=2,
+        slow_call_threshold=0.1,
+        metrics=MetricsRegistry(),
+        clock=clock,
+    )
+
+
+def test_opens_on_failure_rate_and_bypasses():
+    """실패율이 임계값을 넘으면 open, open 중에는 호출 거부 + bypass 집계"""
+    breaker = make_breaker(FakeClock())
+    for _ in range(2):
+        breaker.record_success(0.001)
+    for _ in range(2):
+        breaker.record_failure()
+    
+    assert breaker.state == OPEN
+    assert breaker.allow() is False
+    assert breaker.metrics.counter("cache.breaker.redis.bypass") == 1
+    assert breaker.metrics.snapshot()["gauges"]["cache.breaker.redis.state"] == 2
+
+
+def test_opens_on_slow_call_rate():
+    """느린 호출 비율이 임계값을 넘어도 open"""
+    breaker = make_breaker(FakeClock())
+    for _ in range(4):
+        breaker.record_success(0.5)
+    
+    assert breaker.state == OPEN
+
+
+def test_half_open_probes_close_or_reopen():
+    """open_duration 후 시험 호출 수만큼만 허용, 모두 성공하면 closed, 실패하면 다시 open"""
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    for _ in range(4):
+        breaker.record_failure()
+    
+    clock.now = 5.0
+    assert breaker.allow() is True
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow() is True
+    assert breaker.allow() is False  # 시험 호출 수 초과
+    
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    
+    clock.now = 10.0
+    assert breaker.allow() and breaker.allow()
+    breaker.record_success(0.001)
+    breaker.record_success(0.001)
+    
+    assert breaker.state == CLOSED
+    assert breaker.metrics.counter("cache.breaker.redis.transitions.half_open_to_closed") == 1
+
+
+@pytest.mark.asyncio
+async def test_adapter_returns_miss_without_calling_redis_when_open(fake_redis):
+    """회로가 열려 있으면 Redis를 호출하지 않고 즉시 미스, 저장은 생략"""
+    breaker = make_breaker(FakeClock())
+    for _ in range(4):
+        breaker.record_failure()
+    fake_redis.get = AsyncMock()
+    fake_redis.mget = AsyncMock()
+    adapter = RedisCacheAdapter(redis_client=fake_redis, breaker=breaker)
+    
+    assert await adapter.get_product_count() is None
+    assert await adapter.get_products([1, 2]) == {}
+    await adapter.set_product_count(10)
+    
+    fake_redis.get.assert_not_awaited()
+    fake_redis.mget.assert_not_awaited()
+    assert fake_redis.data == {}
+
+
+@pytest.mark.asyncio
+async def test_call_raises_circuit_open_error():
+    """breaker.call은 회로가 열려 있으면 CircuitOpenError"""
+    breaker = make_breaker(FakeClock())
+    failing = AsyncMock(side_effect=ConnectionError("timeout"))
+    for _ in range(4):
+        with pytest.raises(ConnectionError):
+            await breaker.call(failing)
+    
+    with pytest.raises(CircuitOpenError):
+        await breaker.call(failing)
+    assert failing.await_count == 4
@@ -0,0 +1,96 @@
+"""Cache Codec 테스트"""
+
+import pytest
+from app.domain.entities.product import Product
+from app.domain.ports.cache_adapter import CacheEntry
+from app.infrastructure.adapters.cache.codec import (
+    COUNT,
+    PRODUCT,
+    PRODUCT_IDS,
+    SCHEMA_VERSION,
+    CompactCodec,
+    JsonCodec,
+    JsonSerializer,
+    UnsupportedCacheFormat,
+    decode_entry,
+    get_codec,
+)
+from app.infrastructure.adapters.cache.redis_adapter import RedisCacheAdapter
+
+
+def _entry(value):
+    return CacheEntry(value=value, stored_at=100.0, fresh_until=340.0, expires_at=400.0, compute_time=0.02)
+
+
+def _products():
+    return [
+        Product(id=i, name=f"무선 기계식 키보드 {i}", price=89000 + i, stock=i, category_id=3, discount_rate=0.15)
+        for i in range(1, 101)
+    ]
+
+
+@pytest.mark.parametrize("codec", [JsonCodec(), CompactCodec(JsonSerializer())])
+def test_roundtrip_product_and_ids(codec):
+    """두 형식 모두 값과 신선도 메타데이터를 보존 (목록은 ID 목록 + 상품 단건으로 저장)"""
+    products = _products()
+    
+    decoded = [decode_entry(codec.encode(PRODUCT, _entry(p)), PRODUCT, 240, 300, 0.0) for p in products]
+    ids = decode_entry(codec.encode(PRODUCT_IDS, _entry([p.id for p in products])), PRODUCT_IDS, 240, 300, 0.0)
+    
+    assert [entry.value for entry in decoded] == products
+    assert decoded[0].value.name == "무선 기계식 키보드 1"
+    assert decoded[99].value.discount_rate == 0.15
+    assert (decoded[0].stored_at, decoded[0].fresh_until, decoded[0].expires_at) == (100.0, 340.0, 400.0)
+    assert decoded[0].compute_time == 0.02
+    assert ids.value == list(range(1, 101))
+
+
+def test_compact_is_smaller_than_json():
+    """행 배열 형식은 키 이름 반복이 없어 더 작음"""
+    compact = sum(len(CompactCodec(JsonSerializer()).encode(PRODUCT, _entry(p))) for p in _products())
+    json = sum(len(JsonCodec().encode(PRODUCT, _entry(p))) for p in _products())
+    
+    assert compact < json * 0.8
+
+
+def test_negative_and_count_values():
+    """부정 항목(None)과 개수 값도 그대로 보존"""
+    codec = CompactCodec(JsonSerializer())
+    
+    assert decode_entry(codec.encode(PRODUCT, _entry(None)), PRODUCT, 240, 300, 0.0).value is None
+    assert decode_entry(codec.encode(COUNT, _entry(42)), COUNT, 240, 300, 0.0).value == 42
+
+
+def test_unknown_schema_version_is_rejected():
+    """알 수 없는 스키마 버전은 UnsupportedCacheFormat"""
+    raw = bytearray(CompactCodec(JsonSerializer()).encode(COUNT, _entry(1)))
+    raw[2] = SCHEMA_VERSION + 1
+    
+    with pytest.raises(UnsupportedCacheFormat):
+        decode_entry(bytes(raw), COUNT, 240, 300, 0.0)
+
+
+@pytest.mark.asyncio
+async def test_adapter_reads_other_formats_and_skips_unknown(fake_redis):
+    """롤링 배포 중 다른 형식으로 저장된 값은 읽고, 해석할 수 없는 값은 미스 처리"""
+    redis = fake_redis
+    json_adapter = RedisCacheAdapter(redis, ttl=300, codec=JsonCodec())
+    compact_adapter = RedisCacheAdapter(redis, ttl=300, codec=get_codec("compact"))
+    
+    await json_adapter.set_product_count(count=7)
+    assert (await compact_adapter.get_product_count()).value == 7
+    
+    await compact_adapter.set_product_count(count=8)
+    assert (await json_adapter.get_product_count()).value == 8
+    
+    redis.data["products:count:all"] = bytes([1, 99, SCHEMA_VERSION]) + b"[]"
+    assert await compact_adapter.get_product_count() is None
+
+
+def test_get_codec_falls_back_without_msgpack():
+    """msgpack 설정 시 미설치 환경에서는 compact로 대체"""
+    codec = get_codec("msgpack")
+    
+    assert codec.name in ("msgpack", "json")
+    with pytest.raises(ValueError):
+        get_codec("unknown")
@@ -0,0 +1,77 @@
+"""PayloadCompressor 테스트"""
+
+import pytest
+from app.domain.entities.product import Product
+from app.infrastructure.adapters.cache.codec import get_codec
+from app.infrastructure.adapters.cache.compression import (
+    ZLIB_MARKER,
+    PayloadCompressor,
+    decompress,
+)
+from app.infrastructure.adapters.cache.redis_adapter import RedisCacheAdapter
+from app.infrastructure.monitoring.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def registry():
+    """테스트 전용 메트릭 레지스트리"""
+    return MetricsRegistry()
+
+
+def test_small_payload_is_not_compressed(registry):
+    """임계값 미만은 원본 그대로"""
+    compressor = PayloadCompressor(threshold=1024, metrics=registry)
+    payload = b'{"v":1}'
+    
+    assert compressor.compress(payload) is payload
+    assert registry.snapshot()["summaries"] == {}
+
+
+def test_large_payload_roundtrip_with_metrics(registry):
+    """임계값 이상은 마커와 함께 압축되고, 읽을 때 자동 해제"""
+    compressor = PayloadCompressor(threshold=64, algorithm="zlib", metrics=registry)
+    payload = ("프리미엄 무선 기계식 키보드 " * 200).encode("utf-8")
+    
+    compressed = compressor.compress(payload)
+    
+    assert compressed[0] == ZLIB_MARKER
+    assert len(compressed) < len(payload)
+    assert compressor.decompress(compressed) == payload
+    assert decompress(payload) == payload  # 압축되지 않은 값은 그대로
+    
+    summaries = registry.snapshot()["summaries"]
+    assert summaries["cache.compress.ratio"]["max"] < 1.0
+    assert summaries["cache.compress.seconds"]["count"] == 1
+    assert summaries["cache.decompress.seconds"]["count"] == 1
+
+
+def test_incompressible_payload_is_stored_as_is(registry):
+    """압축해도 작아지지 않으면 원본 저장"""
+    compressor = PayloadCompressor(threshold=1, algorithm="zlib", metrics=registry)
+    payload = bytes(range(40))
+    
+    assert compressor.compress(payload) == payload
+    assert registry.counter("cache.compress.skipped") == 1
+
+
+@pytest.mark.asyncio
+async def test_adapter_reads_compressed_values_without_compressor(fake_redis, registry):
+    """압축 설정이 꺼진 워커도 압축된 값을 읽을 수 있음 (롤링 설정 변경 호환)"""
+    products = [
+        Product(id=i, name=f"무선 기계식 키보드 {i}", price=89000, stock=1, category_id=3)
+        for i in range(100)
+    ]
+    writer = RedisCacheAdapter(
+        fake_redis,
+        ttl=300,
+        codec=get_codec("compact"),
+        compressor=PayloadCompressor(threshold=256, algorithm="zlib", metrics=registry),
+    )
+    reader = RedisCacheAdapter(fake_redis, ttl=300)
+    
+    await writer.set_product_list(products, category_id=3, offset=0, limit=100)
+    
+    assert fake_redis.data["products:item:1"][0] != ZLIB_MARKER  # 작은 값은 압축하지 않음
+    assert fake_redis.data["products:ids:category:3:offset:0:limit:100"][0] == ZLIB_MARKER
+    entry = await reader.get_product_list(category_id=3, offset=0, limit=100)
+    assert entry.value == products
@@ -0,0 +1,167 @@
+"""InMemoryCacheAdapter 테스트"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from app.application.dependencies import get_cache_adapter
+from app.domain.entities.coupon import Coupon
+from app.domain.entities.product import Product
+from app.infrastructure.adapters.cache.local_cache import LocalCache
+from app.infrastructure.adapters.cache.memory_adapter import InMemoryCacheAdapter, MemoryCacheStore
+from app.infrastructure.monitoring.metrics import MetricsRegistry
+
+
+def make_product(product_id: int, category_id: int = 1) -> Product:
+    return Product(
+        id=product_id,
+        name=f"상품 {product_id}",
+        price=10000,
+        stock=5,
+        category_id=category_id,
+        discount_rate=0.1,
+    )
+
+
+def make_adapter(max_bytes: int = 64 * 1024 * 1024, **kwargs) -> InMemoryCacheAdapter:
+    store = MemoryCacheStore(LocalCache(max_entries=1000, max_bytes=max_bytes))
+    return InMemoryCacheAdapter(store, metrics=MetricsRegistry(), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_product_list_roundtrip_with_freshness():
+    """목록 저장/조회 시 Soft/Hard TTL 메타데이터 포함, 상품 단건도 함께 저장"""
+    adapter = make_adapter(ttl=300, soft_ttl=240)
+    products = [make_product(1), make_product(2)]
+    
+    await adapter.set_product_list(products, category_id=1, offset=0, limit=20)
+    entry = await adapter.get_product_list(category_id=1, offset=0, limit=20)
+    
+    assert entry.value == products
+    assert entry.fresh_until - entry.stored_at == pytest.approx(240)
+    assert entry.expires_at - entry.stored_at == pytest.approx(300)
+    assert set(await adapter.get_products([1, 2])) == {1, 2}
+
+
+@pytest.mark.asyncio
+async def test_deleted_product_makes_page_miss():
+    """상품 단건이 삭제되면 그 상품이 포함된 목록도 미스"""
+    adapter = make_adapter()
+    await adapter.set_product_list([make_product(1), make_product(2)])
+    
+    await adapter.delete_products([2])
+    
+    assert await adapter.get_product_list() is None
+
+
+@pytest.mark.asyncio
+async def test_list_response_follows_product_entries(monkeypatch):
+    """목록 응답은 포함된 상품이 삭제되거나 응답 이후에 다시 저장되면 미스"""
+    clock = iter(range(1000, 2000))
+    monkeypatch.setattr("app.infrastructure.adapters.cache.memory_adapter.time.time", lambda: next(clock))
+    adapter = make_adapter()
+    products = [make_product(1), make_product(2)]
+    await adapter.set_product_list(products)
+    await adapter.set_list_response(b'{"products":[]}', [1, 2])
+    
+    assert await adapter.get_list_response() == b'{"products":[]}'
+    
+    await adapter.set_products([make_product(2)])
+    assert await adapter.get_list_response() is None
+    
+    await adapter.set_list_response(b'{"products":[]}', [1, 2])
+    await adapter.delete_products([1])
+    assert await adapter.get_list_response() is None
+
+
+@pytest.mark.asyncio
+async def test_list_response_invalidated_with_lists():
+    """목록 무효화 시 같은 범위의 목록 응답도 무효화"""
+    adapter = make_adapter()
+    await adapter.set_product_list([make_product(1)], category_id=1)
+    await adapter.set_list_response(b"{}", [1], category_id=1)
+    
+    await adapter.invalidate_product_lists([1])
+    
+    assert await adapter.get_list_response(category_id=1) is None
+
+
+@pytest.mark.asyncio
+async def test_invalidation_by_category_keeps_other_categories():
+    """카테고리 무효화는 해당 카테고리와 전체 목록/개수만 무효화"""
+    adapter = make_adapter()
+    await adapter.set_product_list([make_product(1)], category_id=1)
+    await adapter.set_product_list([make_product(2, category_id=2)], category_id=2)
+    await adapter.set_product_count(10)
+    
+    await adapter.invalidate_product_lists([1])
+    
+    assert await adapter.get_product_list(category_id=1) is None
+    assert await adapter.get_product_count() is None
+    assert (await adapter.get_product_list(category_id=2)).value[0].id == 2
+
+
+@pytest.mark.asyncio
+async def test_write_after_invalidation_uses_generation_seen_at_read():
+    """조회 후 무효화되면 이전 세대로 저장되어 새 세대에서는 보이지 않음"""
+    store = MemoryCacheStore(LocalCache())
+    reader = InMemoryCacheAdapter(store, metrics=MetricsRegistry())
+    assert await reader.get_product_count() is None
+    
+    await InMemoryCacheAdapter(store, metrics=MetricsRegistry()).invalidate_product_lists()
+    await reader.set_product_count(99)
+    
+    assert await InMemoryCacheAdapter(store, metrics=MetricsRegistry()).get_product_count() is None
+
+
+@pytest.mark.asyncio
+async def test_negative_entries_and_coupon_ttl():
+    """없는 상품/쿠폰은 값 None으로 저장, 쿠폰 Hard TTL은 유효 종료일을 넘지 않음"""
+    adapter = make_adapter(ttl=3600, negative_ttl=30)
+    coupon = Coupon(
+        id=1,
+        code="ABCDEFGH1234",
+        discount_type="rate",
+        discount_value=0.1,
+        valid_from=datetime.now() - timedelta(days=1),
+        valid_to=datetime.now() + timedelta(seconds=60),
+    )
+    
+    await adapter.set_products([], missing_ids=[404])
+    await adapter.set_coupon(coupon.code, coupon)
+    await adapter.set_coupon("NOTEXIST0000", None)
+    
+    assert (await adapter.get_products([404]))[404].value is None
+    entry = await adapter.get_coupon(coupon.code)
+    assert entry.expires_at - entry.stored_at <= 60
+    assert (await adapter.get_coupon("NOTEXIST0000")).value is None
+
+
+@pytest.mark.asyncio
+async def test_byte_budget_evicts_least_recently_used():
+    """메모리 상한을 넘으면 오래 사용되지 않은 항목부터 제거"""
+    adapter = make_adapter(max_bytes=4000)
+    
+    await adapter.set_products([make_product(product_id) for product_id in range(50)])
+    
+    assert adapter.cache.bytes_used <= 4000
+    assert adapter.cache.evictions > 0
+    assert 49 in await adapter.get_products([49])
+    assert 0 not in await adapter.get_products([0])
+
+
+def test_dependency_falls_back_to_memory_without_redis():
+    """Redis 클라이언트가 없으면 프로세스 내 캐시 어댑터 사용"""
+    assert isinstance(get_cache_adapter(None), InMemoryCacheAdapter)
+
+
+def test_fallback_for_redis_uses_soft_ttl(monkeypatch):
+    """Redis 장애 대체로 사용하면 Hard TTL을 Soft TTL로 제한 (CACHE_BACKEND=memory는 전체 TTL)"""
+    from app.infrastructure.settings.config import settings
+    monkeypatch.setattr(settings, "cache_ttl", 300)
+    monkeypatch.setattr(settings, "cache_soft_ttl", 240)
+    
+    monkeypatch.setattr(settings, "cache_backend", "redis")
+    assert get_cache_adapter(None).ttl == 240
+    
+    monkeypatch.setattr(settings, "cache_backend", "memory")
+    assert get_cache_adapter(None).ttl == 300
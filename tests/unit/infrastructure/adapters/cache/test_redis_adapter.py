@@ -0,0 +1,264 @@
+"""RedisCacheAdapter 테스트 (in-memory Fake Redis 사용)"""
+
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from app.domain.entities.coupon import Coupon
+from app.domain.entities.product import Product
+from app.domain.ports.cache_adapter import CacheEntry
+from app.infrastructure.adapters.cache.redis_adapter import RedisCacheAdapter
+
+
+@pytest.fixture
+def sample_product():
+    """샘플 상품"""
+    return Product(
+        id=1,
+        name="노트북",
+        price=1000000,
+        stock=10,
+        category_id=1,
+        discount_rate=0.2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_product_list_roundtrip_with_freshness(fake_redis, sample_product):
+    """상품 목록 저장/조회 시 Soft/Hard TTL 메타데이터 포함"""
+    adapter = RedisCacheAdapter(fake_redis, ttl=300, soft_ttl=240, stale_ttl=3600)
+    
+    await adapter.set_product_list([sample_product], category_id=1, offset=0, limit=20)
+    entry = await adapter.get_product_list(category_id=1, offset=0, limit=20)
+    
+    assert isinstance(entry, CacheEntry)
+    assert entry.value == [sample_product]
+    assert entry.value[0].name == "노트북"
+    assert entry.fresh_until - entry.stored_at == pytest.approx(240)
+    assert entry.expires_at - entry.stored_at == pytest.approx(300)
+    # Redis 키는 Hard TTL + stale 구간 동안 유지
+    assert fake_redis.ttls["products:ids:category:1:offset:0:limit:20"] == 3600 + 300
+
+
+@pytest.mark.asyncio
+async def test_count_roundtrip(fake_redis):
+    """상품 개수 저장/조회"""
+    adapter = RedisCacheAdapter(fake_redis, ttl=300)
+    
+    await adapter.set_product_count(count=42)
+    entry = await adapter.get_product_count()
+    
+    assert entry.value == 42
+    assert entry.is_fresh()
+
+
+@pytest.mark.asyncio
+async def test_legacy_values_are_readable(fake_redis):
+    """envelope 도입 이전 형식도 신선한 값으로 조회 (롤링 배포 호환)"""
+    adapter = RedisCacheAdapter(fake_redis, ttl=300)
+    fake_redis.data["products:count:all"] = b"7"
+    
+    count = await adapter.get_product_count()
+    
+    assert count.value == 7
+    assert count.fresh_until > time.time()
+
+
+@pytest.mark.asyncio
+async def test_miss_and_redis_failure_return_none(fake_redis):
+    """캐시 미스 및 Redis 장애 시 None 반환"""
+    adapter = RedisCacheAdapter(fake_redis, ttl=300)
+    assert await adapter.get_product_count(category_id=9) is None
+    
+    async def broken_get(key):
+        raise ConnectionError("Redis down")
+    
+    fake_redis.get = broken_get
+    assert await adapter.get_product_count() is None
+
+
+@pytest.mark.asyncio
+async def test_ttl_jitter_shortens_ttl_within_bounds(fake_redis):
+    """TTL jitter는 설정된 TTL을 넘지 않는 범위에서 키마다 다른 TTL 적용"""
+    adapter = RedisCacheAdapter(fake_redis, ttl=1000, soft_ttl=800, ttl_jitter=0.2)
+    
+    for category_id in range(1, 51):
+        await adapter.set_product_count(count=1, category_id=category_id, compute_time=0.05)
+    
+    ttls = set(fake_redis.ttls.values())
+    assert len(ttls) > 1
+    assert all(800 <= ttl <= 1000 for ttl in ttls)
+    
+    entry = await adapter.get_product_count(category_id=1)
+    assert entry.compute_time == 0.05
+    assert entry.fresh_until - entry.stored_at <= 800
+
+
+@pytest.mark.asyncio
+async def test_products_batch_read_with_negative_entries(fake_redis, sample_product):
+    """상품 단건 캐시는 MGET 1회로 조회하고, 없는 상품은 짧은 TTL의 부정 항목으로 저장"""
+    adapter = RedisCacheAdapter(fake_redis, ttl=300, stale_ttl=0, negative_ttl=30)
+    
+    await adapter.set_products([sample_product], missing_ids=[999])
+    entries = await adapter.get_products([1, 999, 2])
+    
+    assert fake_redis.mget_calls == 1
+    assert entries[1].value == sample_product
+    assert entries[999].value is None
+    assert 2 not in entries
+    assert fake_redis.ttls["products:item:1"] == 300
+    assert fake_redis.ttls["products:item:999"] == 30
+
+
+@pytest.mark.asyncio
+async def test_coupon_ttl_capped_by_valid_to(fake_redis):
+    """쿠폰 캐시는 유효 종료일 이후까지 남지 않음 (stale 구간 포함)"""
+    adapter = RedisCacheAdapter(fake_redis, ttl=300, stale_ttl=3600)
+    coupon = Coupon(
+        id=1,
+        code="SAVE102024AB",
+        discount_type="rate",
+        discount_value=0.1,
+        valid_from=datetime.now() - timedelta(days=1),
+        valid_to=datetime.now() + timedelta(seconds=60),
+    )
+    
+    await adapter.set_coupon(coupon.code, coupon)
+    entry = await adapter.get_coupon(coupon.code)
+    
+    assert fake_redis.ttls["coupons:code:SAVE102024AB"] <= 60
+    assert entry.expires_at - entry.stored_at <= 60
+    assert entry.value == coupon
+    assert entry.value.valid_to == coupon.valid_to
+    
+    await adapter.set_coupon("BOGUSCODE123", None)
+    negative = await adapter.get_coupon("BOGUSCODE123")
+    assert negative is not None and negative.value is None
+
+
+@pytest.mark.asyncio
+async def test_product_list_is_normalized(fake_redis, sample_product):
+    """목록 키에는 ID만 저장하고, 상품 단건 갱신은 해당 상품이 포함된 모든 페이지에 반영"""
+    adapter = RedisCacheAdapter(fake_redis, ttl=300)
+    other = Product(id=2, name="마우스", price=30000, stock=5, category_id=1)
+    
+    await adapter.set_product_list([sample_product, other], category_id=1, offset=0, limit=20)
+    await adapter.set_product_list([other], category_id=1, offset=1, limit=1)
+    
+    stored = json.loads(fake_redis.data["products:ids:category:1:offset:0:limit:20"])
+    assert stored["v"] == [1, 2]
+    
+    updated = Product(id=2, name="마우스", price=25000, stock=5, category_id=1)
+    await adapter.set_products([updated])
+    
+    page1 = await adapter.get_product_list(category_id=1, offset=0, limit=20)
+    page2 = await adapter.get_product_list(category_id=1, offset=1, limit=1)
+    assert [p.id for p in page1.value] == [1, 2]
+    assert page1.value[1].price == 25000
+    assert page2.value[0].price == 25000
+
+
+@pytest.mark.asyncio
+async def test_product_list_miss_when_product_entry_missing(fake_redis, sample_product):
+    """페이지의 상품 단건 항목이 없거나 부정 항목이면 페이지 미스"""
+    adapter = RedisCacheAdapter(fake_redis, ttl=300)
+    await adapter.set_product_list([sample_product], category_id=1, offset=0, limit=20)
+    
+    await adapter.set_products([], missing_ids=[1])
+    assert await adapter.get_product_list(category_id=1, offset=0, limit=20) is None
+    
+    del fake_redis.data["products:item:1"]
+    assert await adapter.get_product_list(category_id=1, offset=0, limit=20) is None
+
+
+@pytest.mark.asyncio
+async def test_generation_invalidation_by_category(fake_redis, sample_product):
+    """카테고리 세대 증가는 해당 카테고리와 전체 목록/개수만 무효화"""
+    adapter = RedisCacheAdapter(fake_redis, ttl=300)
+    other = Product(id=2, name="마우스", price=30000, stock=5, category_id=2)
+    await adapter.set_product_list([sample_product], category_id=1, offset=0, limit=20)
+    await adapter.set_product_list([other], category_id=2, offset=0, limit=20)
+    await adapter.set_product_list([sample_product, other], offset=0, limit=20)
+    await adapter.set_product_count(1, category_id=1)
+    
+    await RedisCacheAdapter(fake_redis, ttl=300).invalidate_product_lists([1])
+    
+    reader = RedisCacheAdapter(fake_redis, ttl=300)
+    assert await reader.get_product_list(category_id=1, offset=0, limit=20) is None
+    assert await reader.get_product_count(category_id=1) is None
+    assert await reader.get_product_list(offset=0, limit=20) is None
+    assert (await reader.get_product_list(category_id=2, offset=0, limit=20)).value == [other]
+    
+    # 새 세대 키에 저장 후 조회
+    await reader.set_product_count(3, category_id=1)
+    assert (await reader.get_product_count(category_id=1)).value == 3
+    assert "products:count:gen:0.1:category:1" in fake_redis.data
+
+
+@pytest.mark.asyncio
+async def test_generation_invalidation_global(fake_redis, sample_product):
+    """전체 세대 증가는 모든 목록/개수를 무효화"""
+    adapter = RedisCacheAdapter(fake_redis, ttl=300)
+    await adapter.set_product_list([sample_product], category_id=1, offset=0, limit=20)
+    await adapter.set_product_count(1)
+    
+    await adapter.invalidate_product_lists()
+    
+    reader = RedisCacheAdapter(fake_redis, ttl=300)
+    assert await reader.get_product_list(category_id=1, offset=0, limit=20) is None
+    assert await reader.get_product_count() is None
+
+
+@pytest.mark.asyncio
+async def test_write_uses_generation_seen_at_read(fake_redis, sample_product):
+    """조회 후 DB 조회 중에 무효화되면, 이전 값은 이전 세대 키에 저장되어 조회되지 않음"""
+    adapter = RedisCacheAdapter(fake_redis, ttl=300)
+    assert await adapter.get_product_count(category_id=1) is None
+    
+    await RedisCacheAdapter(fake_redis, ttl=300).invalidate_product_lists([1])
+    await adapter.set_product_count(1, category_id=1)  # 무효화 이전에 조회한 값
+    
+    assert await RedisCacheAdapter(fake_redis, ttl=300).get_product_count(category_id=1) is None
+
+
+@pytest.mark.asyncio
+async def test_delete_products(fake_redis, sample_product):
+    """상품 단건 삭제 시 해당 상품이 포함된 정규화 목록도 미스"""
+    adapter = RedisCacheAdapter(fake_redis, ttl=300)
+    await adapter.set_product_list([sample_product], category_id=1, offset=0, limit=20)
+    
+    await adapter.delete_products([1])
+    
+    assert await adapter.get_products([1]) == {}
+    assert await adapter.get_product_list(category_id=1, offset=0, limit=20) is None
+
+
+@pytest.mark.asyncio
+async def test_list_response_roundtrip_and_invalidation(fake_redis, sample_product):
+    """목록 응답은 저장한 바이트 그대로, 목록 세대 증가와 포함된 상품 삭제로 무효화"""
+    adapter = RedisCacheAdapter(fake_redis, ttl=300, response_ttl=60)
+    payload = b'{"products":[]}' * 100
+    
+    await adapter.set_list_response(payload, [1], category_id=1, offset=0, limit=20)
+    assert await adapter.get_list_response(category_id=1, offset=0, limit=20) == payload
+    assert fake_redis.ttls["products:response-tags:1"] == 60
+    
+    await adapter.delete_products([1])
+    assert await adapter.get_list_response(category_id=1, offset=0, limit=20) is None
+    assert "products:response-tags:1" not in fake_redis.sets
+    
+    await adapter.set_list_response(payload, [1], category_id=1, offset=0, limit=20)
+    await adapter.invalidate_product_lists([1])
+    assert await adapter.get_list_response(category_id=1, offset=0, limit=20) is None
+
+
+@pytest.mark.asyncio
+async def test_list_response_disabled(fake_redis):
+    """response_ttl이 0이면 응답 캐시를 사용하지 않음"""
+    adapter = RedisCacheAdapter(fake_redis, response_ttl=0)
+    
+    await adapter.set_list_response(b"{}", [1])
+    
+    assert await adapter.get_list_response() is None
+    assert fake_redis.data == {}
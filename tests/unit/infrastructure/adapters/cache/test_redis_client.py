@@ -0,0 +1,94 @@
+"""Redis 연결 관리자 테스트"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+from app.infrastructure.adapters.cache.redis_client import RedisConnectionManager
+from app.infrastructure.monitoring.metrics import MetricsRegistry
+
+
+def make_manager(**kwargs) -> RedisConnectionManager:
+    # 연결은 PING 시점에만 시도하므로 테스트에서는 ping을 대체
+    return RedisConnectionManager(
+        "redis://localhost:6379/0",
+        health_check_interval=0.01,
+        backoff_base=0.01,
+        backoff_max=0.02,
+        metrics=MetricsRegistry(),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_client_is_flag_check_without_ping():
+    """시작 후 get_client는 PING 없이 클라이언트 반환"""
+    manager = make_manager()
+    manager.client.ping = AsyncMock(return_value=True)
+    
+    assert await manager.start() is True
+    calls = manager.client.ping.await_count
+    
+    assert all(manager.get_client() is manager.client for _ in range(100))
+    assert manager.client.ping.await_count == calls
+    
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_unavailable_returns_none_and_reconnects_in_background():
+    """연결 실패 중에는 즉시 None, 백그라운드 재연결 후 다시 클라이언트 반환"""
+    manager = make_manager()
+    manager.client.ping = AsyncMock(side_effect=ConnectionError("down"))
+    
+    assert await manager.start() is False
+    assert manager.get_client() is None
+    
+    await asyncio.sleep(0.05)
+    assert manager.metrics.counter("redis.reconnect.attempts") >= 1
+    
+    manager.client.ping = AsyncMock(return_value=True)
+    await asyncio.sleep(0.1)
+    
+    assert manager.get_client() is manager.client
+    assert manager.metrics.snapshot()["gauges"]["redis.available"] == 1
+    
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_health_probe_marks_unavailable():
+    """헬스 체크가 연결 끊김을 감지하면 get_client가 None 반환"""
+    manager = make_manager()
+    manager.client.ping = AsyncMock(return_value=True)
+    await manager.start()
+    
+    manager.client.ping = AsyncMock(side_effect=ConnectionError("down"))
+    await asyncio.sleep(0.05)
+    
+    assert manager.get_client() is None
+    
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_listener_called_when_redis_becomes_available():
+    """시작 시 연결 실패 후 재연결되면 리스너 호출 (연결된 동안 재호출 없음)"""
+    manager = make_manager()
+    manager.client.ping = AsyncMock(side_effect=ConnectionError("down"))
+    calls = []
+    manager.add_listener(calls.append)
+    
+    await manager.start()
+    assert calls == []
+    
+    manager.client.ping = AsyncMock(return_value=True)
+    await asyncio.sleep(0.1)
+    
+    assert calls == [manager.client]
+    
+    late = []
+    manager.add_listener(late.append)
+    assert late == [manager.client]
+    
+    await manager.close()
@@ -0,0 +1,245 @@
+"""TwoTierCacheAdapter 및 LocalCache 테스트"""
+
+import pytest
+from unittest.mock import AsyncMock
+from app.domain.entities.product import Product
+from app.domain.ports.cache_adapter import CacheAdapter, CacheEntry
+from app.infrastructure.adapters.cache.invalidation_bus import CacheInvalidationBus
+from app.infrastructure.adapters.cache.local_cache import LocalCache
+from app.infrastructure.adapters.cache.two_tier_adapter import TwoTierCacheAdapter
+from app.infrastructure.monitoring.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def sample_product():
+    """샘플 상품"""
+    return Product(
+        id=1,
+        name="노트북",
+        price=1000000,
+        stock=10,
+        category_id=1,
+        discount_rate=0.2,
+    )
+
+
+@pytest.fixture
+def mock_l2():
+    """Mock L2 CacheAdapter"""
+    return AsyncMock(spec=CacheAdapter)
+
+
+@pytest.fixture
+def registry():
+    """테스트 전용 메트릭 레지스트리"""
+    return MetricsRegistry()
+
+
+def test_local_cache_lru_eviction_by_entries():
+    """항목 수 상한 초과 시 LRU 항목 제거"""
+    cache = LocalCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # a를 최근 사용으로 갱신
+    cache.set("c", 3)
+    
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_local_cache_eviction_by_bytes():
+    """메모리 상한 초과 시 오래된 항목부터 제거"""
+    cache = LocalCache(max_bytes=100)
+    cache.set("a", "x", size=60)
+    cache.set("b", "y", size=60)
+    
+    assert cache.get("a") is None
+    assert cache.get("b") == "y"
+    assert cache.bytes_used == 60
+
+
+def test_local_cache_ttl_expiry():
+    """TTL 만료 항목은 조회되지 않음"""
+    cache = LocalCache()
+    cache.set("a", 1, ttl=0)
+    
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_local_cache_invalidate_prefix():
+    """접두사 무효화 및 전체 무효화"""
+    cache = LocalCache()
+    cache.set("list:category:1:offset:0", 1)
+    cache.set("list:category:12:offset:0", 2)
+    cache.set("count:all", 3)
+    
+    assert cache.invalidate([], ["list:category:1:"]) == 1
+    assert cache.get("list:category:12:offset:0") == 2
+    
+    cache.invalidate([], [""])
+    assert len(cache) == 0
+
+
+def test_local_cache_invalidate_removes_tagged_entries():
+    """키 무효화 시 그 키를 태그로 가진 항목도 함께 제거"""
+    cache = LocalCache()
+    cache.set("product:1", 1)
+    cache.set("list:a", [1, 2], tags=["product:1", "product:2"])
+    cache.set("list:b", [2], tags=["product:2"])
+    
+    assert cache.invalidate(["product:1"], []) == 2
+    assert cache.get("list:b") == [2]
+    
+    cache.delete("list:b")
+    assert cache.invalidate(["product:2"], []) == 0
+
+
+@pytest.mark.asyncio
+async def test_l1_hit_skips_l2(mock_l2, sample_product, registry):
+    """L2 히트 후 같은 요청은 L1에서 응답"""
+    entry = CacheEntry(value=[sample_product], stored_at=0.0, fresh_until=float("inf"), expires_at=float("inf"))
+    mock_l2.get_product_list = AsyncMock(return_value=entry)
+    adapter = TwoTierCacheAdapter(l1=LocalCache(), l2=mock_l2, metrics=registry)
+    
+    first = await adapter.get_product_list(category_id=1, offset=0, limit=20)
+    second = await adapter.get_product_list(category_id=1, offset=0, limit=20)
+    
+    assert first is second is entry
+    mock_l2.get_product_list.assert_called_once_with(category_id=1, offset=0, limit=20, after_id=None)
+    assert registry.counter("cache.l1.hits") == 1
+    assert registry.counter("cache.l2.hits") == 1
+    assert registry.hit_rate("cache.l1") == 0.5
+
+
+@pytest.mark.asyncio
+async def test_l2_miss_is_not_stored(mock_l2, registry):
+    """L2 미스는 L1에 저장하지 않음"""
+    mock_l2.get_product_count = AsyncMock(return_value=None)
+    adapter = TwoTierCacheAdapter(l1=LocalCache(), l2=mock_l2, metrics=registry)
+    
+    assert await adapter.get_product_count(category_id=1) is None
+    assert await adapter.get_product_count(category_id=1) is None
+    assert mock_l2.get_product_count.await_count == 2
+    assert registry.counter("cache.l2.misses") == 2
+
+
+@pytest.mark.asyncio
+async def test_set_fills_l1_without_publishing(mock_l2, registry):
+    """캐시 미스 채우기는 L2 기록 후 자신의 L1만 채우고 무효화 메시지는 발행하지 않음"""
+    bus = AsyncMock(spec=CacheInvalidationBus)
+    l1 = LocalCache()
+    adapter = TwoTierCacheAdapter(l1=l1, l2=mock_l2, invalidation_bus=bus, metrics=registry)
+    
+    await adapter.set_product_count(count=42, category_id=3)
+    
+    mock_l2.set_product_count.assert_called_once_with(count=42, category_id=3, compute_time=0.0)
+    entry = await adapter.get_product_count(category_id=3)
+    assert entry.value == 42 and entry.is_fresh()
+    mock_l2.get_product_count.assert_not_awaited()
+    bus.publish.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_set_skips_l1_fill_after_invalidation(mock_l2, registry):
+    """요청 시작 이후 무효화가 있었으면 (무효화 이전 값일 수 있으므로) L1을 채우지 않음"""
+    l1 = LocalCache()
+    adapter = TwoTierCacheAdapter(l1=l1, l2=mock_l2, metrics=registry)
+    
+    l1.invalidate([], ["count:"])  # 다른 워커의 무효화 메시지 수신
+    await adapter.set_product_count(count=42, category_id=3)
+    
+    mock_l2.set_product_count.assert_awaited_once()
+    assert len(l1) == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_products_removes_only_lists_containing_product(mock_l2, sample_product, registry):
+    """상품 무효화 시 그 상품이 포함된 L1 목록만 제거 (다른 목록은 유지)"""
+    bus = AsyncMock(spec=CacheInvalidationBus)
+    other = Product(id=2, name="마우스", price=30000, stock=5, category_id=2)
+    l1 = LocalCache()
+    adapter = TwoTierCacheAdapter(l1=l1, l2=mock_l2, invalidation_bus=bus, metrics=registry)
+    await adapter.set_product_list([sample_product], category_id=1)
+    await adapter.set_product_list([other], category_id=2)
+    
+    await adapter.delete_products([1])
+    
+    assert l1.get("list:category:1:offset:0:limit:20") is None
+    assert l1.get("product:1") is None
+    assert l1.get("list:category:2:offset:0:limit:20").value == [other]
+    bus.publish.assert_awaited_once_with(keys=["product:1"], prefixes=["response:"])
+
+
+
+@pytest.mark.asyncio
+async def test_get_products_reads_only_l1_misses_from_l2(mock_l2, sample_product, registry):
+    """상품 단건 조회는 L1 미스만 L2에 일괄 요청 (부정 항목도 L1에 보관)"""
+    negative = CacheEntry(value=None, stored_at=0.0, fresh_until=float("inf"), expires_at=float("inf"))
+    mock_l2.get_products = AsyncMock(return_value={1: sample_product, 999: negative})
+    adapter = TwoTierCacheAdapter(l1=LocalCache(), l2=mock_l2, metrics=registry)
+    
+    first = await adapter.get_products([1, 999, 2])
+    mock_l2.get_products.return_value = {}
+    second = await adapter.get_products([1, 999, 2])
+    
+    assert first == second == {1: sample_product, 999: negative}
+    assert mock_l2.get_products.await_args_list[0].args == ([1, 999, 2],)
+    assert mock_l2.get_products.await_args_list[1].args == ([2],)
+    assert registry.counter("cache.l1.hits") == 2
+
+
+@pytest.mark.asyncio
+async def test_list_response_cached_in_l1_under_list_prefix(mock_l2, registry):
+    """목록 응답은 L1 목록 접두사 아래에 보관되어 목록 무효화로 함께 제거"""
+    mock_l2.get_list_response = AsyncMock(return_value=b"{}")
+    l1 = LocalCache()
+    adapter = TwoTierCacheAdapter(l1=l1, l2=mock_l2, metrics=registry)
+    
+    assert await adapter.get_list_response(category_id=1) == b"{}"
+    assert await adapter.get_list_response(category_id=1) == b"{}"
+    mock_l2.get_list_response.assert_awaited_once()
+    
+    await adapter.delete_products([1])
+    assert len(l1) == 0
+
+
+@pytest.mark.asyncio
+async def test_invalidate_product_lists_clears_l1_scopes(mock_l2, registry):
+    """카테고리 무효화 시 해당 카테고리와 전체 목록/개수 L1 항목 제거 및 접두사 발행"""
+    bus = AsyncMock(spec=CacheInvalidationBus)
+    l1 = LocalCache()
+    for key in [
+        "list:category:1:offset:0:limit:20",
+        "list:category:12:offset:0:limit:20",
+        "list:all:offset:0:limit:20",
+        "count:category:1",
+        "count:category:12",
+        "product:1",
+    ]:
+        l1.set(key, 1)
+    adapter = TwoTierCacheAdapter(l1=l1, l2=mock_l2, invalidation_bus=bus, metrics=registry)
+    
+    await adapter.invalidate_product_lists([1])
+    
+    mock_l2.invalidate_product_lists.assert_awaited_once_with([1])
+    assert l1.get("list:category:12:offset:0:limit:20") == 1
+    assert l1.get("count:category:12") == 1
+    assert l1.get("product:1") == 1
+    assert len(l1) == 3
+    bus.publish.assert_awaited_once_with(
+        keys=["count:all", "count:category:1"],
+        prefixes=["list:all:", "response:all:", "list:category:1:", "response:category:1:"],
+    )
+
+def test_invalidation_bus_ignores_own_messages():
+    """자신이 발행한 메시지는 무시하고 다른 워커 메시지만 처리"""
+    bus = CacheInvalidationBus(channel="test")
+    received = []
+    bus.add_listener(lambda keys, prefixes: received.append((keys, prefixes)))
+    
+    bus.handle_message(f'{{"origin": "{bus.instance_id}", "keys": ["a"], "prefixes": []}}')
+    bus.handle_message('{"origin": "other", "keys": ["b"], "prefixes": ["list:"]}')
+    
+    assert received == [(["b"], ["list:"])]
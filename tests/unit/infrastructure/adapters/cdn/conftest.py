@@ -0,0 +1,51 @@
+"""CDN 어댑터 테스트 공통 Fixtures"""
+
+import asyncio
+import json
+
+import pytest
+
+
+class PurgeServer:
+    """삭제 요청을 기록하는 로컬 HTTP 서버 (CDN 삭제 엔드포인트 대역)"""
+    
+    def __init__(self):
+        self.requests: list[dict] = []
+        self.status = 200
+        self._server: asyncio.base_events.Server | None = None
+        self.url = ""
+    
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/purge"
+    
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+    
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        request_line = (await reader.readline()).decode()
+        headers: dict[str, str] = {}
+        while (line := (await reader.readline()).decode().strip()):
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        body = await reader.readexactly(int(headers.get("content-length", 0)))
+        self.requests.append({
+            "method": request_line.split()[0],
+            "path": request_line.split()[1],
+            "headers": headers,
+            "body": json.loads(body) if body else None,
+        })
+        writer.write(f"HTTP/1.1 {self.status} OK\r\nContent-Length: 0\r\nConnection: close\r\n\r\n".encode())
+        await writer.drain()
+        writer.close()
+
+
+@pytest.fixture
+async def purge_server():
+    """로컬 CDN 삭제 엔드포인트"""
+    server = PurgeServer()
+    await server.start()
+    yield server
+    await server.stop()
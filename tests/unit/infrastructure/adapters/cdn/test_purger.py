@@ -0,0 +1,40 @@
+"""CDN Purger 테스트 (로컬 HTTP 서버 사용)"""
+
+import urllib.error
+
+import pytest
+from app.infrastructure.adapters.cdn.purger import HttpCdnPurger, NoopCdnPurger
+
+
+@pytest.mark.asyncio
+async def test_http_purger_sends_surrogate_keys(purge_server):
+    """Surrogate-Key 헤더와 JSON 본문으로 삭제 요청"""
+    purger = HttpCdnPurger(purge_server.url, token="secret")
+    
+    await purger.purge(["product-1", "category-all"])
+    
+    request = purge_server.requests[0]
+    assert request["method"] == "POST"
+    assert request["path"] == "/purge"
+    assert request["headers"]["surrogate-key"] == "product-1 category-all"
+    assert request["headers"]["authorization"] == "Bearer secret"
+    assert request["body"] == {"surrogate_keys": ["product-1", "category-all"]}
+
+
+@pytest.mark.asyncio
+async def test_http_purger_raises_on_error_and_skips_empty(purge_server):
+    """삭제 실패는 전파, 빈 키 목록은 요청하지 않음"""
+    purger = HttpCdnPurger(purge_server.url)
+    purge_server.status = 500
+    
+    with pytest.raises(urllib.error.HTTPError):
+        await purger.purge(["products"])
+    await purger.purge([])
+    
+    assert len(purge_server.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_noop_purger():
+    """CDN 미사용 시 아무것도 하지 않음"""
+    await NoopCdnPurger().purge(["products"])
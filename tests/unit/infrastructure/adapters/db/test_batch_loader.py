@@ -0,0 +1,104 @@
+"""Batch Loader 테스트 - 동시 단건 조회 묶음"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+from app.domain.entities.product import Product
+from app.infrastructure.adapters.db.batch_loader import BatchLoader
+from app.infrastructure.adapters.db.product_repository_impl import ProductRepositoryImpl
+from app.infrastructure.monitoring.metrics import MetricsRegistry
+
+
+class RecordingBatchFn:
+    """요청된 키 목록을 기록하고 짝수 키만 찾은 것처럼 응답"""
+    
+    def __init__(self):
+        self.batches: list[list[int]] = []
+    
+    async def __call__(self, keys: list[int]) -> dict[int, str]:
+        self.batches.append(keys)
+        return {key: f"v{key}" for key in keys if key % 2 == 0}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_share_one_query():
+    """같은 틱의 조회는 쿼리 1회로 묶이고, 결과는 각 호출로 (중복 키는 한 번만 조회)"""
+    batch_fn = RecordingBatchFn()
+    metrics = MetricsRegistry()
+    loader = BatchLoader("items", batch_fn, metrics=metrics)
+    
+    results = await asyncio.gather(loader.load(2), loader.load(3), loader.load(2), loader.load(4))
+    
+    assert results == ["v2", None, "v2", "v4"]
+    assert batch_fn.batches == [[2, 3, 4]]
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"]["db.loader.items.calls"] == 4
+    assert snapshot["counters"]["db.loader.items.queries"] == 1
+    assert snapshot["counters"]["db.loader.items.queries_saved"] == 3
+    assert snapshot["summaries"]["db.loader.items.batch_size"]["max"] == 3
+
+
+@pytest.mark.asyncio
+async def test_max_batch_flushes_immediately():
+    """최대 키 수에 도달하면 나머지는 다음 쿼리로"""
+    batch_fn = RecordingBatchFn()
+    loader = BatchLoader("items", batch_fn, max_batch=2, metrics=MetricsRegistry())
+    
+    await asyncio.gather(*(loader.load(key) for key in range(5)))
+    
+    assert batch_fn.batches == [[0, 1], [2, 3], [4]]
+
+
+@pytest.mark.asyncio
+async def test_window_collects_across_ticks():
+    """window 안에 다른 틱에서 들어온 조회도 함께 묶임"""
+    batch_fn = RecordingBatchFn()
+    loader = BatchLoader("items", batch_fn, window=0.01, metrics=MetricsRegistry())
+    
+    async def late_load(key: int) -> str | None:
+        await asyncio.sleep(0)
+        return await loader.load(key)
+    
+    results = await asyncio.gather(loader.load(2), late_load(4))
+    
+    assert results == ["v2", "v4"]
+    assert batch_fn.batches == [[2, 4]]
+
+
+@pytest.mark.asyncio
+async def test_query_error_is_delivered_to_all_callers():
+    """일괄 조회 실패는 묶인 모든 호출에 전달"""
+    async def fail(keys: list[int]) -> dict[int, str]:
+        raise ConnectionError("down")
+    
+    loader = BatchLoader("items", fail, metrics=MetricsRegistry())
+    
+    results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+    
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_repository_find_by_id_goes_through_loader():
+    """로더가 있으면 요청별 Repository의 find_by_id가 요청 세션 대신 로더로 묶여 조회"""
+    products = {1: Product(id=1, name="노트북", price=1000000, stock=10, category_id=1)}
+    batches = []
+    
+    async def load_products(product_ids: list[int]) -> dict[int, Product]:
+        batches.append(product_ids)
+        return {product_id: products[product_id] for product_id in product_ids if product_id in products}
+    
+    loader = BatchLoader("products", load_products, metrics=MetricsRegistry())
+    sessions = [AsyncMock(), AsyncMock()]
+    
+    found, missing = await asyncio.gather(
+        ProductRepositoryImpl(sessions[0], loader=loader).find_by_id(1),
+        ProductRepositoryImpl(sessions[1], loader=loader).find_by_id(2),
+    )
+    
+    assert found is products[1]
+    assert missing is None
+    assert batches == [[1, 2]]
+    for session in sessions:
+        session.execute.assert_not_called()
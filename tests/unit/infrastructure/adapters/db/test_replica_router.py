@@ -0,0 +1,158 @@
+"""Replica Router 테스트 - 읽기 세션 복제본 라우팅"""
+
+import asyncio
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from app.infrastructure.adapters.db.replica_router import Replica, ReplicaRouter
+from app.infrastructure.monitoring.metrics import MetricsRegistry
+
+
+class FakeSession:
+    """세션 대신 사용 - 어느 DB의 세션인지만 기록 (connect_error가 있으면 조회 시 발생)"""
+    
+    def __init__(self, name: str, connect_error: Exception | None = None):
+        self.name = name
+        self.connect_error = connect_error
+    
+    async def __aenter__(self) -> "FakeSession":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+    
+    async def query(self) -> str:
+        if self.connect_error is not None:
+            raise self.connect_error
+        return self.name
+
+
+def make_replica(name: str, lag: float | None = 0.0) -> Replica:
+    async def probe() -> float | None:
+        if isinstance(replica.test_lag, Exception):
+            raise replica.test_lag
+        return replica.test_lag
+    
+    replica = Replica(name, lambda: FakeSession(name, replica.test_connect_error), probe)
+    replica.test_lag = lag
+    replica.test_connect_error = None
+    return replica
+
+
+def make_router(*replicas: Replica, metrics: MetricsRegistry | None = None) -> ReplicaRouter:
+    return ReplicaRouter(lambda: FakeSession("primary"), list(replicas), max_lag=2.0, metrics=metrics or MetricsRegistry())
+
+
+async def session_name(router: ReplicaRouter) -> str:
+    async with router.read_session() as session:
+        return session.name
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_primary_until_replica_is_checked():
+    """첫 헬스 체크 전, 또는 복제본이 없으면 primary"""
+    replica = make_replica("replica0")
+    router = make_router(replica)
+    
+    assert await session_name(router) == "primary"
+    assert await session_name(make_router()) == "primary"
+    
+    await router.check_all()
+    assert await session_name(router) == "replica0"
+
+
+@pytest.mark.asyncio
+async def test_excludes_lagging_and_unreachable_replicas():
+    """복제 지연이 기준을 넘거나, 복제가 멈췄거나, 연결에 실패한 복제본은 제외"""
+    metrics = MetricsRegistry()
+    lagging = make_replica("lagging", lag=5.0)
+    stopped = make_replica("stopped", lag=None)
+    down = make_replica("down", lag=ConnectionError("refused"))
+    router = make_router(lagging, stopped, down, metrics=metrics)
+    
+    await router.check_all()
+    
+    assert await session_name(router) == "primary"
+    assert metrics.counter("db.replica.fallbacks") == 1
+    
+    # 복제가 따라잡으면 다음 헬스 체크에서 다시 포함
+    lagging.test_lag = 0.5
+    await router.check_all()
+    assert await session_name(router) == "lagging"
+
+
+@pytest.mark.asyncio
+async def test_balances_by_in_flight_sessions():
+    """사용 중인 세션이 적은 복제본을 고르고, 같으면 번갈아 선택"""
+    router = make_router(make_replica("replica0"), make_replica("replica1"))
+    await router.check_all()
+    
+    assert {await session_name(router), await session_name(router)} == {"replica0", "replica1"}
+    
+    async with router.read_session() as held:
+        # 세션 1개를 잡고 있는 동안에는 다른 복제본만 선택
+        assert {await session_name(router) for _ in range(3)} == {"replica0", "replica1"} - {held.name}
+
+
+@pytest.mark.asyncio
+async def test_connection_error_marks_replica_down():
+    """조회 중 연결 오류가 난 복제본은 다음 헬스 체크까지 제외"""
+    replica = make_replica("replica0")
+    router = make_router(replica)
+    await router.check_all()
+    
+    with pytest.raises(OperationalError):
+        async with router.read_session():
+            raise OperationalError("SELECT 1", {}, Exception("Lost connection"))
+    
+    assert replica.in_flight == 0
+    assert await session_name(router) == "primary"
+
+
+@pytest.mark.asyncio
+async def test_read_session_is_lazy_and_marks_replica_down_on_first_use():
+    """세션은 조회 전에 연결하지 않고, 처음 조회할 때의 연결 오류로 복제본을 제외"""
+    replica = make_replica("replica0")
+    router = make_router(replica)
+    await router.check_all()
+    replica.test_connect_error = OperationalError("SELECT 1", {}, Exception("Can't connect"))
+    
+    # 조회하지 않는 세션 (캐시 히트 등)은 오류 없이 복제본 세션을 받음
+    assert await session_name(router) == "replica0"
+    assert replica.healthy
+    
+    with pytest.raises(OperationalError):
+        async with router.read_session() as session:
+            await session.query()
+    assert not replica.healthy
+    assert await session_name(router) == "primary"
+
+
+@pytest.mark.asyncio
+async def test_read_retries_on_primary_after_replica_connect_failure():
+    """read()는 복제본 연결에 실패하면 복제본을 제외하고 같은 조회를 primary에서 다시 실행"""
+    metrics = MetricsRegistry()
+    replica = make_replica("replica0")
+    router = make_router(replica, metrics=metrics)
+    await router.check_all()
+    replica.test_connect_error = OperationalError("SELECT 1", {}, Exception("Can't connect"))
+    
+    assert await router.read(lambda session: session.query()) == "primary"
+    assert not replica.healthy
+    assert replica.in_flight == 0
+    assert metrics.counter("db.replica.fallbacks") == 1
+    assert metrics.counter("db.replica.replica0.errors") == 1
+
+
+@pytest.mark.asyncio
+async def test_start_runs_periodic_checks():
+    """start는 첫 헬스 체크 후 주기적으로 다시 확인"""
+    replica = make_replica("replica0", lag=ConnectionError("refused"))
+    router = ReplicaRouter(lambda: FakeSession("primary"), [replica], check_interval=0.01, metrics=MetricsRegistry())
+    
+    assert await router.start() == 0
+    replica.test_lag = 0.0
+    await asyncio.sleep(0.05)
+    
+    assert replica.healthy
+    await router.close()
@@ -0,0 +1,30 @@
+"""인기 키 집계기 테스트"""
+
+from app.infrastructure.monitoring.hot_keys import HotKeyTracker
+
+
+def test_record_and_drain_returns_counts_and_resets():
+    """집계 결과는 많이 요청된 순으로 반환되고 초기화됨"""
+    tracker = HotKeyTracker(max_keys=10)
+    for key in ["detail:1", "detail:2", "detail:1", "count:all", "detail:1"]:
+        tracker.record(key)
+    
+    counts = tracker.drain()
+    
+    assert list(counts.items())[0] == ("detail:1", 3)
+    assert counts == {"detail:1": 3, "detail:2": 1, "count:all": 1}
+    assert tracker.drain() == {}
+
+
+def test_record_keeps_memory_bounded():
+    """집계 키 수가 상한의 2배를 넘으면 상위 키만 유지"""
+    tracker = HotKeyTracker(max_keys=5)
+    for _ in range(3):
+        tracker.record("detail:hot")
+    for product_id in range(100):
+        tracker.record(f"detail:{product_id}")
+    
+    counts = tracker.drain()
+    
+    assert len(counts) <= 5
+    assert counts["detail:hot"] == 3